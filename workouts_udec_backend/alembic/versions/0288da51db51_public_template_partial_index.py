@@ -0,0 +1,32 @@
+"""Public template partial index
+
+Revision ID: 0288da51db51
+Revises: 5f2c1911cc7a
+Create Date: 2026-10-18 10:12:41.503218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0288da51db51"
+down_revision: Union[str, None] = "5f2c1911cc7a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_workout_templates_public",
+        "workout_templates",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("is_public"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_workout_templates_public", table_name="workout_templates")
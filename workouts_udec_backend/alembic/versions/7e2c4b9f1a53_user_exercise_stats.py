@@ -0,0 +1,80 @@
+"""User exercise stats
+
+Revision ID: 7e2c4b9f1a53
+Revises: d3b8e5a17c42
+Create Date: 2026-10-18 15:07:32.551890
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7e2c4b9f1a53"
+down_revision: Union[str, None] = "d3b8e5a17c42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_exercise_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("exercise_id", sa.Integer(), nullable=False),
+        sa.Column("best_weight", sa.Float(), nullable=True),
+        sa.Column("best_reps", sa.Integer(), nullable=True),
+        sa.Column("best_estimated_1rm", sa.Float(), nullable=True),
+        sa.Column("total_volume", sa.Float(), nullable=False),
+        sa.Column("session_count", sa.Integer(), nullable=False),
+        sa.Column("last_performed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["exercise_id"],
+            ["exercises.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "exercise_id"),
+    )
+
+    # Carga inicial desde las series existentes (igual que rebuild_exercise_stats.py)
+    op.execute(
+        """
+        INSERT INTO user_exercise_stats (
+            user_id, exercise_id, best_weight, best_reps, best_estimated_1rm,
+            total_volume, session_count, last_performed_at
+        )
+        SELECT
+            workouts.user_id,
+            workout_exercises.exercise_id,
+            MAX(exercise_sets.weight),
+            MAX(exercise_sets.reps),
+            MAX(CASE
+                WHEN exercise_sets.reps = 1 THEN exercise_sets.weight
+                WHEN exercise_sets.reps > 1
+                    THEN exercise_sets.weight * (1 + exercise_sets.reps / 30.0)
+            END),
+            COALESCE(SUM(exercise_sets.reps * exercise_sets.weight), 0),
+            COUNT(DISTINCT workouts.id),
+            MAX(workouts.started_at)
+        FROM workouts
+        JOIN workout_exercises ON workout_exercises.workout_id = workouts.id
+        JOIN exercise_sets ON exercise_sets.workout_exercise_id = workout_exercises.id
+        WHERE workouts.completed_at IS NOT NULL
+          AND exercise_sets.completed IS true
+        GROUP BY workouts.user_id, workout_exercises.exercise_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_exercise_stats")
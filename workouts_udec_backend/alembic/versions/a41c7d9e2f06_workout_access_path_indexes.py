@@ -0,0 +1,138 @@
+"""Workout access path indexes
+
+Revision ID: a41c7d9e2f06
+Revises: 0288da51db51
+Create Date: 2026-10-18 11:02:17.884903
+
+"""
+from typing import Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a41c7d9e2f06"
+down_revision: Union[str, None] = "0288da51db51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # get_active_by_user: como máximo un workout activo por usuario. Los
+    # duplicados previos (solo posibles al crear desde plantilla) no se cierran
+    # automáticamente: completarlos sumaría a las estadísticas sesiones que el
+    # usuario nunca terminó. La migración se detiene y los enumera para
+    # resolverlos a mano (completar o borrar los que sobren). Se comprueba
+    # antes de crear ningún índice para no dejar la migración a medias.
+    conflicts = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT user_id, id FROM workouts
+                WHERE completed_at IS NULL
+                  AND user_id IN (
+                    SELECT user_id FROM workouts
+                    WHERE completed_at IS NULL
+                    GROUP BY user_id
+                    HAVING COUNT(*) > 1
+                  )
+                ORDER BY user_id, id
+                """
+            )
+        )
+        .all()
+    )
+    if conflicts:
+        active_by_user: Dict[int, List[int]] = {}
+        for user_id, workout_id in conflicts:
+            active_by_user.setdefault(user_id, []).append(workout_id)
+        listing = "; ".join(
+            f"user {user_id}: workouts {', '.join(map(str, workout_ids))}"
+            for user_id, workout_ids in active_by_user.items()
+        )
+        raise RuntimeError(
+            "Cannot create uq_workouts_user_id_active: some users have more than "
+            "one active workout. Complete or delete the extra workouts and run "
+            f"the migration again ({listing})."
+        )
+
+    # Claves foráneas usadas en cargas de relaciones y borrados en cascada
+    op.create_index(
+        op.f("ix_workout_templates_created_by"),
+        "workout_templates",
+        ["created_by"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_workout_template_exercises_template_id"),
+        "workout_template_exercises",
+        ["template_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_workout_exercises_workout_id"),
+        "workout_exercises",
+        ["workout_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_exercise_sets_workout_exercise_id"),
+        "exercise_sets",
+        ["workout_exercise_id"],
+        unique=False,
+    )
+
+    # get_by_user / get_completed_by_user / get_exercise_progression
+    op.create_index(
+        "ix_workouts_user_id_started_at",
+        "workouts",
+        ["user_id", "started_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_workouts_user_id_completed_at",
+        "workouts",
+        ["user_id", "completed_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_workout_exercises_exercise_id_workout_id",
+        "workout_exercises",
+        ["exercise_id", "workout_id"],
+        unique=False,
+    )
+
+    # get_active_by_user: como máximo un workout activo por usuario; los
+    # duplicados se comprobaron al empezar.
+    op.create_index(
+        "uq_workouts_user_id_active",
+        "workouts",
+        ["user_id"],
+        unique=True,
+        postgresql_where=sa.text("completed_at IS NULL"),
+        sqlite_where=sa.text("completed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_workouts_user_id_active", table_name="workouts")
+    op.drop_index(
+        "ix_workout_exercises_exercise_id_workout_id", table_name="workout_exercises"
+    )
+    op.drop_index("ix_workouts_user_id_completed_at", table_name="workouts")
+    op.drop_index("ix_workouts_user_id_started_at", table_name="workouts")
+    op.drop_index(
+        op.f("ix_exercise_sets_workout_exercise_id"), table_name="exercise_sets"
+    )
+    op.drop_index(
+        op.f("ix_workout_exercises_workout_id"), table_name="workout_exercises"
+    )
+    op.drop_index(
+        op.f("ix_workout_template_exercises_template_id"),
+        table_name="workout_template_exercises",
+    )
+    op.drop_index(
+        op.f("ix_workout_templates_created_by"), table_name="workout_templates"
+    )
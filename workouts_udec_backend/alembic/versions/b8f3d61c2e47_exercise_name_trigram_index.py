@@ -0,0 +1,33 @@
+"""Exercise name trigram index
+
+Revision ID: b8f3d61c2e47
+Revises: 7e2c4b9f1a53
+Create Date: 2026-10-18 16:21:09.734502
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8f3d61c2e47"
+down_revision: Union[str, None] = "7e2c4b9f1a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_exercises_name_trgm",
+        "exercises",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_exercises_name_trgm", table_name="exercises")
@@ -0,0 +1,52 @@
+"""Sync operations
+
+Revision ID: d3b8e5a17c42
+Revises: a41c7d9e2f06
+Create Date: 2026-10-18 13:24:51.406117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3b8e5a17c42"
+down_revision: Union[str, None] = "a41c7d9e2f06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_operations",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("idempotency_key", sa.String(length=64), nullable=False),
+        sa.Column("operation", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=True),
+        sa.Column("workout_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "user_id", "idempotency_key", name="uq_sync_operations_user_id_key"
+        ),
+    )
+    op.create_index(
+        op.f("ix_sync_operations_id"), "sync_operations", ["id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_sync_operations_id"), table_name="sync_operations")
+    op.drop_table("sync_operations")
@@ -2,25 +2,40 @@
 Módulo que define las dependencias comunes utilizadas en la API de FastAPI.
 
 Este archivo incluye funciones para:
-- Gestionar sesiones de base de datos (`get_db`).
-- Validar y obtener el usuario autenticado (`get_current_user`).
+- Gestionar sesiones de base de datos (`get_db`) y de solo lectura en
+  réplicas (`get_read_db`).
+- Validar y obtener el usuario autenticado (`get_current_user`), con los
+  claims del token y el usuario resueltos desde caché para no verificar la
+  firma ni consultar la base en cada solicitud.
 - Verificar si el usuario está activo (`get_current_active_user`).
 - Verificar si el usuario es administrador (`get_current_active_admin`).
+- Verificar la propiedad de un workout sin cargar sus relaciones
+  (`get_owned_workout` y `get_open_owned_workout`).
+- Variantes asíncronas de las anteriores (`get_async_db`,
+  `get_current_active_user_async`, `get_owned_workout_async`) para los
+  endpoints `async def` que se activan con `ASYNC_ENDPOINTS`.
 Estas dependencias son inyectadas en los endpoints mediante `Depends()`.
 """
 
-from typing import Generator
+from typing import Any, AsyncGenerator, Generator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from jose import jwt
 from pydantic import ValidationError
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core import security
-from app.core.config import settings
-from app.db.session import SessionLocal
+from app.db.session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_read_router,
+    read_router,
+)
 from app.models.user import User
 from app.crud.crud_user import user  # pylint: disable=E0611
+from app.crud.crud_workout import workout
 
 security_scheme = HTTPBearer()
 
@@ -39,24 +54,59 @@ def get_db() -> Generator:
         db.close()
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(security_scheme)
-) -> User:
+def get_read_db() -> Generator:
     """
-    Obtiene el usuario actual a partir del token JWT.
+    Proporciona una sesión de solo lectura en una réplica, si hay alguna sana.
+
+    Solo para endpoints GET que toleran un pequeño retraso respecto a la
+    primaria; lo que se acaba de escribir puede no verse todavía.
     """
     try:
-        payload = jwt.decode(
-            token.credentials, settings.SECRET_KEY, algorithms=[security.ALGORITHM]
-        )
-        user_id: int = payload.get("sub")
-    except (jwt.JWTError, ValidationError) as exc:
+        db = read_router.session()
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Crea y proporciona una sesión asíncrona de base de datos para una solicitud.
+
+    Solo está disponible con `ASYNC_ENDPOINTS` activado.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Como `get_read_db`, con una sesión asíncrona."""
+    async with await async_read_router.session() as db:
+        yield db
+
+
+def _token_user_id(token: Any) -> int:
+    """Valida el token JWT y devuelve el ID de usuario de su `sub`."""
+    try:
+        payload = security.decode_access_token(token.credentials)
+        return int(payload.get("sub"))
+    except (jwt.JWTError, ValidationError, TypeError, ValueError) as exc:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         ) from exc
 
-    user_obj = user.get(db, id=user_id)
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(security_scheme)
+) -> User:
+    """
+    Obtiene el usuario actual a partir del token JWT.
+
+    El usuario devuelto proviene de la caché de principales y no está asociado
+    a la sesión; los endpoints que lo modifican deben recargarlo con `user.get`.
+    """
+    user_id = _token_user_id(token)
+    user_obj = user.get_principal(db, id=user_id)
     if not user_obj:
         raise HTTPException(status_code=404, detail="User not found")
     return user_obj
@@ -84,3 +134,62 @@ def get_current_active_admin(
             status_code=400, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+
+def get_owned_workout(
+    workout_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Row:
+    """
+    Verifica que el workout exista y pertenezca al usuario autenticado.
+
+    Solo consulta (id, user_id, completed_at), por lo que sirve a los endpoints
+    que modifican el workout sin necesitar sus ejercicios ni sus series.
+    """
+    workout_state = workout.get_owner_state(db, id=workout_id)
+    if not workout_state:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    if workout_state.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return workout_state
+
+
+def get_open_owned_workout(
+    workout_state: Row = Depends(get_owned_workout),
+) -> Row:
+    """
+    Verifica además que el workout no haya sido completado.
+    """
+    if workout_state.completed_at:
+        raise HTTPException(status_code=400, detail="Cannot modify completed workout")
+    return workout_state
+
+
+async def get_current_active_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(security_scheme)
+) -> User:
+    """Como `get_current_active_user`, para endpoints asíncronos."""
+    user_id = _token_user_id(token)
+    user_obj = await db.run_sync(
+        lambda session: user.get_principal(session, id=user_id)
+    )
+    if not user_obj:
+        raise HTTPException(status_code=404, detail="User not found")
+    if not user_obj.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user_obj
+
+
+async def get_owned_workout_async(
+    workout_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async),
+) -> Row:
+    """Como `get_owned_workout`, para endpoints asíncronos."""
+    workout_state = await workout.get_owner_state_async(db, id=workout_id)
+    if not workout_state:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    if workout_state.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return workout_state
@@ -6,11 +6,15 @@ usuarios, así como gestionar plantillas de entrenamiento y ejercicios
 asociados.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.api import dependencies
+from app.api.pagination import paginated
+from app.core.security import password_hasher
+from app.db.session import pool_metrics
+from app.crud.crud_exercise_stats import exercise_stats
 from app.crud.crud_user import user
 from app.crud.crud_workout import workout_template
 from app.models.user import User
@@ -30,13 +34,17 @@ router = APIRouter()
 
 @router.get("/users", response_model=List[UserSchema])
 def read_users(
-    db: Session = Depends(dependencies.get_db),
+    response: Response,
+    db: Session = Depends(dependencies.get_read_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(dependencies.get_current_active_admin),
 ) -> List[UserSchema]:
-    """Devuelve la lista de usuarios registrados."""
-    return user.get_multi(db, skip=skip, limit=limit)
+    """Devuelve la lista de usuarios registrados, paginada por cursor."""
+    return paginated(
+        response, lambda: user.get_page(db, cursor=cursor, skip=skip, limit=limit)
+    )
 
 
 @router.post("/users", response_model=UserSchema)
@@ -93,7 +101,7 @@ def delete_user(
 
 @router.get("/workout-templates", response_model=List[WorkoutTemplateSchema])
 def read_workout_templates(
-    db: Session = Depends(dependencies.get_db),
+    db: Session = Depends(dependencies.get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(dependencies.get_current_active_admin),
@@ -105,7 +113,7 @@ def read_workout_templates(
 @router.get("/workout-templates/{template_id}", response_model=WorkoutTemplateSchema)
 def read_workout_template(
     *,
-    db: Session = Depends(dependencies.get_db),
+    db: Session = Depends(dependencies.get_read_db),
     template_id: int,
     current_user: User = Depends(dependencies.get_current_active_admin),
 ) -> WorkoutTemplateSchema:
@@ -199,3 +207,31 @@ def remove_exercise_from_template(
         raise HTTPException(status_code=404, detail="Template exercise not found")
 
     return {"message": "Exercise removed from template successfully"}
+
+
+@router.post("/exercise-stats/rebuild")
+def rebuild_exercise_stats(
+    *,
+    db: Session = Depends(dependencies.get_db),
+    current_user: User = Depends(dependencies.get_current_active_admin),
+) -> dict[str, int]:
+    """Regenera desde cero las estadísticas por usuario y ejercicio."""
+    rows = exercise_stats.rebuild(db)
+    db.commit()
+    return {"rows": rows}
+
+
+@router.get("/password-hashing")
+def read_password_hashing_stats(
+    current_user: User = Depends(dependencies.get_current_active_admin),
+) -> dict[str, int]:
+    """Estado del pool de hashing de contraseñas (hilos, cola y rechazos)."""
+    return password_hasher.stats()
+
+
+@router.get("/db-pool")
+def read_db_pool_stats(
+    current_user: User = Depends(dependencies.get_current_active_admin),
+) -> List[dict]:
+    """Estado de cada pool de conexiones (en uso, desborde, esperas y edad)."""
+    return [metrics.stats() for metrics in pool_metrics.values()]
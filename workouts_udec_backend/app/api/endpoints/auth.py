@@ -1,24 +1,44 @@
+import logging
 from datetime import timedelta
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.api import dependencies
 from app.core import security
 from app.core.config import settings
+from app.core.hashing import PasswordHashingBusy
 from app.crud.crud_user import user
+from app.db.session import SessionLocal
 from app.schemas.user import Token
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+def rehash_password(user_id: int, password: str, current_hash: str) -> None:
+    """Tarea en segundo plano: actualiza un hash con parámetros obsoletos."""
+    db = SessionLocal()
+    try:
+        user.rehash_password(
+            db, user_id=user_id, password=password, current_hash=current_hash
+        )
+    except PasswordHashingBusy:
+        # Se reintentará en el próximo inicio de sesión.
+        logger.info("Skipped password rehash for user %s: hashing busy", user_id)
+    finally:
+        db.close()
+
+
 @router.post("/login", response_model=Token)
-def login_access_token(
+async def login_access_token(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(dependencies.get_db),
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Token:
-    user_obj = user.authenticate(
+    user_obj = await user.authenticate_async(
         db, email=form_data.username, password=form_data.password
     )
     if not user_obj:
@@ -30,6 +50,10 @@ def login_access_token(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
+    if security.password_needs_rehash(user_obj.hashed_password):
+        background_tasks.add_task(
+            rehash_password, user_obj.id, form_data.password, user_obj.hashed_password
+        )
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
         "access_token": security.create_access_token(
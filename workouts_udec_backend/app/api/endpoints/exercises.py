@@ -5,16 +5,20 @@ Permite a los usuarios activos consultar ejercicios, y a los administradores
 crear, actualizar o eliminar ejercicios.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.api import dependencies
-from app.crud.crud_exercise import exercise
+from app.api.etag import json_with_etag
+from app.api.pagination import paginated
+from app.crud.crud_exercise import catalog, exercise
+from app.models.exercise import ExerciseType
 from app.models.user import User
 from app.schemas.exercise import (
     Exercise as ExerciseSchema,
     ExerciseCreate,
+    ExerciseSearchResult,
     ExerciseUpdate,
 )
 
@@ -23,19 +27,85 @@ router = APIRouter()
 
 @router.get("/", response_model=List[ExerciseSchema])
 def read_exercises(
-    db: Session = Depends(dependencies.get_db),
+    response: Response,
+    db: Session = Depends(dependencies.get_read_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> List[ExerciseSchema]:
-    """Devuelve la lista de ejercicios activos."""
-    return exercise.get_active(db, skip=skip, limit=limit)
+    """Devuelve la lista de ejercicios activos, paginada por cursor."""
+    return paginated(
+        response,
+        lambda: exercise.get_active(db, cursor=cursor, skip=skip, limit=limit),
+    )
+
+
+@router.get("/catalog", response_model=List[ExerciseSchema])
+def read_exercise_catalog(
+    request: Request,
+    db: Session = Depends(dependencies.get_db),
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> Response:
+    """
+    Devuelve el catálogo completo de ejercicios activos desde memoria.
+
+    La respuesta lleva un ETag fuerte; con `If-None-Match` se responde 304.
+    """
+    snapshot = catalog.get(db)
+    return json_with_etag(request, snapshot.body, snapshot.etag)
+
+
+@router.get("/autocomplete", response_model=List[ExerciseSchema])
+def autocomplete_exercises(
+    q: str = "",
+    limit: int = 10,
+    db: Session = Depends(dependencies.get_db),
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> List[ExerciseSchema]:
+    """
+    Sugerencias de ejercicios activos cuyo nombre empieza por `q`.
+
+    Ignora tildes y mayúsculas y se resuelve con el índice en memoria del
+    catálogo, sin consultar la base de datos mientras este siga vigente.
+    """
+    return catalog.prefix_index(db).search(q, limit=limit)
+
+
+@router.get("/search", response_model=ExerciseSearchResult)
+def search_exercises(
+    db: Session = Depends(dependencies.get_read_db),
+    q: Optional[str] = None,
+    muscle_group: Optional[str] = None,
+    equipment: Optional[str] = None,
+    exercise_type: Optional[ExerciseType] = None,
+    skip: int = 0,
+    limit: int = 20,
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> ExerciseSearchResult:
+    """
+    Busca ejercicios activos por nombre (prefijo y similitud), descripción e
+    instrucciones, con filtros.
+
+    Devuelve la página pedida ordenada por relevancia, el total de
+    coincidencias y los conteos por grupo muscular, equipamiento y tipo.
+    """
+    items, total, facets = exercise.search(
+        db,
+        q=q,
+        muscle_group=muscle_group,
+        equipment=equipment,
+        exercise_type=exercise_type,
+        skip=skip,
+        limit=limit,
+    )
+    return {"items": items, "total": total, "facets": facets}
 
 
 @router.get("/{exercise_id}", response_model=ExerciseSchema)
 def read_exercise(
     *,
-    db: Session = Depends(dependencies.get_db),
+    db: Session = Depends(dependencies.get_read_db),
     exercise_id: int,
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> ExerciseSchema:
@@ -25,7 +25,8 @@ def update_user_me(
     user_in: UserUpdate,
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> UserSchema:
-    user_obj = user.update(db, db_obj=current_user, obj_in=user_in)
+    user_obj = user.get(db, id=current_user.id)
+    user_obj = user.update(db, db_obj=user_obj, obj_in=user_in)
     return user_obj
 
 
@@ -1,21 +1,35 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Any, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
 
 from app.api import dependencies
+from app.api.pagination import paginated
+from app.core.config import settings
+from app.crud.crud_exercise import exercise
+from app.crud.crud_exercise_stats import exercise_stats
+from app.crud.crud_sync import sync_operation
 from app.crud.crud_workout import workout, workout_template
 from app.models.user import User
+from app.schemas.exercise_stats import ExerciseStats
+from app.schemas.sync import SyncRequest, SyncResult
 from app.schemas.workout import (
     Workout as WorkoutSchema,
     WorkoutCreate,
     WorkoutUpdate,
+    WorkoutHistory,
     WorkoutTemplate as WorkoutTemplateSchema,
     WorkoutExercise as WorkoutExerciseSchema,
     WorkoutExerciseCreate,
     ExerciseSet as ExerciseSetSchema,
     ExerciseSetCreate,
     ExerciseSetUpdate,
+    ExerciseSetBatch,
+    ExerciseSetBatchResult,
+    ExerciseProgression,
+    WorkoutSummary,
 )
 
 router = APIRouter()
@@ -23,27 +37,18 @@ router = APIRouter()
 
 @router.get("/templates", response_model=List[WorkoutTemplateSchema])
 def read_workout_templates(
-    db: Session = Depends(dependencies.get_db),
+    db: Session = Depends(dependencies.get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> List[WorkoutTemplateSchema]:
-    # Get all templates with exercises and filter for public ones
-    all_templates = workout_template.get_multi_with_exercises(
-        db, skip=0, limit=1000
-    )  # Get more to allow proper filtering
-    public_templates = [t for t in all_templates if t.is_public]
-
-    # Apply pagination to filtered results
-    start_idx = skip
-    end_idx = skip + limit
-    return public_templates[start_idx:end_idx]
+    return workout_template.get_public_with_exercises(db, skip=skip, limit=limit)
 
 
 @router.get("/templates/{template_id}", response_model=WorkoutTemplateSchema)
 def read_workout_template(
     *,
-    db: Session = Depends(dependencies.get_db),
+    db: Session = Depends(dependencies.get_read_db),
     template_id: int,
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> WorkoutTemplateSchema:
@@ -68,6 +73,11 @@ def create_workout_from_template(
         raise HTTPException(status_code=404, detail="Template not found")
     if not template.is_public and template.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
+    if workout.has_active_by_user(db, user_id=current_user.id):
+        raise HTTPException(
+            status_code=400,
+            detail="You already have an active workout. Complete it before starting a new one.",
+        )
 
     # Create workout with template data
     workout_data = {
@@ -82,14 +92,30 @@ def create_workout_from_template(
     )
 
 
-@router.get("/", response_model=List[WorkoutSchema])
+@router.get("/", response_model=Union[List[WorkoutSchema], List[WorkoutHistory]])
 def read_workouts(
-    db: Session = Depends(dependencies.get_db),
+    response: Response,
+    db: Session = Depends(dependencies.get_read_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
+    summary: bool = False,
     current_user: User = Depends(dependencies.get_current_active_user),
-) -> List[WorkoutSchema]:
-    workouts = workout.get_by_user(db, user_id=current_user.id, skip=skip, limit=limit)
+) -> Union[List[WorkoutSchema], List[WorkoutHistory]]:
+    # summary=true devuelve solo los datos del workout, sin ejercicios ni series
+    workouts = paginated(
+        response,
+        lambda: workout.get_by_user(
+            db,
+            user_id=current_user.id,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            load_graph=not summary,
+        ),
+    )
+    if summary:
+        return [WorkoutHistory.model_validate(w) for w in workouts]
     return workouts
 
 
@@ -112,8 +138,7 @@ def create_workout(
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> WorkoutSchema:
     # Check if user has an active workout
-    active_workout = workout.get_active_by_user(db, user_id=current_user.id)
-    if active_workout:
+    if workout.has_active_by_user(db, user_id=current_user.id):
         raise HTTPException(
             status_code=400,
             detail="You already have an active workout. Complete it before starting a new one.",
@@ -125,6 +150,31 @@ def create_workout(
     return workout_obj
 
 
+@router.post("/sync", response_model=SyncResult)
+def sync_workouts(
+    *,
+    db: Session = Depends(dependencies.get_db),
+    sync_in: SyncRequest,
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> SyncResult:
+    # Aplica el registro de operaciones offline; los reintentos son idempotentes
+    if len(sync_in.operations) > settings.SYNC_MAX_OPERATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many operations (max {settings.SYNC_MAX_OPERATIONS})",
+        )
+    try:
+        return sync_operation.apply(
+            db, user_id=current_user.id, operations=sync_in.operations
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=409, detail="Conflicting sync in progress, retry the request"
+        )
+
+
 @router.put("/{workout_id}", response_model=WorkoutSchema)
 def update_workout(
     *,
@@ -138,7 +188,10 @@ def update_workout(
         raise HTTPException(status_code=404, detail="Workout not found")
     if workout_obj.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
-    workout_obj = workout.update(db, db_obj=workout_obj, obj_in=workout_in)
+    try:
+        workout_obj = workout.update(db, db_obj=workout_obj, obj_in=workout_in)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     return workout_obj
 
 
@@ -147,19 +200,13 @@ def complete_workout(
     *,
     db: Session = Depends(dependencies.get_db),
     workout_id: int,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_owned_workout),
 ) -> dict[str, str]:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    if workout_obj.completed_at:
+    if workout_state.completed_at:
         raise HTTPException(status_code=400, detail="Workout already completed")
 
-    workout_obj = workout.update(
-        db, db_obj=workout_obj, obj_in={"completed_at": func.now()}
-    )
+    if not workout.complete(db, id=workout_id):
+        raise HTTPException(status_code=400, detail="Workout already completed")
     return {"message": "Workout completed successfully"}
 
 
@@ -168,16 +215,10 @@ def cancel_workout(
     *,
     db: Session = Depends(dependencies.get_db),
     workout_id: int,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_owned_workout),
 ) -> dict[str, str]:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
     # Only allow cancelling of incomplete workouts
-    if workout_obj.completed_at is not None:
+    if workout_state.completed_at is not None:
         raise HTTPException(status_code=400, detail="Cannot cancel a completed workout")
     workout.delete_workout(db, workout_id=workout_id)
     return {"message": "Workout cancelled and removed successfully"}
@@ -186,15 +227,43 @@ def cancel_workout(
 @router.get("/history", response_model=List[WorkoutSchema])
 def get_workout_history(
     *,
-    db: Session = Depends(dependencies.get_db),
+    response: Response,
+    db: Session = Depends(dependencies.get_read_db),
+    cursor: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(dependencies.get_current_active_user),
 ) -> List[WorkoutSchema]:
-    completed_workouts = workout.get_completed_by_user(
-        db, user_id=current_user.id, skip=skip, limit=limit
+    return paginated(
+        response,
+        lambda: workout.get_completed_by_user(
+            db, user_id=current_user.id, cursor=cursor, skip=skip, limit=limit
+        ),
     )
-    return completed_workouts
+
+
+@router.get("/stats", response_model=List[ExerciseStats])
+def read_exercise_stats(
+    *,
+    db: Session = Depends(dependencies.get_read_db),
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> List[ExerciseStats]:
+    return exercise_stats.get_by_user(db, user_id=current_user.id)
+
+
+@router.get("/stats/{exercise_id}", response_model=ExerciseStats)
+def read_exercise_stat(
+    *,
+    db: Session = Depends(dependencies.get_read_db),
+    exercise_id: int,
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> ExerciseStats:
+    stats = exercise_stats.get_by_key(
+        db, user_id=current_user.id, exercise_id=exercise_id
+    )
+    if not stats:
+        raise HTTPException(status_code=404, detail="No stats for this exercise")
+    return stats
 
 
 @router.get("/{workout_id}", response_model=WorkoutSchema)
@@ -212,6 +281,16 @@ def read_workout(
     return workout_obj
 
 
+@router.get("/{workout_id}/summary", response_model=WorkoutSummary)
+def read_workout_summary(
+    *,
+    db: Session = Depends(dependencies.get_db),
+    workout_id: int,
+    workout_state: Row = Depends(dependencies.get_owned_workout),
+) -> WorkoutSummary:
+    return workout.get_summary(db, id=workout_id)
+
+
 # Exercise tracking within workouts
 @router.post("/{workout_id}/exercises", response_model=WorkoutExerciseSchema)
 def add_exercise_to_workout(
@@ -219,16 +298,8 @@ def add_exercise_to_workout(
     db: Session = Depends(dependencies.get_db),
     workout_id: int,
     exercise_in: WorkoutExerciseCreate,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_open_owned_workout),
 ) -> WorkoutExerciseSchema:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    if workout_obj.completed_at:
-        raise HTTPException(status_code=400, detail="Cannot modify completed workout")
-
     return workout.add_exercise_to_workout(
         db, workout_id=workout_id, exercise_data=exercise_in
     )
@@ -243,16 +314,8 @@ def add_set_to_exercise(
     workout_id: int,
     exercise_id: int,
     set_in: ExerciseSetCreate,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_open_owned_workout),
 ) -> ExerciseSetSchema:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    if workout_obj.completed_at:
-        raise HTTPException(status_code=400, detail="Cannot modify completed workout")
-
     try:
         return workout.add_set_to_exercise(
             db, workout_id=workout_id, exercise_id=exercise_id, set_data=set_in
@@ -272,14 +335,8 @@ def update_exercise_set(
     exercise_id: int,
     set_id: int,
     set_in: ExerciseSetUpdate,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_owned_workout),
 ) -> ExerciseSetSchema:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
     try:
         return workout.update_exercise_set(
             db,
@@ -299,16 +356,8 @@ def delete_exercise_set(
     workout_id: int,
     exercise_id: int,
     set_id: int,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_open_owned_workout),
 ) -> dict[str, str]:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-    if workout_obj.completed_at:
-        raise HTTPException(status_code=400, detail="Cannot modify completed workout")
-
     try:
         workout.delete_exercise_set(
             db, workout_id=workout_id, exercise_id=exercise_id, set_id=set_id
@@ -318,20 +367,87 @@ def delete_exercise_set(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-# Progression tracking
-@router.get("/{workout_id}/progression/{exercise_id}")
-def get_exercise_progression(
+@router.post("/{workout_id}/sets/batch", response_model=ExerciseSetBatchResult)
+def apply_set_batch(
     *,
     db: Session = Depends(dependencies.get_db),
     workout_id: int,
+    batch_in: ExerciseSetBatch,
+    workout_state: Row = Depends(dependencies.get_open_owned_workout),
+) -> ExerciseSetBatchResult:
+    # Un id repetido o a la vez actualizado y borrado haría fallar el UPDATE
+    # masivo a mitad del lote; se rechaza antes de escribir nada.
+    update_ids = [set_in.id for set_in in batch_in.update]
+    if len(update_ids) != len(set(update_ids)):
+        raise HTTPException(status_code=400, detail="Duplicate set id in update")
+    if set(update_ids) & set(batch_in.delete):
+        raise HTTPException(
+            status_code=400, detail="A set cannot be both updated and deleted"
+        )
+    try:
+        return workout.apply_set_batch(db, workout_id=workout_id, batch=batch_in)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+# Progression tracking
+def _max(values: List[Any]) -> Any:
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+@router.get("/progression/{exercise_id}", response_model=ExerciseProgression)
+def get_exercise_progression(
+    *,
+    db: Session = Depends(dependencies.get_read_db),
     exercise_id: int,
+    limit: int = 10,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
     current_user: User = Depends(dependencies.get_current_active_user),
-) -> dict[str, int]:
-    progression_data = workout.get_exercise_progression(
-        db, user_id=current_user.id, exercise_id=exercise_id, limit=10
+) -> ExerciseProgression:
+    exercise_obj = exercise.get(db, id=exercise_id)
+    if not exercise_obj:
+        raise HTTPException(status_code=404, detail="Exercise not found")
+    sessions = workout.get_exercise_progression(
+        db,
+        user_id=current_user.id,
+        exercise_id=exercise_id,
+        limit=limit,
+        start_date=start_date,
+        end_date=end_date,
     )
+    return {
+        "exercise_id": exercise_id,
+        "exercise": exercise_obj,
+        "sessions": sessions,
+        "personal_records": {
+            "max_weight": _max([s["best_set"]["weight"] for s in sessions]),
+            "max_reps": _max([s["max_reps"] for s in sessions]),
+            "max_duration": _max([s["best_set"]["duration"] for s in sessions]),
+            "max_volume": _max([s["total_volume"] for s in sessions]),
+            "max_estimated_1rm": _max([s["estimated_1rm"] for s in sessions]),
+        },
+    }
 
-    return {"exercise_id": exercise_id, "progression": progression_data}
+
+@router.get(
+    "/{workout_id}/progression/{exercise_id}",
+    response_model=ExerciseProgression,
+    deprecated=True,
+)
+def get_exercise_progression_legacy(
+    *,
+    db: Session = Depends(dependencies.get_read_db),
+    workout_id: int,
+    exercise_id: int,
+    limit: int = 10,
+    current_user: User = Depends(dependencies.get_current_active_user),
+) -> ExerciseProgression:
+    # workout_id nunca se usó; se mantiene la ruta por compatibilidad
+    return get_exercise_progression(
+        db=db, exercise_id=exercise_id, limit=limit, current_user=current_user
+    )
 
 
 # Comments/Notes system
@@ -341,17 +457,9 @@ def update_workout_notes(
     db: Session = Depends(dependencies.get_db),
     workout_id: int,
     notes_data: dict,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_owned_workout),
 ) -> dict[str, str]:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
-    workout_obj = workout.update(
-        db, db_obj=workout_obj, obj_in={"notes": notes_data.get("notes")}
-    )
+    workout.update_columns(db, id=workout_id, values={"notes": notes_data.get("notes")})
     return {"message": "Workout notes updated successfully"}
 
 
@@ -364,14 +472,8 @@ def update_exercise_notes(
     workout_id: int,
     exercise_id: int,
     notes_data: dict,
-    current_user: User = Depends(dependencies.get_current_active_user),
+    workout_state: Row = Depends(dependencies.get_owned_workout),
 ) -> WorkoutExerciseSchema:
-    workout_obj = workout.get(db, id=workout_id)
-    if not workout_obj:
-        raise HTTPException(status_code=404, detail="Workout not found")
-    if workout_obj.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
     try:
         return workout.update_exercise_notes(
             db,
@@ -0,0 +1,137 @@
+"""
+Versiones `async def` de los endpoints de workouts con más tráfico.
+
+Con `ASYNC_ENDPOINTS` activado este router se registra antes que
+`workouts.router` bajo el mismo prefijo, así que sus rutas reemplazan a las
+síncronas equivalentes; el resto sigue sirviéndose desde el threadpool. Las
+peticiones en espera de la base de datos no ocupan un hilo del threadpool.
+
+Los parámetros de ruta usan el conversor `:int` para que, al ir primero,
+rutas como `/{workout_id}` no capturen `/templates` o `/stats`.
+"""
+
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import dependencies
+from app.api.pagination import paginated_async
+from app.crud.crud_workout import workout
+from app.models.user import User
+from app.schemas.workout import (
+    Workout as WorkoutSchema,
+    WorkoutHistory,
+    ExerciseSet as ExerciseSetSchema,
+    ExerciseSetCreate,
+)
+
+router = APIRouter()
+
+
+@router.get("/", response_model=Union[List[WorkoutSchema], List[WorkoutHistory]])
+async def read_workouts(
+    response: Response,
+    db: AsyncSession = Depends(dependencies.get_async_read_db),
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    summary: bool = False,
+    current_user: User = Depends(dependencies.get_current_active_user_async),
+) -> Union[List[WorkoutSchema], List[WorkoutHistory]]:
+    # summary=true devuelve solo los datos del workout, sin ejercicios ni series
+    workouts = await paginated_async(
+        response,
+        lambda: workout.get_by_user_async(
+            db,
+            user_id=current_user.id,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            load_graph=not summary,
+        ),
+    )
+    if summary:
+        return [WorkoutHistory.model_validate(w) for w in workouts]
+    return workouts
+
+
+@router.get("/active", response_model=WorkoutSchema)
+async def get_active_workout(
+    db: AsyncSession = Depends(dependencies.get_async_db),
+    current_user: User = Depends(dependencies.get_current_active_user_async),
+) -> WorkoutSchema:
+    active_workout = await workout.get_active_by_user_async(db, user_id=current_user.id)
+    if not active_workout:
+        raise HTTPException(status_code=404, detail="No active workout found")
+    return active_workout
+
+
+@router.put("/{workout_id:int}/complete")
+async def complete_workout(
+    *,
+    db: AsyncSession = Depends(dependencies.get_async_db),
+    workout_id: int,
+    workout_state: Row = Depends(dependencies.get_owned_workout_async),
+) -> dict[str, str]:
+    if workout_state.completed_at:
+        raise HTTPException(status_code=400, detail="Workout already completed")
+
+    if not await workout.complete_async(db, id=workout_id):
+        raise HTTPException(status_code=400, detail="Workout already completed")
+    return {"message": "Workout completed successfully"}
+
+
+@router.get("/history", response_model=List[WorkoutSchema])
+async def get_workout_history(
+    *,
+    response: Response,
+    db: AsyncSession = Depends(dependencies.get_async_read_db),
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(dependencies.get_current_active_user_async),
+) -> List[WorkoutSchema]:
+    return await paginated_async(
+        response,
+        lambda: workout.get_completed_by_user_async(
+            db, user_id=current_user.id, cursor=cursor, skip=skip, limit=limit
+        ),
+    )
+
+
+@router.get("/{workout_id:int}", response_model=WorkoutSchema)
+async def read_workout(
+    *,
+    db: AsyncSession = Depends(dependencies.get_async_db),
+    workout_id: int,
+    current_user: User = Depends(dependencies.get_current_active_user_async),
+) -> WorkoutSchema:
+    workout_obj = await workout.get_async(db, id=workout_id)
+    if not workout_obj:
+        raise HTTPException(status_code=404, detail="Workout not found")
+    if workout_obj.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return workout_obj
+
+
+@router.post(
+    "/{workout_id:int}/exercises/{exercise_id:int}/sets",
+    response_model=ExerciseSetSchema,
+)
+async def add_set_to_exercise(
+    *,
+    db: AsyncSession = Depends(dependencies.get_async_db),
+    workout_id: int,
+    exercise_id: int,
+    set_in: ExerciseSetCreate,
+    workout_state: Row = Depends(dependencies.get_owned_workout_async),
+) -> ExerciseSetSchema:
+    if workout_state.completed_at:
+        raise HTTPException(status_code=400, detail="Cannot modify completed workout")
+    try:
+        return await workout.add_set_to_exercise_async(
+            db, workout_id=workout_id, exercise_id=exercise_id, set_data=set_in
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,29 @@
+"""
+Utilidades para responder con validación condicional por ETag.
+
+Los recursos que se sirven desde una instantánea en memoria ya tienen su JSON
+serializado y un ETag fuerte; si el cliente envía ese ETag en
+`If-None-Match` se responde `304 Not Modified` sin cuerpo.
+"""
+
+from fastapi import Request, Response
+
+# El navegador guarda la respuesta pero la revalida siempre con el servidor.
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Indica si alguna de las etiquetas de `If-None-Match` coincide con `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def json_with_etag(request: Request, body: bytes, etag: str) -> Response:
+    """Devuelve el JSON ya serializado, o un 304 si el cliente tiene esa versión."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
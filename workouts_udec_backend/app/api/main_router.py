@@ -1,9 +1,15 @@
 from fastapi import APIRouter
-from app.api.endpoints import auth, users, exercises, workouts, admin
+from app.api.endpoints import auth, users, exercises, workouts, workouts_async, admin
+from app.core.config import settings
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(exercises.router, prefix="/exercises", tags=["exercises"])
+if settings.ASYNC_ENDPOINTS:
+    # Sus rutas van primero y reemplazan a las síncronas equivalentes.
+    api_router.include_router(
+        workouts_async.router, prefix="/workouts", tags=["workouts"]
+    )
 api_router.include_router(workouts.router, prefix="/workouts", tags=["workouts"])
 api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
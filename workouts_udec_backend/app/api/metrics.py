@@ -0,0 +1,212 @@
+"""
+Métricas de Prometheus de la API.
+
+Las métricas de peticiones (latencia e in-flight) se etiquetan con la
+plantilla de la ruta (`/api/workouts/{workout_id}`) y no con la ruta
+concreta, para que el número de series no crezca con los ids. Las
+peticiones que no coinciden con ninguna ruta se agrupan en `UNMATCHED_ROUTE`.
+
+El estado de los pools de conexiones, las caches y el pool de hashing de
+contraseñas vive en objetos de cada proceso; `refresh` lo copia a gauges y
+contadores. Se llama desde el middleware como mucho una vez cada
+`REFRESH_INTERVAL_SECONDS` y antes de servir `/metrics`.
+
+Con varios workers de uvicorn, la variable de entorno
+`PROMETHEUS_MULTIPROC_DIR` debe apuntar a un directorio vacío compartido
+antes de arrancar: cada proceso escribe allí sus valores y `/metrics`
+devuelve la suma de todos (`multiprocess_mode="livesum"` en los gauges).
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from starlette.routing import Match
+from starlette.types import Scope
+
+from app.core.cache import TTLCache
+from app.core.security import password_hasher, token_cache
+from app.crud.crud_user import principal_cache
+from app.crud.crud_workout import summary_cache
+from app.db.session import pool_metrics
+
+UNMATCHED_ROUTE = "<unmatched>"
+REFRESH_INTERVAL_SECONDS = 1.0
+# Conversores de parámetros (`{workout_id:int}`), que no forman parte de la
+# plantilla expuesta: las rutas async y sync comparten etiqueta.
+_CONVERTER = re.compile(r"{(\w+):\w+}")
+
+# Caches cuyo ratio de aciertos se exporta, por nombre.
+CACHES: Dict[str, TTLCache] = {
+    "token": token_cache,
+    "principal": principal_cache,
+    "workout_summary": summary_cache,
+}
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template, method and status code",
+    ["route", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being served by route template and method",
+    ["route", "method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connections per pool and state (checked_out, checked_in, overflow)",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Configured pool size", ["pool"], multiprocess_mode="livesum"
+)
+DB_POOL_OLDEST_CONNECTION = Gauge(
+    "db_pool_oldest_connection_seconds",
+    "Age of the oldest open connection",
+    ["pool"],
+    multiprocess_mode="livemax",
+)
+DB_POOL_CHECKOUTS = Counter(
+    "db_pool_checkouts", "Connections handed out by the pool", ["pool"]
+)
+DB_POOL_WAIT = Counter(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a free connection",
+    ["pool"],
+)
+DB_POOL_LIVENESS_FAILURES = Counter(
+    "db_pool_liveness_failures",
+    "Connections discarded by the idle liveness check",
+    ["pool"],
+)
+
+CACHE_HITS = Counter("cache_hits", "Cache lookups that found an entry", ["cache"])
+CACHE_MISSES = Counter("cache_misses", "Cache lookups without an entry", ["cache"])
+CACHE_HIT_RATIO = Gauge(
+    "cache_hit_ratio",
+    "Hits over lookups since the process started",
+    ["cache"],
+    multiprocess_mode="liveall",
+)
+CACHE_ENTRIES = Gauge(
+    "cache_entries", "Entries held by the cache", ["cache"], multiprocess_mode="livesum"
+)
+
+PASSWORD_HASH_QUEUE = Gauge(
+    "password_hash_queue_depth",
+    "Password hashing jobs waiting for a worker",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hashing jobs running",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_COMPLETED = Counter(
+    "password_hash_completed", "Password hashing jobs finished"
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected", "Password hashing jobs rejected with a full queue"
+)
+
+_last_totals: Dict[Tuple[str, ...], float] = {}
+_last_refresh = 0.0
+_refresh_lock = threading.Lock()
+
+
+def route_template(app, scope: Scope) -> str:
+    """Plantilla de la ruta que atenderá la petición, sin ejecutarla."""
+    partial: Optional[str] = None
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return _CONVERTER.sub(r"{\1}", route.path)
+        if match == Match.PARTIAL and partial is None:
+            # Coincide la ruta pero no el método (405).
+            partial = _CONVERTER.sub(r"{\1}", route.path)
+    return partial or UNMATCHED_ROUTE
+
+
+def _advance(counter: Counter, key: Tuple[str, ...], total: float) -> None:
+    """Lleva `counter` hasta el total acumulado `total` del objeto observado."""
+    previous = _last_totals.get(key, 0.0)
+    if total > previous:
+        counter.inc(total - previous)
+    _last_totals[key] = total
+
+
+def refresh(force: bool = False) -> None:
+    """Copia el estado de pools, caches y hashing a las métricas."""
+    global _last_refresh  # pylint: disable=global-statement
+    now = time.monotonic()
+    if not force and now - _last_refresh < REFRESH_INTERVAL_SECONDS:
+        return
+    if not _refresh_lock.acquire(blocking=force):
+        return
+    try:
+        _last_refresh = now
+        for name, metrics in pool_metrics.items():
+            stats = metrics.stats()
+            for state in ("checked_out", "checked_in", "overflow"):
+                DB_POOL_CONNECTIONS.labels(name, state).set(stats[state])
+            DB_POOL_SIZE.labels(name).set(stats["size"])
+            DB_POOL_OLDEST_CONNECTION.labels(name).set(
+                stats["oldest_connection_seconds"]
+            )
+            _advance(
+                DB_POOL_CHECKOUTS.labels(name), ("checkouts", name), stats["checkouts"]
+            )
+            _advance(
+                DB_POOL_WAIT.labels(name), ("wait", name), metrics.wait_seconds_total
+            )
+            _advance(
+                DB_POOL_LIVENESS_FAILURES.labels(name),
+                ("liveness", name),
+                stats["liveness_failures"],
+            )
+
+        for name, cache in CACHES.items():
+            hits, misses = cache.hits, cache.misses
+            _advance(CACHE_HITS.labels(name), ("hits", name), hits)
+            _advance(CACHE_MISSES.labels(name), ("misses", name), misses)
+            CACHE_HIT_RATIO.labels(name).set(
+                hits / (hits + misses) if hits + misses else 0.0
+            )
+            CACHE_ENTRIES.labels(name).set(len(cache))
+
+        hashing = password_hasher.stats()
+        PASSWORD_HASH_QUEUE.set(hashing["queue_depth"])
+        PASSWORD_HASH_IN_FLIGHT.set(hashing["in_flight"])
+        _advance(PASSWORD_HASH_COMPLETED, ("hash_completed",), hashing["completed"])
+        _advance(PASSWORD_HASH_REJECTED, ("hash_rejected",), hashing["rejected"])
+    finally:
+        _refresh_lock.release()
+
+
+def render() -> Tuple[bytes, str]:
+    """Cuerpo y content type de la respuesta de `/metrics`."""
+    refresh(force=True)
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        # Un registro nuevo por scrape que agrega los ficheros de todos los
+        # procesos, como indica prometheus_client.
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,39 @@
+"""
+Utilidades para exponer la paginación por cursor en los endpoints.
+
+Los listados siguen devolviendo una lista JSON; el cursor de la página
+siguiente viaja en la cabecera `X-Next-Cursor` y se envía de vuelta en el
+parámetro `?cursor=`. Si la cabecera no está presente no hay más páginas.
+"""
+
+from typing import Any, Awaitable, Callable, List
+
+from fastapi import HTTPException, Response
+
+from app.crud.base import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def paginated(response: Response, fetch: Callable[[], Page]) -> List[Any]:
+    """Obtiene la página, publica su cursor y devuelve sus elementos."""
+    try:
+        page = fetch()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+async def paginated_async(
+    response: Response, fetch: Callable[[], Awaitable[Page]]
+) -> List[Any]:
+    """Como `paginated`, para consultas asíncronas."""
+    try:
+        page = await fetch()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -0,0 +1,114 @@
+"""
+Caché en memoria acotada por tamaño y tiempo de vida (TTL).
+
+Cada proceso de la API mantiene su propia instancia, por lo que la
+invalidación explícita solo alcanza al proceso que la ejecuta; el TTL
+acota cuánto tiempo puede quedar obsoleta una entrada en los demás.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Set, Tuple, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+GroupT = TypeVar("GroupT", bound=Hashable)
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """Caché LRU con expiración por entrada, segura para múltiples hilos."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Inicializa la caché.
+
+        Args:
+            maxsize (int): Número máximo de entradas; 0 desactiva la caché.
+            ttl (float): Segundos que una entrada permanece válida.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[KeyT, Tuple[float, ValueT]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """Devuelve el valor almacenado o `None` si no existe o expiró."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: KeyT, value: ValueT, ttl: Optional[float] = None) -> None:
+        """
+        Almacena un valor, desalojando la entrada menos usada si hace falta.
+
+        `ttl` permite que la entrada caduque antes que el TTL de la caché.
+        """
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: KeyT) -> None:
+        """Elimina una entrada si existe."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class GroupedTTLCache(TTLCache[KeyT, ValueT], Generic[GroupT, KeyT, ValueT]):
+    """
+    `TTLCache` cuyas entradas pertenecen a un grupo que puede invalidarse
+    entero, para valores que dependen de otras entradas del mismo grupo.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize, ttl)
+        self._groups: Dict[GroupT, Set[KeyT]] = {}
+
+    def set_in_group(
+        self, group: GroupT, key: KeyT, value: ValueT, ttl: Optional[float] = None
+    ) -> None:
+        """Almacena un valor como `set` y lo asocia a `group`."""
+        self.set(key, value, ttl)
+        with self._lock:
+            if key not in self._data:
+                return
+            keys = self._groups.setdefault(group, set())
+            # Descarta las claves que la caché ya desalojó.
+            keys.intersection_update(self._data)
+            keys.add(key)
+
+    def invalidate_group(self, group: GroupT) -> None:
+        """Elimina todas las entradas de `group`."""
+        with self._lock:
+            for key in self._groups.pop(group, ()):
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._groups.clear()
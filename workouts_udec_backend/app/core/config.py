@@ -1,5 +1,20 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
+
+# Driver asíncrono equivalente a cada esquema de URL síncrono.
+ASYNC_DRIVERS = {
+    "postgresql+psycopg2://": "postgresql+asyncpg://",
+    "postgresql://": "postgresql+asyncpg://",
+    "sqlite://": "sqlite+aiosqlite://",
+}
+
+
+def async_url(url: str) -> str:
+    """URL equivalente de `url` con el driver asíncrono de su esquema."""
+    for prefix, driver in ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return driver + url[len(prefix) :]
+    return url
 
 
 class Settings(BaseSettings):
@@ -12,6 +27,61 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "password"
     POSTGRES_DB: str = "workouts_db"
     DATABASE_URL: Optional[str] = None
+    # Con ASYNC_ENDPOINTS se crea además un motor asíncrono (asyncpg) y los
+    # endpoints de workouts de mayor tráfico se sirven como `async def`.
+    ASYNC_ENDPOINTS: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Réplicas de lectura (lista JSON de URLs) para los GET que toleran algo
+    # de retraso; una réplica que falla se salta durante RETRY_SECONDS.
+    DATABASE_REPLICA_URLS: List[str] = []
+    DATABASE_REPLICA_RETRY_SECONDS: int = 30
+
+    # Connection pool (por proceso). DB_POOL_LIVENESS: "pre_ping" comprueba
+    # cada checkout, "idle" solo las conexiones inactivas más de
+    # DB_POOL_LIVENESS_INTERVAL segundos y "none" no comprueba.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_LIVENESS: str = "pre_ping"
+    DB_POOL_LIVENESS_INTERVAL: int = 30
+    # Si se define, el total se reparte entre los WEB_CONCURRENCY procesos.
+    DB_MAX_CONNECTIONS: Optional[int] = None
+    WEB_CONCURRENCY: int = 1
+
+    # Conteo de sentencias SQL por petición (cabecera Server-Timing y log).
+    # Las peticiones con más de QUERY_STATS_WARN_STATEMENTS se registran
+    # como warning.
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_WARN_STATEMENTS: int = 25
+
+    # Endpoint /metrics de Prometheus. Con varios workers, definir además la
+    # variable de entorno PROMETHEUS_MULTIPROC_DIR (ver app/api/metrics.py).
+    METRICS_ENABLED: bool = True
+
+    # Caches
+    USER_CACHE_MAX_SIZE: int = 1024
+    USER_CACHE_TTL_SECONDS: int = 60
+    WORKOUT_SUMMARY_CACHE_MAX_SIZE: int = 2048
+    WORKOUT_SUMMARY_CACHE_TTL_SECONDS: int = 300
+    EXERCISE_CATALOG_TTL_SECONDS: int = 300
+    TOKEN_CACHE_MAX_SIZE: int = 4096
+
+    # Password hashing (bcrypt en un pool dedicado y acotado)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # Con autotune se ignora PASSWORD_BCRYPT_ROUNDS y se elige al arrancar el
+    # coste más alto que no supere PASSWORD_HASH_TARGET_MS en esta CPU.
+    PASSWORD_HASH_AUTOTUNE: bool = False
+    PASSWORD_HASH_TARGET_MS: int = 250
+    PASSWORD_BCRYPT_MIN_ROUNDS: int = 10
+    PASSWORD_BCRYPT_MAX_ROUNDS: int = 16
+
+    # Offline sync
+    SYNC_MAX_OPERATIONS: int = 500
+    SYNC_KEY_RETENTION_DAYS: int = 30
 
     @property
     def database_url(self) -> str:
@@ -19,6 +89,12 @@ class Settings(BaseSettings):
             return self.DATABASE_URL
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}/{self.POSTGRES_DB}"
 
+    @property
+    def async_database_url(self) -> str:
+        if self.ASYNC_DATABASE_URL:
+            return self.ASYNC_DATABASE_URL
+        return async_url(self.database_url)
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,136 @@
+"""
+Ejecutor acotado para el hashing y la verificación de contraseñas.
+
+bcrypt consume CPU durante decenas o cientos de milisegundos por llamada.
+Ejecutado directamente en los endpoints, una ráfaga de inicios de sesión
+ocupa todos los hilos del threadpool de FastAPI y deja sin atender al resto
+de la API. Aquí esas llamadas se envían a un pool pequeño y dedicado:
+
+- Solo `PASSWORD_HASH_WORKERS` hashes se calculan a la vez.
+- Como mucho `PASSWORD_HASH_MAX_QUEUE` más esperan turno; por encima se
+  lanza `PasswordHashingBusy` de inmediato (la API responde 503 con
+  `Retry-After`) en lugar de acumular peticiones que terminarían por
+  agotar su tiempo de espera.
+
+Se usan hilos y no procesos porque bcrypt libera el GIL mientras calcula.
+
+`tune_bcrypt_rounds` mide bcrypt en la CPU donde corre la API para elegir
+el coste que se acerca a una latencia objetivo (`PASSWORD_HASH_AUTOTUNE`).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+from passlib.hash import bcrypt
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT")
+
+
+def time_bcrypt(rounds: int) -> float:
+    """Milisegundos que tarda un hash bcrypt con el coste indicado."""
+    handler = bcrypt.using(rounds=rounds)
+    start = time.perf_counter()
+    handler.hash("benchmark-password")
+    return (time.perf_counter() - start) * 1000
+
+
+def tune_bcrypt_rounds(target_ms: float, *, min_rounds: int, max_rounds: int) -> int:
+    """
+    Devuelve el mayor coste de bcrypt cuyo hash tarda como mucho `target_ms`
+    en esta CPU, sin bajar de `min_rounds` ni pasar de `max_rounds`.
+
+    Cada unidad de coste duplica el tiempo, así que se sube de una en una
+    mientras el doble de la última medición quepa en el objetivo.
+    """
+    rounds = min_rounds
+    elapsed = time_bcrypt(rounds)
+    while rounds < max_rounds and elapsed * 2 <= target_ms:
+        rounds += 1
+        elapsed = time_bcrypt(rounds)
+    logger.info("bcrypt cost %d takes %.0f ms on this host", rounds, elapsed)
+    return rounds
+
+
+class PasswordHashingBusy(RuntimeError):
+    """La cola de hashing está llena; el cliente debe reintentar más tarde."""
+
+
+class PasswordHasher:
+    """Pool de hilos de tamaño fijo con cola acotada y contadores de uso."""
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            workers (int): Hashes que se calculan en paralelo.
+            max_queue (int): Tareas que pueden esperar a un hilo libre.
+        """
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.completed = 0
+        self.rejected = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="password-hash"
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Tareas enviadas que todavía esperan a un hilo libre."""
+        return max(0, self._pending - self.workers)
+
+    @property
+    def in_flight(self) -> int:
+        """Tareas calculándose en este momento."""
+        return min(self._pending, self.workers)
+
+    def submit(self, fn: Callable[..., ResultT], *args: Any) -> "Future[ResultT]":
+        """
+        Encola `fn(*args)` en el pool.
+
+        Raises:
+            PasswordHashingBusy: Si la cola ya está llena.
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                logger.warning(
+                    "Password hashing queue full (%d pending)", self._pending
+                )
+                raise PasswordHashingBusy("Password hashing queue is full")
+            self._pending += 1
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def run(self, fn: Callable[..., ResultT], *args: Any) -> ResultT:
+        """Ejecuta `fn(*args)` en el pool y espera su resultado."""
+        return self.submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable[..., ResultT], *args: Any) -> ResultT:
+        """Como `run`, pero sin bloquear el event loop ni ocupar un hilo del threadpool."""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> Dict[str, int]:
+        """Estado actual del pool, para métricas."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "queue_depth": self.queue_depth,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    def _done(self, _future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
@@ -1,12 +1,50 @@
+import time
 from datetime import datetime, timedelta
-from typing import Any, Union
-from jose import jwt
+from typing import Any, Dict, Tuple, Union
+from jose import JWTError, jwt
 from passlib.context import CryptContext
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.hashing import PasswordHasher, tune_bcrypt_rounds
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+try:  # PyJWT, opcional: decodifica HS256 con menos sobrecarga que python-jose
+    from jwt import PyJWTError, decode as pyjwt_decode
+except ImportError:  # pragma: no cover - depende del entorno
+    PyJWTError = None
+    pyjwt_decode = None
+
+if settings.PASSWORD_HASH_AUTOTUNE:
+    BCRYPT_ROUNDS = tune_bcrypt_rounds(
+        settings.PASSWORD_HASH_TARGET_MS,
+        min_rounds=settings.PASSWORD_BCRYPT_MIN_ROUNDS,
+        max_rounds=settings.PASSWORD_BCRYPT_MAX_ROUNDS,
+    )
+else:
+    BCRYPT_ROUNDS = settings.PASSWORD_BCRYPT_ROUNDS
+
+# Los hashes con un coste menor que BCRYPT_ROUNDS se marcan como obsoletos
+# (`needs_update`) y se recalculan en el siguiente inicio de sesión.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
 
 ALGORITHM = "HS256"
+JWT_BACKEND = "pyjwt" if pyjwt_decode is not None else "python-jose"
+
+# Claims ya validados, por firma del token, hasta su `exp`. Se guarda también
+# el token completo y se compara en cada acierto, así que una firma pegada a
+# otra cabecera o payload no reutiliza la entrada.
+token_cache: TTLCache[str, Tuple[str, Dict[str, Any]]] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
 
 
 def create_access_token(
@@ -23,9 +61,50 @@ def create_access_token(
     return encoded_jwt
 
 
+def _decode_token(token: str) -> Dict[str, Any]:
+    if pyjwt_decode is None:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    try:
+        return pyjwt_decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    except PyJWTError as exc:
+        raise JWTError(str(exc)) from exc
+
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verifica un token de acceso y devuelve sus claims.
+
+    Solo la primera presentación de cada token paga la verificación HMAC y
+    el parseo JSON; las siguientes se resuelven desde `token_cache` hasta
+    que el token expira.
+
+    Raises:
+        JWTError: Si el token no es válido o expiró.
+    """
+    signature = token.rpartition(".")[2]
+    cached = token_cache.get(signature)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    claims = _decode_token(token)
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(signature, (token, claims), ttl=exp - time.time())
+    return claims
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.run_async(
+        pwd_context.verify, plain_password, hashed_password
+    )
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.run(pwd_context.hash, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
@@ -1,10 +1,27 @@
 """Clases base para operaciones CRUD (Crear, Leer, Actualizar, Eliminar)."""
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import DateTime, Select, func, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
 
 from app.db.base_class import Base
 
@@ -14,6 +31,111 @@ CreateSchemaT = TypeVar("CreateSchemaT", bound=BaseModel)
 UpdateSchemaT = TypeVar("UpdateSchemaT", bound=BaseModel)
 
 
+class Page(NamedTuple):
+    """Página de resultados y cursor opaco para pedir la siguiente."""
+
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Codifica los valores de las claves de orden de la última fila."""
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    """
+    Decodifica un cursor generado por `encode_cursor` para las columnas `keys`.
+
+    Lanza ValueError si el cursor está mal formado.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Invalid cursor")
+    return [_cursor_value(key, value) for key, value in zip(keys, values)]
+
+
+def _cursor_value(key: Any, value: Any) -> Any:
+    """
+    Convierte un valor del cursor al tipo Python de su columna.
+
+    Un valor de otro tipo (p. ej. texto para una clave entera) se rechaza
+    aquí con ValueError, en vez de llegar a la base como un parámetro
+    inválido.
+    """
+    if isinstance(key.type, DateTime):
+        if not isinstance(value, str):
+            raise ValueError("Invalid cursor")
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise ValueError("Invalid cursor") from exc
+    python_type = key.type.python_type
+    if isinstance(value, bool) and python_type is not bool:
+        # bool es subclase de int: `true` no es un id válido.
+        raise ValueError("Invalid cursor")
+    if python_type is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, python_type):
+        raise ValueError("Invalid cursor")
+    return value
+
+
+def _julian_days(expressions: Sequence[Any]) -> List[Any]:
+    """Envuelve las expresiones de fecha en `julianday()` (solo SQLite)."""
+    return [
+        (
+            func.julianday(expression)
+            if isinstance(expression.type, DateTime)
+            else expression
+        )
+        for expression in expressions
+    ]
+
+
+def _keyset(
+    query: Any,
+    *,
+    dialect: str,
+    keys: Sequence[Any],
+    cursor: Optional[str],
+    skip: int,
+    limit: int,
+    descending: bool,
+) -> Any:
+    """Añade a una `Query` o `Select` el filtro del cursor, el orden y el límite."""
+    order_keys = keys
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        bounds = [literal(value, key.type) for key, value in zip(keys, values)]
+        if dialect == "sqlite":
+            # SQLite guarda las fechas como texto, con o sin microsegundos
+            # según quién las escribió; se comparan como número de día.
+            keys, bounds = _julian_days(keys), _julian_days(bounds)
+        row = tuple_(*keys)
+        bound = tuple_(*bounds)
+        query = query.filter(row < bound if descending else row > bound)
+    order = [key.desc() if descending else key.asc() for key in order_keys]
+    return query.order_by(*order).offset(skip).limit(limit + 1)
+
+
+def _page(items: List[Any], *, keys: Sequence[Any], limit: int) -> Page:
+    """Recorta la fila extra pedida por `_keyset` y genera el cursor siguiente."""
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor([getattr(items[-1], key.key) for key in keys])
+    return Page(items=items, next_cursor=next_cursor)
+
+
 class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
     """Clase base para operaciones CRUD en un modelo de SQLAlchemy."""
 
@@ -31,6 +153,76 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         """Recupera múltiples registros con paginación opcional."""
         return db.query(self.model).offset(skip).limit(limit).all()
 
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Page:
+        """Recupera múltiples registros ordenados por ID, paginados por cursor."""
+        return self.paginate(
+            db.query(self.model),
+            keys=[self.model.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+        )
+
+    def paginate(
+        self,
+        query: Query,
+        *,
+        keys: Sequence[Any],
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> Page:
+        """
+        Pagina `query` por conjunto de claves (keyset) sobre las columnas `keys`.
+
+        La última clave debe ser única (normalmente el ID) para desempatar. Con
+        `cursor`, la página comienza justo después de la fila que lo generó,
+        sin recorrer y descartar las anteriores como hace `offset`. Las claves
+        no deben contener valores nulos.
+        """
+        query = _keyset(
+            query,
+            dialect=query.session.get_bind().dialect.name,
+            keys=keys,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=descending,
+        )
+        return _page(query.all(), keys=keys, limit=limit)
+
+    async def paginate_async(
+        self,
+        db: AsyncSession,
+        statement: Select,
+        *,
+        keys: Sequence[Any],
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        descending: bool = False,
+    ) -> Page:
+        """Como `paginate`, para una sentencia `select()` y una sesión asíncrona."""
+        statement = _keyset(
+            statement,
+            dialect=db.bind.dialect.name,
+            keys=keys,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=descending,
+        )
+        items = (await db.scalars(statement)).all()
+        return _page(list(items), keys=keys, limit=limit)
+
     def create(self, db: Session, *, obj_in: CreateSchemaT) -> ModelT:
         """Crea un nuevo registro en la base de datos."""
         obj_in_data = jsonable_encoder(obj_in)
@@ -69,3 +261,52 @@ class CRUDBase(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
             db.delete(obj)
             db.commit()
         return obj
+
+    async def get_async(self, db: AsyncSession, id: Any) -> Optional[ModelT]:
+        """Como `get`, con una sesión asíncrona."""
+        return await db.scalar(select(self.model).where(self.model.id == id))
+
+    async def get_multi_async(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> List[ModelT]:
+        """Como `get_multi`, con una sesión asíncrona."""
+        result = await db.scalars(select(self.model).offset(skip).limit(limit))
+        return list(result.all())
+
+    async def get_page_async(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Page:
+        """Como `get_page`, con una sesión asíncrona."""
+        return await self.paginate_async(
+            db,
+            select(self.model),
+            keys=[self.model.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+        )
+
+    async def create_async(self, db: AsyncSession, *, obj_in: CreateSchemaT) -> ModelT:
+        """Como `create`, con una sesión asíncrona."""
+        return await db.run_sync(lambda session: self.create(session, obj_in=obj_in))
+
+    async def update_async(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelT,
+        obj_in: Union[UpdateSchemaT, Dict[str, Any]],
+    ) -> ModelT:
+        """Como `update`, con una sesión asíncrona."""
+        return await db.run_sync(
+            lambda session: self.update(session, db_obj=db_obj, obj_in=obj_in)
+        )
+
+    async def remove_async(self, db: AsyncSession, *, id: int) -> Optional[ModelT]:
+        """Como `remove`, con una sesión asíncrona."""
+        return await db.run_sync(lambda session: self.remove(session, id=id))
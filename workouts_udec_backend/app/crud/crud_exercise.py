@@ -6,18 +6,187 @@ para interactuar con la tabla 'exercises' en la base de datos (Crear, Leer,
 Actualizar, Borrar).
 
 Además de las operaciones básicas heredadas de CRUDBase, se incluyen
-métodos específicos para obtener ejercicios activos y para filtrarlos
-por grupo muscular.
+métodos específicos para obtener ejercicios activos, filtrarlos por grupo
+muscular y buscarlos por nombre con filtros y conteos por faceta. El
+autocompletado se resuelve en memoria con `PrefixIndex`, sin consultar la
+base de datos.
 
 Se exporta una instancia `exercise` para ser utilizada directamente en las
 rutas (endpoints) de la API.
 """
 
-from typing import List
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from pydantic import TypeAdapter
+from sqlalchemy import case, func, literal, select
 from sqlalchemy.orm import Session
-from app.crud.base import CRUDBase
-from app.models.exercise import Exercise
-from app.schemas.exercise import ExerciseCreate, ExerciseUpdate
+from app.core.config import settings
+from app.crud.base import CRUDBase, Page
+from app.models.exercise import Exercise, ExerciseType
+from app.schemas.exercise import (
+    Exercise as ExerciseSchema,
+    ExerciseCreate,
+    ExerciseUpdate,
+)
+
+CATALOG_ADAPTER = TypeAdapter(List[ExerciseSchema])
+FACET_FIELDS = ("muscle_group", "equipment", "exercise_type")
+NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_name(text: str) -> str:
+    """
+    Normaliza un nombre para compararlo: sin tildes ni diéresis, en
+    minúsculas y con la puntuación y los espacios colapsados.
+
+    "Press de Banca Inclinado", "press  de banca-inclinado" y "PRÉSS DE
+    BANCA INCLINADO" dan el mismo resultado; la ñ se pliega a n.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return NON_WORD.sub(" ", stripped.casefold()).strip()
+
+
+class CatalogSnapshot(NamedTuple):
+    """Copia inmutable del catálogo de ejercicios activos."""
+
+    version: int
+    etag: str
+    exercises: List[ExerciseSchema]
+    body: bytes
+
+
+class PrefixIndex:
+    """
+    Índice de prefijos inmutable sobre los nombres del catálogo.
+
+    Guarda, en un arreglo ordenado, el nombre normalizado de cada ejercicio
+    a partir de cada una de sus palabras, de modo que "banca" encuentra
+    "Press de Banca". Una búsqueda es una bisección más el recorrido de las
+    claves que comparten el prefijo.
+    """
+
+    def __init__(self, version: int, exercises: List[ExerciseSchema]) -> None:
+        self.version = version
+        self._exercises = exercises
+        entries = []
+        for position, item in enumerate(exercises):
+            words = normalize_name(item.name).split()
+            for start in range(len(words)):
+                entries.append((" ".join(words[start:]), start, position))
+        entries.sort()
+        self._keys = [entry[0] for entry in entries]
+        self._entries = entries
+        self._sort_names = [normalize_name(item.name) for item in exercises]
+
+    def search(self, text: str, limit: int = 10) -> List[ExerciseSchema]:
+        """
+        Devuelve los ejercicios cuyo nombre, o alguna de sus palabras,
+        empieza por `text`. Primero los que coinciden desde el inicio del
+        nombre y, dentro de cada grupo, por orden alfabético.
+        """
+        prefix = normalize_name(text)
+        if not prefix or limit <= 0:
+            return []
+        matches: Dict[int, int] = {}
+        for index in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key, word, position = self._entries[index]
+            if not key.startswith(prefix):
+                break
+            matches[position] = min(word, matches.get(position, word))
+        ranked = sorted(
+            matches,
+            key=lambda position: (
+                matches[position] > 0,
+                self._sort_names[position],
+                self._exercises[position].id,
+            ),
+        )
+        return [self._exercises[position] for position in ranked[:limit]]
+
+
+class ExerciseCatalog:
+    """
+    Catálogo de ejercicios activos en memoria, ya serializado a JSON.
+
+    La instantánea se construye con una consulta la primera vez que se pide y
+    se reutiliza hasta que una mutación de `CRUDExercise` llama a
+    `invalidate`. Como cada proceso tiene su propia copia, además caduca tras
+    `EXERCISE_CATALOG_TTL_SECONDS`; el ETag se deriva del contenido, así que
+    una reconstrucción sin cambios conserva el mismo ETag.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._generation = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._index: Optional[PrefixIndex] = None
+        self._built_for = -1
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        """Devuelve la instantánea vigente, reconstruyéndola si hace falta."""
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh():
+            return snapshot
+        with self._lock:
+            if self._snapshot is not None and self._is_fresh():
+                return self._snapshot
+            generation = self._generation
+            rows = (
+                db.query(Exercise)
+                .filter(Exercise.is_active.is_(True))
+                .order_by(Exercise.id)
+                .all()
+            )
+            exercises = [ExerciseSchema.model_validate(row) for row in rows]
+            body = CATALOG_ADAPTER.dump_json(exercises)
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            previous = self._snapshot
+            version = previous.version if previous else 0
+            if previous is None or previous.etag != etag:
+                version += 1
+            else:
+                exercises, body = previous.exercises, previous.body
+            self._snapshot = CatalogSnapshot(version, etag, exercises, body)
+            self._built_for = generation
+            self._built_at = time.monotonic()
+            return self._snapshot
+
+    def prefix_index(self, db: Session) -> PrefixIndex:
+        """
+        Devuelve el índice de autocompletado de la instantánea vigente.
+
+        Se reconstruye cuando cambia la versión del catálogo; el índice nuevo
+        se construye completo antes de reemplazar al anterior, así que las
+        lecturas concurrentes siempre ven uno coherente.
+        """
+        snapshot = self.get(db)
+        index = self._index
+        if index is None or index.version != snapshot.version:
+            index = PrefixIndex(snapshot.version, snapshot.exercises)
+            self._index = index
+        return index
+
+    def invalidate(self) -> None:
+        """Marca la instantánea como obsoleta; se reconstruye en la próxima lectura."""
+        with self._lock:
+            self._generation += 1
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._built_for == self._generation
+            and time.monotonic() - self._built_at < self.ttl
+        )
+
+
+catalog = ExerciseCatalog(ttl=settings.EXERCISE_CATALOG_TTL_SECONDS)
 
 
 class CRUDExercise(CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]):
@@ -26,26 +195,57 @@ class CRUDExercise(CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]):
     Hereda de CRUDBase y añade métodos específicos para buscar ejercicios.
     """
 
+    def create(self, db: Session, *, obj_in: ExerciseCreate) -> Exercise:
+        """Crea un ejercicio e invalida el catálogo en memoria."""
+        db_obj = super().create(db, obj_in=obj_in)
+        catalog.invalidate()
+        return db_obj
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Exercise,
+        obj_in: Union[ExerciseUpdate, Dict[str, Any]],
+    ) -> Exercise:
+        """Actualiza un ejercicio e invalida el catálogo en memoria."""
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        catalog.invalidate()
+        return db_obj
+
+    def remove(self, db: Session, *, id: int) -> Optional[Exercise]:
+        """Elimina un ejercicio e invalida el catálogo en memoria."""
+        db_obj = super().remove(db, id=id)
+        catalog.invalidate()
+        return db_obj
+
     def get_active(
-        self, db: Session, *, skip: int = 0, limit: int = 100
-    ) -> List[Exercise]:
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Page:
         """
-        Obtiene una lista de ejercicios que están marcados como activos.
+        Obtiene una página de ejercicios que están marcados como activos.
 
         Args:
             db (Session): La sesión de la base de datos.
+            cursor (Optional[str]): Cursor devuelto por la página anterior.
             skip (int): El número de registros a saltar (para paginación).
             limit (int): El número máximo de registros a devolver.
 
         Returns:
-            List[Exercise]: Una lista de instancias del modelo Exercise.
+            Page: Los ejercicios, ordenados por ID, y el cursor de la página
+                  siguiente.
         """
-        return (
-            db.query(self.model)
-            .filter(self.model.is_active == True)
-            .offset(skip)
-            .limit(limit)
-            .all()
+        return self.paginate(
+            db.query(self.model).filter(self.model.is_active == True),
+            keys=[self.model.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
         )
 
     def get_by_muscle_group(self, db: Session, *, muscle_group: str) -> List[Exercise]:
@@ -63,10 +263,125 @@ class CRUDExercise(CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]):
         return (
             db.query(self.model)
             .filter(
-                self.model.muscle_group == muscle_group, self.model.is_active is True
+                self.model.muscle_group == muscle_group, self.model.is_active.is_(True)
             )
             .all()
         )
 
+    def search(
+        self,
+        db: Session,
+        *,
+        q: Optional[str] = None,
+        muscle_group: Optional[str] = None,
+        equipment: Optional[str] = None,
+        exercise_type: Optional[ExerciseType] = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[Exercise], int, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Busca ejercicios activos por texto, con filtros y conteos por faceta.
+
+        El nombre coincide si empieza por `q`, lo contiene o, en PostgreSQL,
+        si alguna de sus palabras se parece a `q` según pg_trgm (tolera
+        erratas); también coinciden los ejercicios cuya descripción o
+        instrucciones contienen `q`. Los resultados se ordenan por relevancia:
+        nombre exacto, prefijo, subcadena, similitud de trigramas y por último
+        solo descripción o instrucciones; a igualdad, por nombre.
+
+        Args:
+            db (Session): La sesión de la base de datos.
+            q (Optional[str]): Texto a buscar en el nombre, la descripción y
+                               las instrucciones.
+            muscle_group (Optional[str]): Grupo muscular exacto.
+            equipment (Optional[str]): Equipamiento exacto.
+            exercise_type (Optional[ExerciseType]): Tipo de ejercicio.
+            skip (int): El número de resultados a saltar.
+            limit (int): El número máximo de resultados a devolver.
+
+        Returns:
+            Tuple: Los ejercicios de la página, el total de coincidencias y,
+                   por cada campo filtrable, los conteos por valor sin
+                   aplicar el filtro de ese mismo campo.
+        """
+        q = (q or "").strip()
+        postgres = db.get_bind().dialect.name == "postgresql"
+        name = self.model.name
+
+        conditions = [self.model.is_active.is_(True)]
+        relevance: Any = literal(0)
+        if q:
+            prefix = name.istartswith(q, autoescape=True)
+            contains = name.icontains(q, autoescape=True)
+            in_text = self.model.description.icontains(
+                q, autoescape=True
+            ) | self.model.instructions.icontains(q, autoescape=True)
+            relevance = case(
+                (func.lower(name) == q.lower(), 3),
+                (prefix, 2),
+                (contains, 1),
+                else_=0,
+            )
+            if postgres:
+                # `name %> q` equivale a word_similarity(q, name) >= umbral y
+                # puede resolverse con el índice ix_exercises_name_trgm.
+                conditions.append(contains | name.op("%>")(q) | in_text)
+                relevance = relevance + func.word_similarity(q, name)
+            else:
+                conditions.append(contains | in_text)
+
+        filters = {
+            "muscle_group": muscle_group,
+            "equipment": equipment,
+            "exercise_type": exercise_type,
+        }
+        filter_conditions = {
+            field: getattr(self.model, field) == value
+            for field, value in filters.items()
+            if value is not None
+        }
+
+        rows = db.execute(
+            select(self.model, func.count().over().label("total"))
+            .where(*conditions, *filter_conditions.values())
+            .order_by(relevance.desc(), name, self.model.id)
+            .offset(skip)
+            .limit(limit)
+        ).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif not skip:
+            total = 0
+        else:
+            total = db.scalar(
+                select(func.count())
+                .select_from(self.model)
+                .where(*conditions, *filter_conditions.values())
+            )
+
+        facets: Dict[str, List[Dict[str, Any]]] = {}
+        for field in FACET_FIELDS:
+            column = getattr(self.model, field)
+            others = [
+                condition
+                for other, condition in filter_conditions.items()
+                if other != field
+            ]
+            counts = db.execute(
+                select(column, func.count())
+                .where(*conditions, *others, column.isnot(None))
+                .group_by(column)
+                .order_by(func.count().desc(), column)
+            ).all()
+            facets[field] = [
+                {
+                    "value": value.value if isinstance(value, ExerciseType) else value,
+                    "count": count,
+                }
+                for value, count in counts
+            ]
+        return items, total, facets
+
 
 exercise = CRUDExercise(Exercise)
@@ -0,0 +1,187 @@
+"""
+Definición de las operaciones CRUD para el modelo UserExerciseStats.
+
+Este módulo contiene la clase CRUDExerciseStats, que mantiene la tabla
+'user_exercise_stats' a partir de las series registradas:
+
+- Al completar un workout, sus agregados se combinan con los existentes
+  (un solo `INSERT ... SELECT ... ON CONFLICT DO UPDATE`).
+- Al editar o borrar series de un workout ya completado, se recalculan desde
+  cero solo las filas (usuario, ejercicio) afectadas.
+- `rebuild` vuelve a generar la tabla completa.
+
+Los métodos no hacen `commit`: se ejecutan dentro de la transacción de la
+operación que los origina. Se exporta una instancia `exercise_stats` para ser
+utilizada directamente en las rutas (endpoints) de la API.
+"""
+
+from typing import Any, Iterable, List, Optional
+from sqlalchemy import case, delete, distinct, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+from app.crud.base import CRUDBase
+from app.models.exercise_stats import UserExerciseStats
+from app.models.workout import ExerciseSet, Workout, WorkoutExercise
+from app.schemas.exercise_stats import ExerciseStats
+
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+STATS_COLUMNS = [
+    "user_id",
+    "exercise_id",
+    "best_weight",
+    "best_reps",
+    "best_estimated_1rm",
+    "total_volume",
+    "session_count",
+    "last_performed_at",
+]
+
+
+def estimated_1rm(reps: Any, weight: Any) -> ColumnElement:
+    """1RM estimado con la fórmula de Epley; nulo si no hay repeticiones."""
+    return case(
+        (reps == 1, weight),
+        (reps > 1, weight * (1 + reps / 30.0)),
+    )
+
+
+def _aggregate(*filters: Any) -> Select:
+    """Agregados por (usuario, ejercicio) de las series completadas."""
+    return (
+        select(
+            Workout.user_id,
+            WorkoutExercise.exercise_id,
+            func.max(ExerciseSet.weight),
+            func.max(ExerciseSet.reps),
+            func.max(estimated_1rm(ExerciseSet.reps, ExerciseSet.weight)),
+            func.coalesce(func.sum(ExerciseSet.reps * ExerciseSet.weight), 0.0),
+            func.count(distinct(Workout.id)),
+            func.max(Workout.started_at),
+        )
+        .join(WorkoutExercise, WorkoutExercise.workout_id == Workout.id)
+        .join(ExerciseSet, ExerciseSet.workout_exercise_id == WorkoutExercise.id)
+        .where(
+            Workout.completed_at.isnot(None),
+            ExerciseSet.completed.is_(True),
+            *filters,
+        )
+        .group_by(Workout.user_id, WorkoutExercise.exercise_id)
+    )
+
+
+class CRUDExerciseStats(CRUDBase[UserExerciseStats, ExerciseStats, ExerciseStats]):
+    """
+    Objeto CRUD para el modelo UserExerciseStats.
+    Mantiene el resumen por usuario y ejercicio y permite leerlo por clave.
+    """
+
+    def get_by_key(
+        self, db: Session, *, user_id: int, exercise_id: int
+    ) -> Optional[UserExerciseStats]:
+        """Obtiene las estadísticas de un ejercicio por su clave primaria."""
+        return db.get(UserExerciseStats, (user_id, exercise_id))
+
+    def get_by_user(self, db: Session, *, user_id: int) -> List[UserExerciseStats]:
+        """Lista las estadísticas del usuario, de la sesión más reciente a la más antigua."""
+        return (
+            db.query(UserExerciseStats)
+            .filter(UserExerciseStats.user_id == user_id)
+            .order_by(
+                UserExerciseStats.last_performed_at.desc(),
+                UserExerciseStats.exercise_id,
+            )
+            .all()
+        )
+
+    def apply_workout(self, db: Session, *, workout_id: int) -> None:
+        """
+        Suma un workout recién completado a las estadísticas de sus ejercicios.
+
+        Debe llamarse una sola vez por workout, justo después de marcarlo como
+        completado.
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect not in UPSERT_INSERTS:
+            # Sin upsert nativo: recalcular los ejercicios del workout.
+            user_id, exercise_ids = self._workout_keys(db, workout_id=workout_id)
+            self.recompute(db, user_id=user_id, exercise_ids=exercise_ids)
+            return
+
+        table = UserExerciseStats.__table__
+        statement = UPSERT_INSERTS[dialect](table).from_select(
+            STATS_COLUMNS, _aggregate(Workout.id == workout_id)
+        )
+        excluded = statement.excluded
+        greatest = func.greatest if dialect == "postgresql" else func.max
+
+        def best(column: str) -> ColumnElement:
+            # GREATEST/MAX que ignora nulos en ambos dialectos
+            current, new = table.c[column], excluded[column]
+            return greatest(func.coalesce(current, new), func.coalesce(new, current))
+
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[table.c.user_id, table.c.exercise_id],
+                set_={
+                    "best_weight": best("best_weight"),
+                    "best_reps": best("best_reps"),
+                    "best_estimated_1rm": best("best_estimated_1rm"),
+                    "total_volume": table.c.total_volume + excluded.total_volume,
+                    "session_count": table.c.session_count + excluded.session_count,
+                    "last_performed_at": best("last_performed_at"),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    def recompute(
+        self, db: Session, *, user_id: int, exercise_ids: Iterable[int]
+    ) -> None:
+        """Recalcula desde las series las estadísticas de los ejercicios indicados."""
+        exercise_ids = list(set(exercise_ids))
+        if not exercise_ids:
+            return
+        db.execute(
+            delete(UserExerciseStats).where(
+                UserExerciseStats.user_id == user_id,
+                UserExerciseStats.exercise_id.in_(exercise_ids),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        db.execute(
+            insert(UserExerciseStats).from_select(
+                STATS_COLUMNS,
+                _aggregate(
+                    Workout.user_id == user_id,
+                    WorkoutExercise.exercise_id.in_(exercise_ids),
+                ),
+            )
+        )
+
+    def recompute_workout(self, db: Session, *, workout_id: int) -> None:
+        """Recalcula las estadísticas de todos los ejercicios de un workout."""
+        user_id, exercise_ids = self._workout_keys(db, workout_id=workout_id)
+        self.recompute(db, user_id=user_id, exercise_ids=exercise_ids)
+
+    def rebuild(self, db: Session) -> int:
+        """Regenera la tabla completa y devuelve el número de filas."""
+        db.execute(
+            delete(UserExerciseStats),
+            execution_options={"synchronize_session": False},
+        )
+        db.execute(insert(UserExerciseStats).from_select(STATS_COLUMNS, _aggregate()))
+        return db.query(func.count()).select_from(UserExerciseStats).scalar()
+
+    def _workout_keys(self, db: Session, *, workout_id: int) -> tuple:
+        rows = db.execute(
+            select(Workout.user_id, WorkoutExercise.exercise_id)
+            .join(WorkoutExercise, WorkoutExercise.workout_id == Workout.id)
+            .where(Workout.id == workout_id)
+        ).all()
+        if not rows:
+            return None, []
+        return rows[0].user_id, [row.exercise_id for row in rows]
+
+
+exercise_stats = CRUDExerciseStats(UserExerciseStats)
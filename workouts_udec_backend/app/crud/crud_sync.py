@@ -0,0 +1,338 @@
+"""
+Definición de las operaciones CRUD para la sincronización offline.
+
+Este módulo contiene la clase CRUDSyncOperation, que aplica en una única
+transacción el registro ordenado de operaciones que el cliente acumuló sin
+conexión, y registra la clave de idempotencia de cada una en la tabla
+'sync_operations' para que los reintentos no dupliquen datos.
+
+Se exporta una instancia `sync_operation` para ser utilizada directamente en
+las rutas (endpoints) de la API.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func, update
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.crud.crud_exercise_stats import exercise_stats
+from app.crud.crud_workout import summary_cache, workout as crud_workout
+from app.crud.loaders import workout_graph
+from app.models.exercise import Exercise
+from app.models.sync import SyncOperation
+from app.models.workout import ExerciseSet, Workout, WorkoutExercise
+from app.schemas.sync import SyncOperationIn, SyncOperationType
+from app.schemas.workout import (
+    ExerciseSetCreate,
+    ExerciseSetUpdate,
+    WorkoutBase,
+    WorkoutExerciseCreate,
+    WorkoutUpdate,
+)
+
+# Resultado de aplicar una operación: (ID de la entidad, ID del workout).
+Applied = Tuple[Optional[int], Optional[int]]
+
+# Tipos de operación que crean cada clase de entidad referenciable por clave.
+CREATES_WORKOUT = {SyncOperationType.CREATE_WORKOUT}
+CREATES_WORKOUT_EXERCISE = {SyncOperationType.ADD_EXERCISE}
+CREATES_SET = {SyncOperationType.ADD_SET}
+
+
+class _SyncBatch:
+    """
+    Estado de una sincronización en curso.
+
+    Resuelve las referencias entre operaciones, comprueba que cada entidad
+    pertenezca al usuario y acumula los workouts afectados y las series
+    borradas. Las entidades se obtienen con `Session.get`, por lo que las ya
+    cargadas o creadas en el mismo registro no generan consultas.
+    """
+
+    def __init__(self, db: Session, user_id: int) -> None:
+        self.db = db
+        self.user_id = user_id
+        self.ids: Dict[str, Tuple[str, Optional[int]]] = {}
+        self.touched_workouts: Set[int] = set()
+        self.deleted_sets: List[int] = []
+        self.handlers: Dict[SyncOperationType, Callable[[SyncOperationIn], Applied]] = {
+            SyncOperationType.CREATE_WORKOUT: self.create_workout,
+            SyncOperationType.COMPLETE_WORKOUT: self.complete_workout,
+            SyncOperationType.UPDATE_WORKOUT_NOTES: self.update_workout_notes,
+            SyncOperationType.ADD_EXERCISE: self.add_exercise,
+            SyncOperationType.UPDATE_EXERCISE_NOTES: self.update_exercise_notes,
+            SyncOperationType.ADD_SET: self.add_set,
+            SyncOperationType.UPDATE_SET: self.update_set,
+            SyncOperationType.DELETE_SET: self.delete_set,
+        }
+
+    def apply(self, operation: SyncOperationIn) -> Applied:
+        """Aplica una operación y devuelve la entidad y el workout afectados."""
+        entity_id, workout_id = self.handlers[operation.type](operation)
+        self.ids[operation.key] = (operation.type.value, entity_id)
+        if workout_id is not None:
+            self.touched_workouts.add(workout_id)
+        return entity_id, workout_id
+
+    def _resolve(
+        self,
+        entity_id: Optional[int],
+        key: Optional[str],
+        creators: Set[SyncOperationType],
+        name: str,
+    ) -> int:
+        """Obtiene el ID de una entidad indicada por ID o por clave de operación."""
+        if entity_id is not None:
+            return entity_id
+        if key is None:
+            raise ValueError(f"Missing {name}_id or {name}_key")
+        operation, resolved = self.ids.get(key, (None, None))
+        if resolved is None or operation not in {creator.value for creator in creators}:
+            raise ValueError(f"Unknown {name}_key '{key}'")
+        return resolved
+
+    def _workout(self, workout_id: int, *, open_only: bool) -> Workout:
+        workout_obj = self.db.get(Workout, workout_id)
+        if not workout_obj:
+            raise ValueError("Workout not found")
+        if workout_obj.user_id != self.user_id:
+            raise ValueError("Not enough permissions")
+        if open_only and workout_obj.completed_at is not None:
+            raise ValueError("Cannot modify completed workout")
+        return workout_obj
+
+    def _workout_exercise(
+        self, operation: SyncOperationIn, *, open_only: bool
+    ) -> WorkoutExercise:
+        workout_exercise_id = self._resolve(
+            operation.workout_exercise_id,
+            operation.workout_exercise_key,
+            CREATES_WORKOUT_EXERCISE,
+            "workout_exercise",
+        )
+        workout_exercise = self.db.get(WorkoutExercise, workout_exercise_id)
+        if not workout_exercise:
+            raise ValueError("Exercise not found in workout")
+        self._workout(workout_exercise.workout_id, open_only=open_only)
+        return workout_exercise
+
+    def _set(self, operation: SyncOperationIn, *, open_only: bool) -> ExerciseSet:
+        set_id = self._resolve(operation.set_id, operation.set_key, CREATES_SET, "set")
+        exercise_set = self.db.get(ExerciseSet, set_id)
+        if not exercise_set:
+            raise ValueError("Exercise set not found")
+        workout_exercise = self.db.get(
+            WorkoutExercise, exercise_set.workout_exercise_id
+        )
+        self._workout(workout_exercise.workout_id, open_only=open_only)
+        return exercise_set
+
+    def _target_workout(
+        self, operation: SyncOperationIn, *, open_only: bool
+    ) -> Workout:
+        workout_id = self._resolve(
+            operation.workout_id, operation.workout_key, CREATES_WORKOUT, "workout"
+        )
+        return self._workout(workout_id, open_only=open_only)
+
+    def create_workout(self, operation: SyncOperationIn) -> Applied:
+        workout_in = WorkoutBase.model_validate(operation.data)
+        if crud_workout.has_active_by_user(self.db, user_id=self.user_id):
+            raise ValueError(
+                "You already have an active workout. Complete it before starting a new one."
+            )
+        workout_obj = Workout(user_id=self.user_id, **workout_in.model_dump())
+        self.db.add(workout_obj)
+        self.db.flush()
+        return workout_obj.id, workout_obj.id
+
+    def complete_workout(self, operation: SyncOperationIn) -> Applied:
+        workout_obj = self._target_workout(operation, open_only=False)
+        if workout_obj.completed_at is not None:
+            raise ValueError("Workout already completed")
+        # Se respeta la hora de término registrada sin conexión, si viene.
+        completed_at = WorkoutUpdate.model_validate(operation.data).completed_at
+        # Las series del lote deben estar en la base antes de sumarlas.
+        self.db.flush()
+        # Solo un workout todavía abierto: una petición concurrente que lo
+        # completó primero no debe sumar dos veces las estadísticas.
+        result = self.db.execute(
+            update(Workout)
+            .where(Workout.id == workout_obj.id, Workout.completed_at.is_(None))
+            .values(completed_at=completed_at or func.now()),
+            execution_options={"synchronize_session": False},
+        )
+        if result.rowcount != 1:
+            raise ValueError("Workout already completed")
+        self.db.refresh(workout_obj, ["completed_at"])
+        exercise_stats.apply_workout(self.db, workout_id=workout_obj.id)
+        return workout_obj.id, workout_obj.id
+
+    def update_workout_notes(self, operation: SyncOperationIn) -> Applied:
+        workout_obj = self._target_workout(operation, open_only=False)
+        workout_obj.notes = operation.data.get("notes")
+        return workout_obj.id, workout_obj.id
+
+    def add_exercise(self, operation: SyncOperationIn) -> Applied:
+        workout_obj = self._target_workout(operation, open_only=True)
+        exercise_in = WorkoutExerciseCreate.model_validate(operation.data)
+        if not self.db.get(Exercise, exercise_in.exercise_id):
+            raise ValueError("Exercise not found")
+        workout_exercise = WorkoutExercise(
+            workout_id=workout_obj.id,
+            exercise_id=exercise_in.exercise_id,
+            order_index=exercise_in.order_index,
+            notes=exercise_in.notes,
+            sets=[ExerciseSet(**set_in.model_dump()) for set_in in exercise_in.sets],
+        )
+        self.db.add(workout_exercise)
+        self.db.flush()
+        return workout_exercise.id, workout_obj.id
+
+    def update_exercise_notes(self, operation: SyncOperationIn) -> Applied:
+        workout_exercise = self._workout_exercise(operation, open_only=False)
+        workout_exercise.notes = operation.data.get("notes", "")
+        return workout_exercise.id, workout_exercise.workout_id
+
+    def add_set(self, operation: SyncOperationIn) -> Applied:
+        workout_exercise = self._workout_exercise(operation, open_only=True)
+        set_in = ExerciseSetCreate.model_validate(operation.data)
+        exercise_set = ExerciseSet(
+            workout_exercise_id=workout_exercise.id, **set_in.model_dump()
+        )
+        self.db.add(exercise_set)
+        self.db.flush()
+        return exercise_set.id, workout_exercise.workout_id
+
+    def update_set(self, operation: SyncOperationIn) -> Applied:
+        exercise_set = self._set(operation, open_only=False)
+        set_in = ExerciseSetUpdate.model_validate(operation.data)
+        for field, value in set_in.model_dump(exclude_unset=True).items():
+            setattr(exercise_set, field, value)
+        workout_exercise = self.db.get(
+            WorkoutExercise, exercise_set.workout_exercise_id
+        )
+        if self.db.get(Workout, workout_exercise.workout_id).completed_at is not None:
+            self.db.flush()
+            exercise_stats.recompute(
+                self.db,
+                user_id=self.user_id,
+                exercise_ids=[workout_exercise.exercise_id],
+            )
+        return exercise_set.id, workout_exercise.workout_id
+
+    def delete_set(self, operation: SyncOperationIn) -> Applied:
+        exercise_set = self._set(operation, open_only=True)
+        set_id = exercise_set.id
+        workout_exercise = self.db.get(
+            WorkoutExercise, exercise_set.workout_exercise_id
+        )
+        self.db.delete(exercise_set)
+        self.db.flush()
+        self.deleted_sets.append(set_id)
+        return set_id, workout_exercise.workout_id
+
+
+class CRUDSyncOperation(CRUDBase[SyncOperation, SyncOperationIn, SyncOperationIn]):
+    """
+    Objeto CRUD para el modelo SyncOperation.
+    Aplica los registros de operaciones enviados por el cliente.
+    """
+
+    def apply(
+        self, db: Session, *, user_id: int, operations: List[SyncOperationIn]
+    ) -> Dict[str, Any]:
+        """
+        Aplica en orden las operaciones no aplicadas antes y confirma una vez.
+
+        Las operaciones cuya clave ya está registrada se omiten y se informan
+        como duplicadas. Si una operación falla se revierte todo el registro y
+        se lanza `ValueError` indicando su clave.
+        """
+        keys = [operation.key for operation in operations]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicate operation key in sync log")
+
+        referenced = set(keys)
+        for operation in operations:
+            referenced.update(
+                key
+                for key in (
+                    operation.workout_key,
+                    operation.workout_exercise_key,
+                    operation.set_key,
+                )
+                if key is not None
+            )
+        known = {
+            row.idempotency_key: row
+            for row in db.query(SyncOperation).filter(
+                SyncOperation.user_id == user_id,
+                SyncOperation.idempotency_key.in_(referenced),
+            )
+        }
+
+        batch = _SyncBatch(db, user_id)
+        for key, row in known.items():
+            batch.ids[key] = (row.operation, row.entity_id)
+
+        applied: List[str] = []
+        duplicates: List[str] = []
+        try:
+            for operation in operations:
+                if operation.key in known:
+                    duplicates.append(operation.key)
+                    if known[operation.key].workout_id is not None:
+                        batch.touched_workouts.add(known[operation.key].workout_id)
+                    continue
+                try:
+                    entity_id, workout_id = batch.apply(operation)
+                except ValueError as exc:
+                    raise ValueError(f"Operation '{operation.key}': {exc}") from exc
+                db.add(
+                    SyncOperation(
+                        user_id=user_id,
+                        idempotency_key=operation.key,
+                        operation=operation.type.value,
+                        entity_id=entity_id,
+                        workout_id=workout_id,
+                    )
+                )
+                applied.append(operation.key)
+
+            cutoff = datetime.now(timezone.utc) - timedelta(
+                days=settings.SYNC_KEY_RETENTION_DAYS
+            )
+            db.query(SyncOperation).filter(
+                SyncOperation.user_id == user_id, SyncOperation.created_at < cutoff
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        if batch.touched_workouts:
+            summary_cache.invalidate_group(user_id)
+
+        workouts = []
+        if batch.touched_workouts:
+            workouts = (
+                db.query(Workout)
+                .options(*workout_graph())
+                .filter(
+                    Workout.user_id == user_id,
+                    Workout.id.in_(batch.touched_workouts),
+                )
+                .order_by(Workout.id)
+                .all()
+            )
+        return {
+            "applied": applied,
+            "duplicates": duplicates,
+            "ids": {key: batch.ids[key][1] for key in keys},
+            "workouts": workouts,
+            "deleted_sets": batch.deleted_sets,
+        }
+
+
+sync_operation = CRUDSyncOperation(SyncOperation)
@@ -2,11 +2,21 @@
 
 from typing import Any, Dict, Optional, Union
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-
-from app.core.security import get_password_hash, verify_password
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.security import (
+    get_password_hash,
+    verify_password,
+    verify_password_async,
+)
 from app.crud.base import CRUDBase
 from app.models.user import User
+from app.models.exercise_stats import UserExerciseStats
+from app.models.sync import SyncOperation
 from app.models.workout import (
     ExerciseSet,
     Workout,
@@ -15,6 +25,23 @@ from app.models.workout import (
 )
 from app.schemas.user import UserCreate, UserUpdate
 
+# Columnas del usuario que se guardan en la caché de principales. Se excluye
+# `hashed_password` para no mantener credenciales en memoria.
+PRINCIPAL_FIELDS = (
+    "id",
+    "email",
+    "username",
+    "full_name",
+    "is_active",
+    "is_admin",
+    "created_at",
+    "updated_at",
+)
+
+principal_cache: TTLCache[int, Dict[str, Any]] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     """Métodos CRUD para el modelo User con acciones específicas."""
@@ -27,6 +54,23 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         """Obtiene un usuario por su nombre de usuario."""
         return db.query(User).filter(User.username == username).first()
 
+    def get_principal(self, db: Session, *, id: int) -> Optional[User]:
+        """
+        Obtiene el usuario autenticado desde la caché de principales.
+
+        En caso de acierto no se consulta la base de datos y se devuelve una
+        instancia transitoria de `User` (no asociada a la sesión), válida solo
+        para lectura. Para modificar el usuario se debe cargar con `get`.
+        """
+        snapshot = principal_cache.get(id)
+        if snapshot is None:
+            db_obj = self.get(db, id=id)
+            if not db_obj:
+                return None
+            snapshot = {field: getattr(db_obj, field) for field in PRINCIPAL_FIELDS}
+            principal_cache.set(id, snapshot)
+        return User(**snapshot)
+
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
         """Crea un nuevo usuario."""
         db_obj = User(
@@ -53,7 +97,9 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             hashed_password = get_password_hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        user_obj = super().update(db, db_obj=db_obj, obj_in=update_data)
+        principal_cache.invalidate(user_obj.id)
+        return user_obj
 
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
         """Autentica un usuario por correo electrónico y contraseña."""
@@ -64,6 +110,42 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             return None
         return user
 
+    async def authenticate_async(
+        self, db: Session, *, email: str, password: str
+    ) -> Optional[User]:
+        """
+        Igual que `authenticate`, para endpoints asíncronos.
+
+        La consulta se ejecuta en el threadpool y la verificación de bcrypt en
+        el pool de hashing, de modo que mientras espera turno no ocupa ningún
+        hilo que puedan necesitar otras peticiones.
+        """
+        user = await run_in_threadpool(self.get_by_email, db, email=email)
+        if not user:
+            return None
+        if not await verify_password_async(password, user.hashed_password):
+            return None
+        return user
+
+    def rehash_password(
+        self, db: Session, *, user_id: int, password: str, current_hash: str
+    ) -> bool:
+        """
+        Vuelve a calcular el hash de la contraseña con los parámetros vigentes.
+
+        Solo se guarda si el usuario conserva `current_hash`, para no pisar un
+        cambio de contraseña hecho mientras tanto. Devuelve si se actualizó.
+        """
+        new_hash = get_password_hash(password)
+        result = db.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == current_hash)
+            .values(hashed_password=new_hash),
+            execution_options={"synchronize_session": False},
+        )
+        db.commit()
+        return result.rowcount == 1
+
     def is_active(self, user: User) -> bool:
         """Verifica si un usuario está activo."""
         return user.is_active
@@ -101,11 +183,18 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db.query(WorkoutTemplate).filter(WorkoutTemplate.created_by == user_id).delete(
             synchronize_session=False
         )
+        db.query(SyncOperation).filter(SyncOperation.user_id == user_id).delete(
+            synchronize_session=False
+        )
+        db.query(UserExerciseStats).filter(UserExerciseStats.user_id == user_id).delete(
+            synchronize_session=False
+        )
 
         # 5. Finalmente, eliminar el usuario
         self.remove(db, id=user_id)
 
         db.commit()
+        principal_cache.invalidate(user_id)
 
 
 user = CRUDUser(User)
@@ -1,6 +1,16 @@
-from typing import List, Dict, Any
-from sqlalchemy.orm import Session, joinedload
-from app.crud.base import CRUDBase
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Union
+from sqlalchemy import and_, case, or_, delete, distinct, func, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from app.core.cache import GroupedTTLCache
+from app.core.config import settings
+from app.crud.base import CRUDBase, Page
+from app.crud.crud_exercise_stats import estimated_1rm, exercise_stats
+from app.crud.loaders import template_graph, workout_exercise_graph, workout_graph
+from app.models.exercise import Exercise
 from app.models.workout import (
     WorkoutTemplate,
     Workout,
@@ -15,6 +25,7 @@ from app.schemas.workout import (
     WorkoutUpdate,
     WorkoutExerciseCreate,
     ExerciseSetUpdate,
+    ExerciseSetBatch,
 )
 
 
@@ -68,14 +79,27 @@ class CRUDWorkoutTemplate(
             .all()
         )
 
+    def get_public_with_exercises(
+        self, db: Session, *, skip: int = 0, limit: int = 100
+    ) -> List[WorkoutTemplate]:
+        """
+        Pagina las plantillas públicas en la base de datos y carga los ejercicios
+        solo de la página devuelta, con una consulta adicional.
+        """
+        return (
+            db.query(WorkoutTemplate)
+            .options(*template_graph())
+            .filter(WorkoutTemplate.is_public)
+            .order_by(WorkoutTemplate.id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
     def get_with_exercises(self, db: Session, id: int) -> WorkoutTemplate:
         return (
             db.query(WorkoutTemplate)
-            .options(
-                joinedload(WorkoutTemplate.template_exercises).joinedload(
-                    WorkoutTemplateExercise.exercise
-                )
-            )
+            .options(*template_graph())
             .filter(WorkoutTemplate.id == id)
             .first()
         )
@@ -85,11 +109,7 @@ class CRUDWorkoutTemplate(
     ) -> List[WorkoutTemplate]:
         return (
             db.query(WorkoutTemplate)
-            .options(
-                joinedload(WorkoutTemplate.template_exercises).joinedload(
-                    WorkoutTemplateExercise.exercise
-                )
-            )
+            .options(*template_graph())
             .offset(skip)
             .limit(limit)
             .all()
@@ -160,6 +180,16 @@ class CRUDWorkoutTemplate(
         return template
 
 
+# Resúmenes de workouts completados, por workout_id y agrupados por usuario.
+# Las marcas personales de un resumen se comparan con los workouts anteriores
+# del usuario, así que cualquier cambio en su historial invalida el grupo
+# entero; los cambios en un workout abierto solo invalidan su entrada.
+summary_cache: GroupedTTLCache[int, int, Dict[str, Any]] = GroupedTTLCache(
+    maxsize=settings.WORKOUT_SUMMARY_CACHE_MAX_SIZE,
+    ttl=settings.WORKOUT_SUMMARY_CACHE_TTL_SECONDS,
+)
+
+
 class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
     def create_workout(self, db: Session, workout_data: Dict[str, Any]) -> Workout:
         """Crea un workout y lo agrega a la DB."""
@@ -175,122 +205,424 @@ class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
         return workout
 
     def get_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Workout]:
-        return (
-            db.query(Workout)
-            .filter(Workout.user_id == user_id)
-            .order_by(Workout.started_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        load_graph: bool = True,
+    ) -> Page:
+        """
+        Lista los workouts del usuario, del más reciente al más antiguo.
+
+        Con `load_graph` se cargan también ejercicios y series (una consulta por
+        nivel); sin él solo se leen las columnas del workout. La paginación por
+        cursor usa las claves (started_at, id).
+        """
+        query = db.query(Workout).filter(Workout.user_id == user_id)
+        if load_graph:
+            query = query.options(*workout_graph())
+        return self.paginate(
+            query,
+            keys=[Workout.started_at, Workout.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=True,
         )
 
     def get(self, db: Session, id: int) -> Workout:
         return (
-            db.query(Workout)
-            .options(
-                joinedload(Workout.workout_exercises).joinedload(
-                    WorkoutExercise.exercise
-                ),
-                joinedload(Workout.workout_exercises).joinedload(WorkoutExercise.sets),
+            db.query(Workout).options(*workout_graph()).filter(Workout.id == id).first()
+        )
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Workout,
+        obj_in: Union[WorkoutUpdate, Dict[str, Any]],
+    ) -> Workout:
+        """
+        Actualiza un workout e invalida su resumen.
+
+        Completar o reabrir el workout con `completed_at` mantiene las
+        estadísticas por ejercicio (ver `complete` y `reopen`). Los demás
+        campos y el cambio de estado se confirman en un único commit; si otra
+        petición completó o reabrió el workout entretanto no se guarda nada y
+        se lanza ValueError.
+        """
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        completing = "completed_at" in update_data and db_obj.completed_at is None
+        reopening = (
+            "completed_at" in update_data
+            and update_data["completed_at"] is None
+            and db_obj.completed_at is not None
+        )
+        completed_at = (
+            update_data.pop("completed_at") if completing or reopening else None
+        )
+
+        for field, value in update_data.items():
+            setattr(db_obj, field, value)
+        db.flush()
+        applied = True
+        if completing and completed_at is not None:
+            applied = (
+                self._mark_completed(db, id=db_obj.id, completed_at=completed_at)
+                is not None
             )
+        elif reopening:
+            applied = self._mark_reopened(db, id=db_obj.id) is not None
+        if not applied:
+            db.rollback()
+            raise ValueError("Workout was completed or reopened concurrently")
+        db.commit()
+        db.refresh(db_obj)
+        summary_cache.invalidate_group(db_obj.user_id)
+        return db_obj
+
+    def reopen(self, db: Session, *, id: int) -> bool:
+        """
+        Vuelve a abrir un workout completado y resta sus series de las
+        estadísticas, recalculando sus ejercicios. Devuelve False si el
+        workout ya estaba abierto.
+        """
+        user_id = self._mark_reopened(db, id=id)
+        if user_id is None:
+            db.rollback()
+            return False
+        db.commit()
+        summary_cache.invalidate_group(user_id)
+        return True
+
+    def _mark_completed(
+        self, db: Session, *, id: int, completed_at: Optional[datetime] = None
+    ) -> Optional[int]:
+        """
+        Completa un workout todavía abierto y suma sus series a las
+        estadísticas, sin confirmar la transacción. Devuelve el usuario del
+        workout, o None si ya estaba completado.
+        """
+        user_id = db.execute(
+            update(Workout)
+            .where(Workout.id == id, Workout.completed_at.is_(None))
+            .values(completed_at=completed_at or func.now())
+            .returning(Workout.user_id),
+            execution_options={"synchronize_session": False},
+        ).scalar_one_or_none()
+        if user_id is not None:
+            exercise_stats.apply_workout(db, workout_id=id)
+        return user_id
+
+    def _mark_reopened(self, db: Session, *, id: int) -> Optional[int]:
+        """
+        Reabre un workout completado y recalcula sus ejercicios en las
+        estadísticas, sin confirmar la transacción. Devuelve el usuario del
+        workout, o None si ya estaba abierto.
+        """
+        user_id = db.execute(
+            update(Workout)
+            .where(Workout.id == id, Workout.completed_at.isnot(None))
+            .values(completed_at=None)
+            .returning(Workout.user_id),
+            execution_options={"synchronize_session": False},
+        ).scalar_one_or_none()
+        if user_id is not None:
+            exercise_stats.recompute_workout(db, workout_id=id)
+        return user_id
+
+    def get_owner_state(self, db: Session, *, id: int) -> Optional[Row]:
+        """Obtiene solo (id, user_id, completed_at) de un workout, sin relaciones."""
+        return (
+            db.query(Workout.id, Workout.user_id, Workout.completed_at)
             .filter(Workout.id == id)
             .first()
         )
 
+    def update_columns(self, db: Session, *, id: int, values: Dict[str, Any]) -> None:
+        """Actualiza columnas de un workout con un único UPDATE, sin cargarlo."""
+        user_id = db.execute(
+            update(Workout)
+            .where(Workout.id == id)
+            .values(values)
+            .returning(Workout.user_id),
+            execution_options={"synchronize_session": False},
+        ).scalar_one_or_none()
+        db.commit()
+        if user_id is not None:
+            summary_cache.invalidate_group(user_id)
+
+    def complete(
+        self, db: Session, *, id: int, completed_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Marca un workout como completado y suma sus series a las estadísticas.
+
+        Ambos cambios se confirman en la misma transacción. El UPDATE solo
+        afecta a un workout todavía abierto, así que de dos peticiones
+        concurrentes solo una suma las estadísticas; la otra devuelve False.
+        """
+        user_id = self._mark_completed(db, id=id, completed_at=completed_at)
+        if user_id is None:
+            db.rollback()
+            return False
+        db.commit()
+        summary_cache.invalidate_group(user_id)
+        return True
+
     def get_active_by_user(self, db: Session, *, user_id: int) -> Workout:
         return (
             db.query(Workout)
-            .options(
-                joinedload(Workout.workout_exercises).joinedload(
-                    WorkoutExercise.exercise
-                ),
-                joinedload(Workout.workout_exercises).joinedload(WorkoutExercise.sets),
-            )
+            .options(*workout_graph())
             .filter(Workout.user_id == user_id, Workout.completed_at.is_(None))
             .first()
         )
 
-    def get_completed_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
-    ) -> List[Workout]:
+    def has_active_by_user(self, db: Session, *, user_id: int) -> bool:
+        """Indica si el usuario tiene un workout sin completar."""
         return (
+            db.query(Workout.id)
+            .filter(Workout.user_id == user_id, Workout.completed_at.is_(None))
+            .first()
+            is not None
+        )
+
+    def get_completed_by_user(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Page:
+        """
+        Lista los workouts completados, del más reciente al más antiguo.
+
+        La paginación por cursor usa las claves (completed_at, id).
+        """
+        return self.paginate(
             db.query(Workout)
-            .options(
-                joinedload(Workout.workout_exercises).joinedload(
-                    WorkoutExercise.exercise
-                ),
-                joinedload(Workout.workout_exercises).joinedload(WorkoutExercise.sets),
+            .options(*workout_graph())
+            .filter(Workout.user_id == user_id, Workout.completed_at.isnot(None)),
+            keys=[Workout.completed_at, Workout.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=True,
+        )
+
+    # Variantes asíncronas (routers en modo async, ver `ASYNC_ENDPOINTS`). Las
+    # lecturas emiten las mismas consultas con `select()`; las escrituras
+    # reutilizan la versión síncrona dentro de `AsyncSession.run_sync`.
+
+    async def get_async(self, db: AsyncSession, id: int) -> Optional[Workout]:
+        """Como `get`, con una sesión asíncrona."""
+        return await db.scalar(
+            select(Workout).options(*workout_graph()).where(Workout.id == id)
+        )
+
+    async def get_owner_state_async(
+        self, db: AsyncSession, *, id: int
+    ) -> Optional[Row]:
+        """Como `get_owner_state`, con una sesión asíncrona."""
+        result = await db.execute(
+            select(Workout.id, Workout.user_id, Workout.completed_at).where(
+                Workout.id == id
+            )
+        )
+        return result.first()
+
+    async def get_active_by_user_async(
+        self, db: AsyncSession, *, user_id: int
+    ) -> Optional[Workout]:
+        """Como `get_active_by_user`, con una sesión asíncrona."""
+        return await db.scalar(
+            select(Workout)
+            .options(*workout_graph())
+            .where(Workout.user_id == user_id, Workout.completed_at.is_(None))
+            .limit(1)
+        )
+
+    async def has_active_by_user_async(self, db: AsyncSession, *, user_id: int) -> bool:
+        """Como `has_active_by_user`, con una sesión asíncrona."""
+        active_id = await db.scalar(
+            select(Workout.id)
+            .where(Workout.user_id == user_id, Workout.completed_at.is_(None))
+            .limit(1)
+        )
+        return active_id is not None
+
+    async def get_by_user_async(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        load_graph: bool = True,
+    ) -> Page:
+        """Como `get_by_user`, con una sesión asíncrona."""
+        statement = select(Workout).where(Workout.user_id == user_id)
+        if load_graph:
+            statement = statement.options(*workout_graph())
+        return await self.paginate_async(
+            db,
+            statement,
+            keys=[Workout.started_at, Workout.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=True,
+        )
+
+    async def get_completed_by_user_async(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Page:
+        """Como `get_completed_by_user`, con una sesión asíncrona."""
+        return await self.paginate_async(
+            db,
+            select(Workout)
+            .options(*workout_graph())
+            .where(Workout.user_id == user_id, Workout.completed_at.isnot(None)),
+            keys=[Workout.completed_at, Workout.id],
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            descending=True,
+        )
+
+    async def complete_async(self, db: AsyncSession, *, id: int) -> bool:
+        """Como `complete`, con una sesión asíncrona."""
+        return await db.run_sync(lambda session: self.complete(session, id=id))
+
+    async def add_set_to_exercise_async(
+        self,
+        db: AsyncSession,
+        *,
+        workout_id: int,
+        exercise_id: int,
+        set_data: ExerciseSetUpdate,
+    ) -> ExerciseSet:
+        """Como `add_set_to_exercise`, con una sesión asíncrona."""
+        return await db.run_sync(
+            lambda session: self.add_set_to_exercise(
+                session,
+                workout_id=workout_id,
+                exercise_id=exercise_id,
+                set_data=set_data,
             )
-            .filter(Workout.user_id == user_id, Workout.completed_at.isnot(None))
-            .order_by(Workout.completed_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
 
     def add_exercises_from_template(
         self, db: Session, workout: Workout, template: WorkoutTemplate
     ) -> List[WorkoutExercise]:
-        """Agrega los ejercicios de un template al workout."""
-        workout_exercises = []
-        for template_exercise in template.template_exercises:
-            exercise = WorkoutExercise(
-                workout_id=workout.id,
-                exercise_id=template_exercise.exercise_id,
-                order_index=template_exercise.order_index,
-                notes=None,
-            )
-            db.add(exercise)
-            db.flush()
-            workout_exercises.append(exercise)
-        return workout_exercises
+        """Agrega los ejercicios de un template al workout en una sola sentencia."""
+        if not template.template_exercises:
+            return []
+        return list(
+            db.scalars(
+                insert(WorkoutExercise).returning(
+                    WorkoutExercise, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "workout_id": workout.id,
+                        "exercise_id": template_exercise.exercise_id,
+                        "order_index": template_exercise.order_index,
+                        "notes": None,
+                    }
+                    for template_exercise in template.template_exercises
+                ],
+            )
+        )
 
     def add_sets_for_exercises(
         self,
         db: Session,
         workout_exercises: List[WorkoutExercise],
         template: WorkoutTemplate,
-    ) -> None:
-        """Agrega los sets sugeridos a cada ejercicio del workout."""
-
-        for workout_exercise, template_exercise in zip(
-            workout_exercises, template.template_exercises
-        ):
-            suggested_sets = template_exercise.suggested_sets or 1
-            for set_number in range(1, suggested_sets + 1):
-                exercise_set = ExerciseSet(
-                    workout_exercise_id=workout_exercise.id,
-                    set_number=set_number,
-                    reps=template_exercise.suggested_reps,
-                    weight=template_exercise.suggested_weight,
-                    duration=template_exercise.suggested_duration,
-                    rest_duration=None,
-                    completed=False,
-                )
-                db.add(exercise_set)
-        db.commit()
+    ) -> List[ExerciseSet]:
+        """Agrega los sets sugeridos a cada ejercicio del workout en una sola sentencia."""
+        rows = [
+            {
+                "workout_exercise_id": workout_exercise.id,
+                "set_number": set_number,
+                "reps": template_exercise.suggested_reps,
+                "weight": template_exercise.suggested_weight,
+                "duration": template_exercise.suggested_duration,
+                "rest_duration": None,
+                "completed": False,
+            }
+            for workout_exercise, template_exercise in zip(
+                workout_exercises, template.template_exercises
+            )
+            for set_number in range(1, (template_exercise.suggested_sets or 1) + 1)
+        ]
+        if not rows:
+            return []
+        # El orden de RETURNING no importa aquí (se agrupan por ejercicio y
+        # número de serie), lo que permite a SQLite insertar en una sola sentencia.
+        return list(db.scalars(insert(ExerciseSet).returning(ExerciseSet), rows))
 
     def create_from_template(
         self, db: Session, *, template: WorkoutTemplate, workout_data: Dict[str, Any]
     ) -> Workout:
-        """Crea un workout a partir de un template, con ejercicios y sets."""
-        workout = self.create_workout(db, workout_data)
+        """
+        Crea un workout a partir de un template, con ejercicios y sets.
+
+        El workout, sus ejercicios y sus sets se insertan con una sentencia
+        `INSERT ... RETURNING` cada uno, y el grafo devuelto se arma con las
+        filas insertadas y los ejercicios ya cargados del template, sin volver
+        a consultarlo.
+        """
+        workout = db.scalars(
+            insert(Workout).returning(Workout),
+            [
+                {
+                    "user_id": workout_data["user_id"],
+                    "name": workout_data.get("name"),
+                    "notes": workout_data.get("notes"),
+                    "template_id": workout_data.get("template_id"),
+                }
+            ],
+        ).one()
         exercises = self.add_exercises_from_template(db, workout, template)
-        self.add_sets_for_exercises(db, exercises, template)
+        sets = self.add_sets_for_exercises(db, exercises, template)
 
-        return (
-            db.query(Workout)
-            .options(
-                joinedload(Workout.workout_exercises).joinedload(
-                    WorkoutExercise.exercise
-                ),
-                joinedload(Workout.workout_exercises).joinedload(WorkoutExercise.sets),
+        sets_by_exercise: Dict[int, List[ExerciseSet]] = {
+            workout_exercise.id: [] for workout_exercise in exercises
+        }
+        for exercise_set in sorted(sets, key=lambda item: item.set_number):
+            sets_by_exercise[exercise_set.workout_exercise_id].append(exercise_set)
+        for workout_exercise, template_exercise in zip(
+            exercises, template.template_exercises
+        ):
+            set_committed_value(
+                workout_exercise, "exercise", template_exercise.exercise
             )
-            .filter(Workout.id == workout.id)
-            .first()
-        )
+            set_committed_value(
+                workout_exercise, "sets", sets_by_exercise[workout_exercise.id]
+            )
+        set_committed_value(workout, "workout_exercises", exercises)
+
+        # El grafo ya está completo: se desacopla para que el commit no lo expire
+        db.expunge_all()
+        db.commit()
+        return workout
 
     def delete_sets_from_workout(
         self, db: Session, workout_exercise: WorkoutExercise
@@ -314,11 +646,14 @@ class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
         )
         self.delete_exercises_from_workout(db, workout_exercises)
 
-        workout_obj = self.get(db, id=workout_id)
-        if workout_obj:
-            db.delete(workout_obj)
+        user_id = db.execute(
+            delete(Workout).where(Workout.id == workout_id).returning(Workout.user_id),
+            execution_options={"synchronize_session": False},
+        ).scalar_one_or_none()
 
         db.commit()
+        if user_id is not None:
+            summary_cache.invalidate_group(user_id)
 
     def add_exercise_to_workout(
         self, db: Session, *, workout_id: int, exercise_data: WorkoutExerciseCreate
@@ -354,9 +689,7 @@ class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
         # Return with exercise relationship loaded
         return (
             db.query(WorkoutExercise)
-            .options(
-                joinedload(WorkoutExercise.exercise), joinedload(WorkoutExercise.sets)
-            )
+            .options(*workout_exercise_graph())
             .filter(WorkoutExercise.id == workout_exercise.id)
             .first()
         )
@@ -411,21 +744,36 @@ class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
         """Update an exercise set."""
         from app.models.workout import ExerciseSet
 
-        exercise_set = (
-            db.query(ExerciseSet)
+        found = (
+            db.query(
+                ExerciseSet,
+                WorkoutExercise.exercise_id,
+                Workout.user_id,
+                Workout.completed_at,
+            )
+            .select_from(ExerciseSet)
+            .join(
+                WorkoutExercise, ExerciseSet.workout_exercise_id == WorkoutExercise.id
+            )
+            .join(Workout, WorkoutExercise.workout_id == Workout.id)
             .filter(
-                ExerciseSet.id == set_id, ExerciseSet.workout_exercise_id == exercise_id
+                ExerciseSet.id == set_id,
+                ExerciseSet.workout_exercise_id == exercise_id,
+                WorkoutExercise.workout_id == workout_id,
             )
             .first()
         )
 
-        if not exercise_set:
+        if not found:
             raise ValueError("Exercise set not found")
+        exercise_set = found[0]
 
         for field, value in set_data.model_dump(exclude_unset=True).items():
             setattr(exercise_set, field, value)
+        self._recompute_stats_if_completed(db, found)
 
         db.commit()
+        summary_cache.invalidate_group(found.user_id)
         db.refresh(exercise_set)
         return exercise_set
 
@@ -435,72 +783,374 @@ class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
         """Delete an exercise set."""
         from app.models.workout import ExerciseSet
 
-        exercise_set = (
-            db.query(ExerciseSet)
+        found = (
+            db.query(
+                ExerciseSet,
+                WorkoutExercise.exercise_id,
+                Workout.user_id,
+                Workout.completed_at,
+            )
+            .select_from(ExerciseSet)
+            .join(
+                WorkoutExercise, ExerciseSet.workout_exercise_id == WorkoutExercise.id
+            )
+            .join(Workout, WorkoutExercise.workout_id == Workout.id)
             .filter(
-                ExerciseSet.id == set_id, ExerciseSet.workout_exercise_id == exercise_id
+                ExerciseSet.id == set_id,
+                ExerciseSet.workout_exercise_id == exercise_id,
+                WorkoutExercise.workout_id == workout_id,
             )
             .first()
         )
 
-        if not exercise_set:
+        if not found:
             raise ValueError("Exercise set not found")
+        exercise_set = found[0]
 
         db.delete(exercise_set)
+        self._recompute_stats_if_completed(db, found)
         db.commit()
+        summary_cache.invalidate_group(found.user_id)
 
-    def get_exercise_progression(
-        self, db: Session, *, user_id: int, exercise_id: int, limit: int = 10
-    ) -> list:
-        """Get exercise progression data for a user and exercise."""
-        from app.models.workout import WorkoutExercise
-        from sqlalchemy.orm import joinedload
+    def _recompute_stats_if_completed(self, db: Session, found: Row) -> None:
+        """Recalcula las estadísticas del ejercicio si el workout ya se completó."""
+        _, exercise_id, user_id, completed_at = found
+        if completed_at is not None:
+            db.flush()
+            exercise_stats.recompute(db, user_id=user_id, exercise_ids=[exercise_id])
+
+    def apply_set_batch(
+        self, db: Session, *, workout_id: int, batch: ExerciseSetBatch
+    ) -> Dict[str, List[Any]]:
+        """
+        Aplica un lote de creaciones, actualizaciones y borrados de series.
+
+        Todas las series deben pertenecer a ejercicios del workout indicado; si
+        alguna no existe se lanza `ValueError` sin modificar nada. Los cambios
+        se aplican con sentencias masivas y un único `commit`.
+        """
+        exercise_ids = {set_in.workout_exercise_id for set_in in batch.create}
+        if exercise_ids:
+            found = {
+                exercise_id
+                for (exercise_id,) in db.query(WorkoutExercise.id).filter(
+                    WorkoutExercise.workout_id == workout_id,
+                    WorkoutExercise.id.in_(exercise_ids),
+                )
+            }
+            if exercise_ids - found:
+                raise ValueError("Exercise not found in workout")
+
+        update_ids = [set_in.id for set_in in batch.update]
+        set_ids = set(update_ids) | set(batch.delete)
+        if set_ids:
+            found = {
+                set_id
+                for (set_id,) in db.query(ExerciseSet.id)
+                .join(WorkoutExercise)
+                .filter(
+                    WorkoutExercise.workout_id == workout_id,
+                    ExerciseSet.id.in_(set_ids),
+                )
+            }
+            if set_ids - found:
+                raise ValueError("Exercise set not found")
 
-        # Get previous completed workouts with this exercise
-        previous_workouts = (
-            db.query(WorkoutExercise)
-            .options(
-                joinedload(WorkoutExercise.workout), joinedload(WorkoutExercise.sets)
-            )
-            .join(Workout)
-            .filter(
-                Workout.user_id == user_id,
-                WorkoutExercise.exercise_id == exercise_id,
-                Workout.completed_at.isnot(None),
+        if batch.delete:
+            db.execute(
+                delete(ExerciseSet).where(ExerciseSet.id.in_(batch.delete)),
+                execution_options={"synchronize_session": False},
             )
-            .order_by(Workout.started_at.desc())
-            .limit(limit)
-            .all()
-        )
 
-        progression_data = []
-        for workout_exercise in previous_workouts:
-            workout_data = {
-                "workout_id": workout_exercise.workout_id,
-                "date": workout_exercise.workout.started_at,
-                "sets": [],
-            }
+        if batch.update:
+            db.execute(
+                update(ExerciseSet),
+                [set_in.model_dump(exclude_unset=True) for set_in in batch.update],
+            )
 
-            for exercise_set in workout_exercise.sets:
-                set_data = {
-                    "set_number": exercise_set.set_number,
-                    "reps": exercise_set.reps,
-                    "weight": exercise_set.weight,
-                    "duration": exercise_set.duration,
-                    "completed": exercise_set.completed,
-                }
-                workout_data["sets"].append(set_data)
+        created_ids: List[int] = []
+        if batch.create:
+            created_ids = list(
+                db.scalars(
+                    insert(ExerciseSet).returning(
+                        ExerciseSet.id, sort_by_parameter_order=True
+                    ),
+                    [set_in.model_dump() for set_in in batch.create],
+                    execution_options={"render_nulls": True},
+                )
+            )
 
-            progression_data.append(workout_data)
+        db.commit()
+        # Los lotes solo se aplican a workouts abiertos, que no cuentan como
+        # historial de los demás.
+        summary_cache.invalidate(workout_id)
+
+        # Una sola consulta para devolver el estado final de las series.
+        sets_by_id = {
+            exercise_set.id: exercise_set
+            for exercise_set in db.query(ExerciseSet).filter(
+                ExerciseSet.id.in_(created_ids + update_ids)
+            )
+        }
+        created = [sets_by_id[set_id] for set_id in created_ids]
+        updated = [sets_by_id[set_id] for set_id in update_ids]
+        return {"created": created, "updated": updated, "deleted": batch.delete}
 
-        return progression_data
+    def get_exercise_progression(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        exercise_id: int,
+        limit: int = 10,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Calcula en SQL la progresión de un ejercicio por sesión.
+
+        Considera las series completadas de los workouts completados del
+        usuario y devuelve, para las últimas `limit` sesiones dentro del rango
+        de fechas (en orden cronológico): la serie principal (mayor peso, luego
+        más repeticiones o duración), el volumen (reps × peso), las
+        repeticiones y la duración totales y el 1RM estimado (Epley). Solo se
+        transfiere una fila por sesión.
+        """
+        partition = {"partition_by": Workout.id}
+        filters = [
+            Workout.user_id == user_id,
+            Workout.completed_at.isnot(None),
+            WorkoutExercise.exercise_id == exercise_id,
+            ExerciseSet.completed.is_(True),
+        ]
+        if start_date is not None:
+            filters.append(Workout.started_at >= start_date)
+        if end_date is not None:
+            filters.append(Workout.started_at <= end_date)
+
+        ranked = (
+            select(
+                Workout.id.label("workout_id"),
+                Workout.started_at.label("date"),
+                ExerciseSet.id.label("set_id"),
+                ExerciseSet.set_number,
+                ExerciseSet.reps,
+                ExerciseSet.weight,
+                ExerciseSet.duration,
+                func.row_number()
+                .over(
+                    order_by=(
+                        func.coalesce(ExerciseSet.weight, 0).desc(),
+                        func.coalesce(ExerciseSet.reps, 0).desc(),
+                        func.coalesce(ExerciseSet.duration, 0).desc(),
+                        ExerciseSet.id,
+                    ),
+                    **partition,
+                )
+                .label("rank"),
+                func.count().over(**partition).label("set_count"),
+                func.sum(ExerciseSet.reps).over(**partition).label("total_reps"),
+                func.sum(ExerciseSet.reps * ExerciseSet.weight)
+                .over(**partition)
+                .label("total_volume"),
+                func.sum(ExerciseSet.duration)
+                .over(**partition)
+                .label("total_duration"),
+                func.max(ExerciseSet.reps).over(**partition).label("max_reps"),
+                func.max(estimated_1rm(ExerciseSet.reps, ExerciseSet.weight))
+                .over(**partition)
+                .label("estimated_1rm"),
+            )
+            .join(WorkoutExercise, WorkoutExercise.workout_id == Workout.id)
+            .join(ExerciseSet, ExerciseSet.workout_exercise_id == WorkoutExercise.id)
+            .where(*filters)
+            .subquery()
+        )
+        latest = (
+            select(ranked)
+            .where(ranked.c.rank == 1)
+            .order_by(ranked.c.date.desc(), ranked.c.workout_id.desc())
+            .limit(limit)
+        )
+        rows = db.execute(latest).mappings().all()
+
+        return [
+            {
+                "workout_id": row["workout_id"],
+                "date": row["date"],
+                "best_set": {
+                    "id": row["set_id"],
+                    "set_number": row["set_number"],
+                    "reps": row["reps"],
+                    "weight": row["weight"],
+                    "duration": row["duration"],
+                },
+                "set_count": row["set_count"],
+                "total_reps": row["total_reps"],
+                "total_volume": row["total_volume"],
+                "total_duration": row["total_duration"],
+                "max_reps": row["max_reps"],
+                "estimated_1rm": row["estimated_1rm"],
+            }
+            for row in reversed(rows)
+        ]
+
+    def get_summary(self, db: Session, *, id: int) -> Optional[Dict[str, Any]]:
+        """
+        Resume un workout con una única consulta agrupada por ejercicio.
+
+        Devuelve la duración, el número de ejercicios y series, el volumen
+        (reps × peso de las series completadas) por grupo muscular y las marcas
+        personales superadas respecto de los workouts completados anteriores.
+        El resultado de un workout completado se guarda en `summary_cache`.
+        """
+        cached = summary_cache.get(id)
+        if cached is not None:
+            return cached
+
+        current = aliased(Workout)
+        done = ExerciseSet.completed.is_(True)
+        prior = (
+            select(
+                WorkoutExercise.exercise_id,
+                func.max(ExerciseSet.weight).label("weight"),
+                func.max(ExerciseSet.reps).label("reps"),
+                func.max(estimated_1rm(ExerciseSet.reps, ExerciseSet.weight)).label(
+                    "estimated_1rm"
+                ),
+            )
+            .select_from(ExerciseSet)
+            .join(
+                WorkoutExercise, ExerciseSet.workout_exercise_id == WorkoutExercise.id
+            )
+            .join(Workout, WorkoutExercise.workout_id == Workout.id)
+            .join(
+                current,
+                and_(
+                    current.id == id,
+                    Workout.user_id == current.user_id,
+                    or_(
+                        Workout.started_at < current.started_at,
+                        and_(
+                            Workout.started_at == current.started_at,
+                            Workout.id < current.id,
+                        ),
+                    ),
+                ),
+            )
+            .where(Workout.completed_at.isnot(None), done)
+            .group_by(WorkoutExercise.exercise_id)
+            .subquery()
+        )
+        grouped = (
+            select(
+                Workout.id,
+                Workout.user_id,
+                Workout.name,
+                Workout.started_at,
+                Workout.completed_at,
+                WorkoutExercise.exercise_id,
+                Exercise.name.label("exercise_name"),
+                Exercise.muscle_group,
+                func.count(distinct(WorkoutExercise.id)).label("exercise_count"),
+                func.count(ExerciseSet.id).label("set_count"),
+                func.sum(case((done, 1), else_=0)).label("completed_sets"),
+                func.sum(
+                    case((done, ExerciseSet.reps * ExerciseSet.weight), else_=0)
+                ).label("volume"),
+                func.max(case((done, ExerciseSet.weight))).label("weight"),
+                func.max(case((done, ExerciseSet.reps))).label("reps"),
+                func.max(
+                    case((done, estimated_1rm(ExerciseSet.reps, ExerciseSet.weight)))
+                ).label("estimated_1rm"),
+                prior.c.weight.label("prior_weight"),
+                prior.c.reps.label("prior_reps"),
+                prior.c.estimated_1rm.label("prior_estimated_1rm"),
+            )
+            .select_from(Workout)
+            .outerjoin(WorkoutExercise, WorkoutExercise.workout_id == Workout.id)
+            .outerjoin(Exercise, Exercise.id == WorkoutExercise.exercise_id)
+            .outerjoin(
+                ExerciseSet, ExerciseSet.workout_exercise_id == WorkoutExercise.id
+            )
+            .outerjoin(prior, prior.c.exercise_id == WorkoutExercise.exercise_id)
+            .where(Workout.id == id)
+            .group_by(
+                Workout.id,
+                Workout.user_id,
+                Workout.name,
+                Workout.started_at,
+                Workout.completed_at,
+                WorkoutExercise.exercise_id,
+                Exercise.name,
+                Exercise.muscle_group,
+                prior.c.weight,
+                prior.c.reps,
+                prior.c.estimated_1rm,
+            )
+            .order_by(WorkoutExercise.exercise_id)
+        )
+        rows = db.execute(grouped).all()
+        if not rows:
+            return None
+
+        first = rows[0]
+        ended_at = first.completed_at
+        if ended_at is None:
+            ended_at = (
+                datetime.now(timezone.utc)
+                if first.started_at.tzinfo
+                else datetime.utcnow()
+            )
+        duration = int((ended_at - first.started_at).total_seconds())
+
+        muscle_groups: Dict[Optional[str], Dict[str, Any]] = {}
+        records = []
+        for row in rows:
+            if row.exercise_id is None:
+                continue
+            group = muscle_groups.setdefault(
+                row.muscle_group,
+                {"muscle_group": row.muscle_group, "volume": 0.0, "completed_sets": 0},
+            )
+            group["volume"] += row.volume or 0.0
+            group["completed_sets"] += row.completed_sets or 0
+            for record in ("weight", "reps", "estimated_1rm"):
+                value, previous = row._mapping[record], row._mapping[f"prior_{record}"]
+                if value is not None and previous is not None and value > previous:
+                    records.append(
+                        {
+                            "exercise_id": row.exercise_id,
+                            "exercise_name": row.exercise_name,
+                            "record": record,
+                            "value": value,
+                            "previous": previous,
+                        }
+                    )
+
+        summary = {
+            "workout_id": first.id,
+            "name": first.name,
+            "started_at": first.started_at,
+            "completed_at": first.completed_at,
+            "duration_seconds": duration,
+            "total_duration_minutes": duration // 60,
+            "total_exercises": sum(row.exercise_count for row in rows),
+            "total_sets": sum(row.set_count for row in rows),
+            "completed_sets": sum(row.completed_sets or 0 for row in rows),
+            "total_volume": sum(group["volume"] for group in muscle_groups.values()),
+            "volume_by_muscle_group": list(muscle_groups.values()),
+            "personal_records": records,
+        }
+        if first.completed_at is not None:
+            summary_cache.set_in_group(first.user_id, id, summary)
+        return summary
 
     def update_exercise_notes(
         self, db: Session, *, workout_id: int, exercise_id: int, notes: str
     ) -> WorkoutExercise:
         """Update notes for a workout exercise."""
         from app.models.workout import WorkoutExercise
-        from sqlalchemy.orm import joinedload
 
         workout_exercise = (
             db.query(WorkoutExercise)
@@ -521,9 +1171,7 @@ class CRUDWorkout(CRUDBase[Workout, WorkoutCreate, WorkoutUpdate]):
         # Return the exercise with relationships loaded for the response
         workout_exercise_with_exercise = (
             db.query(WorkoutExercise)
-            .options(
-                joinedload(WorkoutExercise.exercise), joinedload(WorkoutExercise.sets)
-            )
+            .options(*workout_exercise_graph())
             .filter(WorkoutExercise.id == exercise_id)
             .first()
         )
@@ -0,0 +1,61 @@
+"""
+Estrategias de carga de relaciones para las consultas CRUD.
+
+Cargar un workout con `joinedload` sobre dos colecciones anidadas produce un
+producto cartesiano: la base de datos devuelve una fila por cada serie con
+las columnas del workout y del ejercicio repetidas. Las estrategias
+`selectin` y `subquery` emiten, en cambio, una consulta por nivel de la
+relación, por lo que cada fila se transfiere una sola vez.
+
+La relación muchos-a-uno `WorkoutExercise.exercise` se mantiene con
+`joinedload`, ya que no multiplica filas.
+"""
+
+from typing import List
+
+from sqlalchemy.orm import joinedload, selectinload, subqueryload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.workout import (
+    Workout,
+    WorkoutExercise,
+    WorkoutTemplate,
+    WorkoutTemplateExercise,
+)
+
+COLLECTION_LOADERS = {
+    "selectin": selectinload,
+    "subquery": subqueryload,
+    "joined": joinedload,
+}
+DEFAULT_STRATEGY = "selectin"
+
+
+def workout_graph(strategy: str = DEFAULT_STRATEGY) -> List[LoaderOption]:
+    """Opciones para cargar un workout con sus ejercicios y series."""
+    load_collection = COLLECTION_LOADERS[strategy]
+    return [
+        load_collection(Workout.workout_exercises).options(
+            joinedload(WorkoutExercise.exercise),
+            load_collection(WorkoutExercise.sets),
+        )
+    ]
+
+
+def workout_exercise_graph(strategy: str = DEFAULT_STRATEGY) -> List[LoaderOption]:
+    """Opciones para cargar un ejercicio de un workout con su detalle y series."""
+    load_collection = COLLECTION_LOADERS[strategy]
+    return [
+        joinedload(WorkoutExercise.exercise),
+        load_collection(WorkoutExercise.sets),
+    ]
+
+
+def template_graph(strategy: str = DEFAULT_STRATEGY) -> List[LoaderOption]:
+    """Opciones para cargar una plantilla con sus ejercicios."""
+    load_collection = COLLECTION_LOADERS[strategy]
+    return [
+        load_collection(WorkoutTemplate.template_exercises).joinedload(
+            WorkoutTemplateExercise.exercise
+        )
+    ]
@@ -8,3 +8,5 @@ from app.models.workout import (
     WorkoutTemplate,
     WorkoutTemplateExercise,
 )
+from app.models.sync import SyncOperation
+from app.models.exercise_stats import UserExerciseStats
@@ -0,0 +1,201 @@
+"""
+Configuración y métricas del pool de conexiones.
+
+`engine_options` traduce los ajustes `DB_POOL_*` a argumentos de
+`create_engine`/`create_async_engine`:
+
+- Tamaño, desborde, tiempo de espera y reciclado del `QueuePool`. Con
+  `DB_MAX_CONNECTIONS` el presupuesto total de conexiones se reparte entre
+  los `WEB_CONCURRENCY` procesos de la API.
+- Comprobación de conexiones: `pre_ping` hace un `SELECT 1` en cada checkout;
+  `idle` solo comprueba las que llevan más de `DB_POOL_LIVENESS_INTERVAL`
+  segundos sin usarse, ahorrando el viaje de ida y vuelta en el caso común;
+  `none` no comprueba nada.
+
+`PoolMetrics` expone el estado del pool para diagnosticar si los picos de
+latencia vienen de esperar una conexión: conexiones en uso, desborde,
+tiempo de espera del checkout y edad de las conexiones.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import Settings
+
+LIVENESS_MODES = ("pre_ping", "idle", "none")
+
+
+class PoolMetrics:
+    """Contadores y medidores de un pool, actualizados por eventos del pool."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.pool: Optional[QueuePool] = None
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.liveness_failures = 0
+        self._created: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def observe_wait(self, seconds: float) -> None:
+        """Registra cuánto esperó un checkout por una conexión libre."""
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado actual del pool, para métricas."""
+        pool = self.pool
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - created for created in self._created.values()]
+            checkouts = self.checkouts
+            return {
+                "pool": self.name,
+                "size": pool.size() if pool is not None else 0,
+                "checked_out": pool.checkedout() if pool is not None else 0,
+                "checked_in": pool.checkedin() if pool is not None else 0,
+                "overflow": max(0, pool.overflow()) if pool is not None else 0,
+                "connections": len(ages),
+                "oldest_connection_seconds": max(ages, default=0.0),
+                "checkouts": checkouts,
+                "wait_seconds_avg": (
+                    self.wait_seconds_total / checkouts if checkouts else 0.0
+                ),
+                "wait_seconds_max": self.wait_seconds_max,
+                "liveness_failures": self.liveness_failures,
+            }
+
+    def attach(self, engine: Engine, *, liveness_interval: Optional[float]) -> None:
+        """Escucha los eventos del pool de `engine` (síncrono) y lo asocia."""
+        self.pool = engine.pool
+        engine.pool.metrics = self
+
+        # pylint: disable=unused-argument,unused-variable
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            with self._lock:
+                self._created[id(dbapi_connection)] = time.monotonic()
+
+        @event.listens_for(engine, "close")
+        def on_close(dbapi_connection, connection_record):
+            with self._lock:
+                self._created.pop(id(dbapi_connection), None)
+
+        @event.listens_for(engine, "close_detached")
+        def on_close_detached(dbapi_connection):
+            with self._lock:
+                self._created.pop(id(dbapi_connection), None)
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            if connection_record is not None:
+                connection_record.info["checked_in_at"] = time.monotonic()
+
+        if liveness_interval is None:
+            return
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            idle_since = connection_record.info.get("checked_in_at")
+            if idle_since is None or time.monotonic() - idle_since < liveness_interval:
+                return
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            except Exception as error:  # pylint: disable=broad-except
+                # El pool descarta la conexión y reintenta con una nueva.
+                self.liveness_failures += 1
+                raise exc.DisconnectionError() from error
+            finally:
+                try:
+                    cursor.close()
+                except Exception:  # pylint: disable=broad-except
+                    pass
+
+
+class _TimedCheckout:
+    """Mide el tiempo que cada checkout espera por una conexión del pool."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - start)
+
+    def recreate(self) -> Any:
+        # `engine.dispose()` sustituye el pool; el nuevo conserva las métricas.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """`QueuePool` que registra la espera de cada checkout."""
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """`AsyncAdaptedQueuePool` que registra la espera de cada checkout."""
+
+
+def pool_sizes(settings: Settings) -> Dict[str, int]:
+    """
+    Tamaño y desborde del pool de este proceso.
+
+    Con `DB_MAX_CONNECTIONS` cada proceso recibe su parte entera del total;
+    si no alcanza para una conexión por proceso se lanza `ValueError`.
+    """
+    pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    if settings.DB_MAX_CONNECTIONS:
+        per_worker = settings.DB_MAX_CONNECTIONS // settings.WEB_CONCURRENCY
+        if per_worker < 1:
+            raise ValueError(
+                f"DB_MAX_CONNECTIONS ({settings.DB_MAX_CONNECTIONS}) must be at "
+                f"least WEB_CONCURRENCY ({settings.WEB_CONCURRENCY}): every "
+                "process needs one connection"
+            )
+        pool_size = min(pool_size, per_worker)
+        max_overflow = per_worker - pool_size
+    return {"pool_size": pool_size, "max_overflow": max_overflow}
+
+
+def liveness_interval(settings: Settings) -> Optional[float]:
+    """Segundos de inactividad tras los que se comprueba una conexión, o None."""
+    if settings.DB_POOL_LIVENESS == "idle":
+        return float(settings.DB_POOL_LIVENESS_INTERVAL)
+    return None
+
+
+def engine_options(settings: Settings, url: str, *, async_: bool = False) -> dict:
+    """Argumentos de pool para crear un motor sobre `url`."""
+    if settings.DB_POOL_LIVENESS not in LIVENESS_MODES:
+        raise ValueError(f"DB_POOL_LIVENESS must be one of {LIVENESS_MODES}")
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_LIVENESS == "pre_ping"}
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        # SQLite en memoria usa su propio pool de una conexión.
+        return options
+    options.update(
+        poolclass=TimedAsyncQueuePool if async_ else TimedQueuePool,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        **pool_sizes(settings),
+    )
+    return options
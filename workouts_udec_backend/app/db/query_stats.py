@@ -0,0 +1,99 @@
+"""
+Conteo y tiempo de las sentencias SQL de cada petición.
+
+`instrument` registra hooks `before_cursor_execute`/`after_cursor_execute`
+en un motor. Mientras hay una petición en curso (`track`), cada sentencia
+suma al `QueryStats` de esa petición: número de sentencias, tiempo total en
+la base de datos y la sentencia más lenta.
+
+El `QueryStats` viaja en una `ContextVar`; los endpoints síncronos se
+ejecutan en el threadpool con una copia del contexto, que apunta al mismo
+objeto, así que sus sentencias también se cuentan.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Longitud máxima de la sentencia más lenta que se guarda para el log.
+STATEMENT_PREVIEW_LENGTH = 200
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Sentencias SQL ejecutadas durante una petición."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def observe(self, statement: str, seconds: float) -> None:
+        """Suma una sentencia y su duración."""
+        with self._lock:
+            self.statements += 1
+            self.db_seconds += seconds
+            if seconds > self.slowest_seconds:
+                self.slowest_seconds = seconds
+                self.slowest_statement = " ".join(statement.split())[
+                    :STATEMENT_PREVIEW_LENGTH
+                ]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Resumen para el log estructurado."""
+        with self._lock:
+            return {
+                "db_statements": self.statements,
+                "db_ms": round(self.db_seconds * 1000, 3),
+                "db_slowest_ms": round(self.slowest_seconds * 1000, 3),
+                "db_slowest_statement": self.slowest_statement,
+            }
+
+
+def current() -> Optional[QueryStats]:
+    """Estadísticas de la petición en curso, o None fuera de una petición."""
+    return _current.get()
+
+
+@contextmanager
+def track() -> Iterator[QueryStats]:
+    """Cuenta las sentencias ejecutadas dentro del bloque."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def instrument(engine: Engine) -> None:
+    """Registra los hooks de conteo en `engine` (síncrono)."""
+
+    # pylint: disable=unused-argument,unused-variable
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.observe(statement, time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # Una sentencia que falla no llega a after_cursor_execute.
+        connection = context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
@@ -0,0 +1,148 @@
+"""
+Enrutado de lecturas a réplicas de la base de datos.
+
+`ReadRouter` reparte las sesiones de solo lectura entre las réplicas en
+round-robin. Una réplica cuya conexión falla se marca como caída durante
+`DATABASE_REPLICA_RETRY_SECONDS` y se salta; si no queda ninguna disponible,
+la lectura va a la primaria. Sin réplicas configuradas todas las sesiones
+son de la primaria.
+
+Las réplicas pueden ir ligeramente por detrás de la primaria, por eso solo
+se usan en endpoints que toleran ese retraso (`dependencies.get_read_db`).
+`AsyncReadRouter` hace lo mismo con sesiones asíncronas para los endpoints
+`async def` (`dependencies.get_async_read_db`).
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+class _ReplicaSelector:
+    """Réplicas caídas y turno del round-robin, comunes a ambos enrutadores."""
+
+    def __init__(self, replica_count: int, *, retry_seconds: float) -> None:
+        self.retry_seconds = retry_seconds
+        self._replica_count = replica_count
+        self._down_until: Dict[int, float] = {}
+        self._cycle = itertools.cycle(range(replica_count))
+        self._lock = threading.Lock()
+
+    def mark_down(self, index: int) -> None:
+        """Excluye una réplica durante `retry_seconds`."""
+        with self._lock:
+            self._down_until[index] = time.monotonic() + self.retry_seconds
+        logger.warning(
+            "Read replica %d marked down for %.0fs", index, self.retry_seconds
+        )
+
+    def healthy(self) -> List[bool]:
+        """Estado de cada réplica, en el orden de configuración."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                self._down_until.get(index, 0.0) <= now
+                for index in range(self._replica_count)
+            ]
+
+    def _candidates(self) -> List[int]:
+        """Réplicas sanas, empezando por la siguiente del round-robin."""
+        if not self._replica_count:
+            return []
+        now = time.monotonic()
+        with self._lock:
+            start = next(self._cycle)
+            order = [
+                (start + offset) % self._replica_count
+                for offset in range(self._replica_count)
+            ]
+            return [index for index in order if self._down_until.get(index, 0.0) <= now]
+
+    def _watch(self, index: int, engine: Engine) -> None:
+        """Marca la réplica como caída si una consulta pierde la conexión."""
+
+        @event.listens_for(engine, "handle_error")
+        def on_error(context):  # pylint: disable=unused-variable
+            if context.is_disconnect:
+                self.mark_down(index)
+
+
+class ReadRouter(_ReplicaSelector):
+    """Elige la base para cada sesión de lectura, con conmutación por fallo."""
+
+    def __init__(
+        self,
+        primary: sessionmaker,
+        replicas: List[Engine],
+        *,
+        retry_seconds: float,
+    ) -> None:
+        super().__init__(len(replicas), retry_seconds=retry_seconds)
+        self.primary = primary
+        self.replicas = replicas
+        # Las sesiones de réplica usan las mismas opciones que las de la primaria.
+        options = {key: value for key, value in primary.kw.items() if key != "bind"}
+        self._factories = [sessionmaker(bind=engine, **options) for engine in replicas]
+        for index, engine in enumerate(replicas):
+            self._watch(index, engine)
+
+    def session(self) -> Session:
+        """
+        Abre una sesión de lectura en la siguiente réplica sana.
+
+        La conexión se obtiene de inmediato para detectar una réplica caída
+        antes de que la use el endpoint.
+        """
+        for index in self._candidates():
+            db = self._factories[index]()
+            try:
+                db.connection()
+            except exc.DBAPIError:
+                db.close()
+                self.mark_down(index)
+                continue
+            return db
+        return self.primary()
+
+
+class AsyncReadRouter(_ReplicaSelector):
+    """Como `ReadRouter`, con sesiones asíncronas."""
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replicas: List[AsyncEngine],
+        *,
+        retry_seconds: float,
+    ) -> None:
+        super().__init__(len(replicas), retry_seconds=retry_seconds)
+        self.primary = primary
+        self.replicas = replicas
+        options = {key: value for key, value in primary.kw.items() if key != "bind"}
+        self._factories = [
+            async_sessionmaker(bind=engine, **options) for engine in replicas
+        ]
+        for index, engine in enumerate(replicas):
+            self._watch(index, engine.sync_engine)
+
+    async def session(self) -> AsyncSession:
+        """Abre una sesión asíncrona de lectura en la siguiente réplica sana."""
+        for index in self._candidates():
+            db = self._factories[index]()
+            try:
+                await db.connection()
+            except exc.DBAPIError:
+                await db.close()
+                self.mark_down(index)
+                continue
+            return db
+        return self.primary()
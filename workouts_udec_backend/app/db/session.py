@@ -1,6 +1,80 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+from app.core.config import async_url, settings
+from app.db import query_stats
+from app.db.pool import PoolMetrics, engine_options, liveness_interval
+from app.db.replicas import AsyncReadRouter, ReadRouter
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+engine = create_engine(
+    settings.database_url, **engine_options(settings, settings.database_url)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Métricas de cada pool, por nombre, para exportarlas.
+pool_metrics = {"primary": PoolMetrics("primary")}
+pool_metrics["primary"].attach(engine, liveness_interval=liveness_interval(settings))
+query_stats.instrument(engine)
+
+replica_engines = []
+for index, replica_url in enumerate(settings.DATABASE_REPLICA_URLS):
+    replica_engine = create_engine(replica_url, **engine_options(settings, replica_url))
+    pool_metrics[f"replica-{index}"] = PoolMetrics(f"replica-{index}")
+    pool_metrics[f"replica-{index}"].attach(
+        replica_engine, liveness_interval=liveness_interval(settings)
+    )
+    query_stats.instrument(replica_engine)
+    replica_engines.append(replica_engine)
+read_router = ReadRouter(
+    SessionLocal,
+    replica_engines,
+    retry_seconds=settings.DATABASE_REPLICA_RETRY_SECONDS,
+)
+
+# Motor asíncrono, solo con ASYNC_ENDPOINTS para no exigir asyncpg en los
+# despliegues que no lo usan. `expire_on_commit=False` evita recargas
+# implícitas (no permitidas en asyncio) al serializar tras un commit.
+async_engine = (
+    create_async_engine(
+        settings.async_database_url,
+        **engine_options(settings, settings.async_database_url, async_=True),
+    )
+    if settings.ASYNC_ENDPOINTS
+    else None
+)
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+if async_engine is not None:
+    pool_metrics["async"] = PoolMetrics("async")
+    pool_metrics["async"].attach(
+        async_engine.sync_engine, liveness_interval=liveness_interval(settings)
+    )
+    query_stats.instrument(async_engine.sync_engine)
+
+# Las réplicas también se leen desde los endpoints async, con su propio motor
+# asíncrono por réplica.
+async_replica_engines = []
+if async_engine is not None:
+    for index, replica_url in enumerate(settings.DATABASE_REPLICA_URLS):
+        replica_url = async_url(replica_url)
+        replica_engine = create_async_engine(
+            replica_url, **engine_options(settings, replica_url, async_=True)
+        )
+        pool_metrics[f"async-replica-{index}"] = PoolMetrics(f"async-replica-{index}")
+        pool_metrics[f"async-replica-{index}"].attach(
+            replica_engine.sync_engine, liveness_interval=liveness_interval(settings)
+        )
+        query_stats.instrument(replica_engine.sync_engine)
+        async_replica_engines.append(replica_engine)
+async_read_router = (
+    AsyncReadRouter(
+        AsyncSessionLocal,
+        async_replica_engines,
+        retry_seconds=settings.DATABASE_REPLICA_RETRY_SECONDS,
+    )
+    if AsyncSessionLocal is not None
+    else None
+)
@@ -6,7 +6,7 @@ incluyendo sus columnas, tipos de datos y relaciones.
 """
 
 import enum
-from sqlalchemy import Column, Integer, String, Boolean, Text, Enum
+from sqlalchemy import Column, Integer, String, Boolean, Text, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy import DateTime
 from app.db.base_class import Base
@@ -34,6 +34,16 @@ class Exercise(Base):
     """
 
     __tablename__ = "exercises"
+    __table_args__ = (
+        # Índice de trigramas (pg_trgm) para la búsqueda por nombre con
+        # ILIKE y similitud; solo existe en PostgreSQL.
+        Index(
+            "ix_exercises_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
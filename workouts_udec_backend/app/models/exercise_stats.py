@@ -0,0 +1,37 @@
+"""
+Este módulo define el modelo de la base de datos para las estadísticas por ejercicio.
+
+Utiliza SQLAlchemy para declarar la tabla 'user_exercise_stats', un resumen
+por usuario y ejercicio que se mantiene al completar workouts, de modo que las
+marcas personales y la última vez que se hizo un ejercicio se lean con una
+búsqueda por clave primaria.
+"""
+
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+
+# pylint: disable=too-few-public-methods
+class UserExerciseStats(Base):
+    """
+    Representa el resumen histórico de un ejercicio para un usuario.
+
+    Se calcula sobre las series completadas de los workouts completados: mejor
+    peso, más repeticiones, mejor 1RM estimado, volumen acumulado (reps ×
+    peso), número de sesiones y fecha de la última sesión.
+    """
+
+    __tablename__ = "user_exercise_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), primary_key=True)
+    best_weight = Column(Float, nullable=True)
+    best_reps = Column(Integer, nullable=True)
+    best_estimated_1rm = Column(Float, nullable=True)
+    total_volume = Column(Float, nullable=False, default=0)
+    session_count = Column(Integer, nullable=False, default=0)
+    last_performed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,38 @@
+"""
+Este módulo define el modelo de la base de datos para la sincronización offline.
+
+Utiliza SQLAlchemy para declarar la tabla 'sync_operations', que registra las
+claves de idempotencia de las operaciones ya aplicadas por cada usuario.
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+
+# pylint: disable=too-few-public-methods
+class SyncOperation(Base):
+    """
+    Representa una operación de sincronización ya aplicada.
+
+    La clave de idempotencia la genera el cliente y es única por usuario; si la
+    misma operación llega de nuevo (por un reintento), se reconoce como
+    duplicada y no se vuelve a aplicar. Se guarda el ID de la entidad creada o
+    modificada y el workout afectado para poder responder igual que la primera
+    vez.
+    """
+
+    __tablename__ = "sync_operations"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "idempotency_key", name="uq_sync_operations_user_id_key"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    idempotency_key = Column(String(64), nullable=False)
+    operation = Column(String(32), nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    workout_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -9,6 +9,8 @@ from sqlalchemy import (
     Text,
     Float,
     Boolean,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -23,11 +25,20 @@ class WorkoutTemplate(Base):
     """
 
     __tablename__ = "workout_templates"
+    __table_args__ = (
+        # Índice parcial para listar y paginar solo las plantillas públicas.
+        Index(
+            "ix_workout_templates_public",
+            "id",
+            postgresql_where=text("is_public"),
+            sqlite_where=text("is_public = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     is_public = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -48,7 +59,9 @@ class WorkoutTemplateExercise(Base):
     __tablename__ = "workout_template_exercises"
 
     id = Column(Integer, primary_key=True, index=True)
-    template_id = Column(Integer, ForeignKey("workout_templates.id"), nullable=False)
+    template_id = Column(
+        Integer, ForeignKey("workout_templates.id"), nullable=False, index=True
+    )
     exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=False)
     order_index = Column(Integer, nullable=False)
     suggested_sets = Column(Integer, nullable=True)
@@ -68,6 +81,19 @@ class Workout(Base):
     """
 
     __tablename__ = "workouts"
+    __table_args__ = (
+        # Historial completo y workouts completados, ordenados por fecha.
+        Index("ix_workouts_user_id_started_at", "user_id", "started_at"),
+        Index("ix_workouts_user_id_completed_at", "user_id", "completed_at"),
+        # Un usuario solo puede tener un workout activo a la vez.
+        Index(
+            "uq_workouts_user_id_active",
+            "user_id",
+            unique=True,
+            postgresql_where=text("completed_at IS NULL"),
+            sqlite_where=text("completed_at IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -90,9 +116,15 @@ class WorkoutExercise(Base):
     """
 
     __tablename__ = "workout_exercises"
+    __table_args__ = (
+        # Progresión de un ejercicio a través de los workouts del usuario.
+        Index(
+            "ix_workout_exercises_exercise_id_workout_id", "exercise_id", "workout_id"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=False)
+    workout_id = Column(Integer, ForeignKey("workouts.id"), nullable=False, index=True)
     exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=False)
     order_index = Column(Integer, nullable=False)
     notes = Column(Text, nullable=True)
@@ -113,7 +145,7 @@ class ExerciseSet(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     workout_exercise_id = Column(
-        Integer, ForeignKey("workout_exercises.id"), nullable=False
+        Integer, ForeignKey("workout_exercises.id"), nullable=False, index=True
     )
     set_number = Column(Integer, nullable=False)
     reps = Column(Integer, nullable=True)
@@ -7,7 +7,7 @@ relacionadas con los ejercicios.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from app.models.exercise import ExerciseType
 
@@ -88,3 +88,35 @@ class Exercise(ExerciseInDBBase):
     desde la API al cliente. Contiene la representación completa de un
     ejercicio almacenado.
     """
+
+
+# pylint: disable=too-few-public-methods
+class FacetCount(BaseModel):
+    """Número de ejercicios que tienen un valor concreto en un campo."""
+
+    value: str
+    count: int
+
+
+# pylint: disable=too-few-public-methods
+class ExerciseFacets(BaseModel):
+    """
+    Conteos por valor de cada campo filtrable de una búsqueda.
+
+    Los conteos de un campo aplican todos los filtros salvo el de ese mismo
+    campo, para que el cliente pueda mostrar cuántos resultados daría cambiar
+    de opción.
+    """
+
+    muscle_group: List[FacetCount] = []
+    equipment: List[FacetCount] = []
+    exercise_type: List[FacetCount] = []
+
+
+# pylint: disable=too-few-public-methods
+class ExerciseSearchResult(BaseModel):
+    """Esquema para una página de resultados de búsqueda de ejercicios."""
+
+    items: List[Exercise]
+    total: int
+    facets: ExerciseFacets
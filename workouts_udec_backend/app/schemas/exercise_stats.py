@@ -0,0 +1,33 @@
+"""
+Módulo que define los esquemas (schemas) de Pydantic para las estadísticas por ejercicio.
+
+Representan el resumen histórico de un ejercicio para el usuario: marcas
+personales, volumen acumulado, número de sesiones y última vez realizado.
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+# pylint: disable=too-few-public-methods
+class ExerciseStats(BaseModel):
+    """
+    Esquema para las estadísticas de un ejercicio de un usuario.
+
+    Se calcula sobre las series completadas de los workouts completados.
+    """
+
+    user_id: int
+    exercise_id: int
+    best_weight: Optional[float] = None
+    best_reps: Optional[int] = None
+    best_estimated_1rm: Optional[float] = None
+    total_volume: float = 0
+    session_count: int = 0
+    last_performed_at: Optional[datetime] = None
+
+    class Config:
+        """Configuración del modelo Pydantic."""
+
+        from_attributes = True
@@ -0,0 +1,75 @@
+"""
+Módulo que define los esquemas (schemas) de Pydantic para la sincronización offline.
+
+El cliente acumula las operaciones que realiza sin conexión (crear un workout,
+añadir ejercicios, registrar series, editar notas...) y las envía en orden en
+un único `SyncRequest`. Cada operación lleva una clave de idempotencia generada
+por el cliente, de modo que los reintentos no duplican datos.
+
+Las operaciones pueden referirse a entidades ya existentes por su ID
+(`workout_id`, `workout_exercise_id`, `set_id`) o a entidades creadas por una
+operación anterior por la clave de esa operación (`workout_key`,
+`workout_exercise_key`, `set_key`).
+"""
+
+import enum
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+from app.schemas.workout import Workout
+
+
+class SyncOperationType(str, enum.Enum):
+    """Tipos de operación admitidos por la sincronización."""
+
+    CREATE_WORKOUT = "create_workout"
+    COMPLETE_WORKOUT = "complete_workout"
+    UPDATE_WORKOUT_NOTES = "update_workout_notes"
+    ADD_EXERCISE = "add_exercise"
+    UPDATE_EXERCISE_NOTES = "update_exercise_notes"
+    ADD_SET = "add_set"
+    UPDATE_SET = "update_set"
+    DELETE_SET = "delete_set"
+
+
+# pylint: disable=too-few-public-methods
+class SyncOperationIn(BaseModel):
+    """
+    Esquema para una operación del registro enviado por el cliente.
+
+    `data` contiene los campos de la operación con el mismo formato que el
+    endpoint equivalente (por ejemplo, `ExerciseSetCreate` para `add_set`).
+    """
+
+    key: str = Field(min_length=1, max_length=64)
+    type: SyncOperationType
+    workout_id: Optional[int] = None
+    workout_key: Optional[str] = None
+    workout_exercise_id: Optional[int] = None
+    workout_exercise_key: Optional[str] = None
+    set_id: Optional[int] = None
+    set_key: Optional[str] = None
+    data: Dict[str, Any] = {}
+
+
+# pylint: disable=too-few-public-methods
+class SyncRequest(BaseModel):
+    """Esquema para el registro ordenado de operaciones a sincronizar."""
+
+    operations: List[SyncOperationIn]
+
+
+# pylint: disable=too-few-public-methods
+class SyncResult(BaseModel):
+    """
+    Esquema para la respuesta de una sincronización.
+
+    Incluye qué claves se aplicaron y cuáles ya se habían aplicado antes, el
+    ID de servidor de la entidad asociada a cada clave, el estado final de los
+    workouts afectados y las series borradas.
+    """
+
+    applied: List[str] = []
+    duplicates: List[str] = []
+    ids: Dict[str, Optional[int]] = {}
+    workouts: List[Workout] = []
+    deleted_sets: List[int] = []
@@ -166,6 +166,48 @@ class ExerciseSet(ExerciseSetBase):
         from_attributes = True
 
 
+class ExerciseSetBatchCreate(ExerciseSetCreate):
+    """Serie nueva dentro de un lote, indicando el ejercicio del workout."""
+
+    workout_exercise_id: int
+
+
+class ExerciseSetBatchUpdate(ExerciseSetUpdate):
+    """Cambios parciales a una serie existente dentro de un lote."""
+
+    id: int
+
+
+# pylint: disable=too-few-public-methods
+class ExerciseSetBatch(BaseModel):
+    """
+    Esquema para registrar varias series de un workout en una sola operación.
+
+    Las series pueden pertenecer a distintos ejercicios del mismo workout. Se
+    aplican primero los borrados, luego las actualizaciones y por último las
+    creaciones, todo en una única transacción.
+    """
+
+    create: List[ExerciseSetBatchCreate] = []
+    update: List[ExerciseSetBatchUpdate] = []
+    delete: List[int] = []
+
+
+class WorkoutExerciseSet(ExerciseSet):
+    """Serie leída desde la base de datos junto al ejercicio al que pertenece."""
+
+    workout_exercise_id: int
+
+
+# pylint: disable=too-few-public-methods
+class ExerciseSetBatchResult(BaseModel):
+    """Resultado de aplicar un lote: series creadas, actualizadas y borradas."""
+
+    created: List[WorkoutExerciseSet] = []
+    updated: List[WorkoutExerciseSet] = []
+    deleted: List[int] = []
+
+
 # pylint: disable=too-few-public-methods
 class WorkoutExerciseBase(BaseModel):
     """
@@ -281,3 +323,102 @@ class Workout(WorkoutBase):
         """Configuración del modelo Pydantic."""
 
         from_attributes = True
+
+
+# pylint: disable=too-few-public-methods
+class ProgressionSet(BaseModel):
+    """Serie principal (la de mayor peso) de una sesión."""
+
+    id: int
+    set_number: int
+    reps: Optional[int] = None
+    weight: Optional[float] = None
+    duration: Optional[int] = None
+
+
+# pylint: disable=too-few-public-methods
+class ProgressionSession(BaseModel):
+    """
+    Esquema con los agregados de un ejercicio en una sesión de entrenamiento.
+
+    El volumen es la suma de repeticiones × peso y el 1RM estimado usa la
+    fórmula de Epley sobre la mejor serie.
+    """
+
+    workout_id: int
+    date: datetime
+    best_set: ProgressionSet
+    set_count: int
+    total_reps: Optional[int] = None
+    total_volume: Optional[float] = None
+    total_duration: Optional[int] = None
+    max_reps: Optional[int] = None
+    estimated_1rm: Optional[float] = None
+
+
+# pylint: disable=too-few-public-methods
+class PersonalRecords(BaseModel):
+    """Mejores marcas dentro de las sesiones devueltas."""
+
+    max_weight: Optional[float] = None
+    max_reps: Optional[int] = None
+    max_duration: Optional[int] = None
+    max_volume: Optional[float] = None
+    max_estimated_1rm: Optional[float] = None
+
+
+# pylint: disable=too-few-public-methods
+class ExerciseProgression(BaseModel):
+    """
+    Esquema para la progresión de un ejercicio a lo largo de las sesiones.
+
+    Las sesiones se ordenan de la más antigua a la más reciente.
+    """
+
+    exercise_id: int
+    exercise: Exercise
+    sessions: List[ProgressionSession] = []
+    personal_records: PersonalRecords
+
+
+# pylint: disable=too-few-public-methods
+class MuscleGroupVolume(BaseModel):
+    """Volumen y series completadas de un grupo muscular en una sesión."""
+
+    muscle_group: Optional[str] = None
+    volume: float = 0
+    completed_sets: int = 0
+
+
+# pylint: disable=too-few-public-methods
+class SessionRecord(BaseModel):
+    """Marca personal superada en una sesión respecto de las anteriores."""
+
+    exercise_id: int
+    exercise_name: str
+    record: str
+    value: float
+    previous: float
+
+
+# pylint: disable=too-few-public-methods
+class WorkoutSummary(BaseModel):
+    """
+    Esquema con el resumen agregado de una sesión de entrenamiento.
+
+    No incluye los ejercicios ni las series; solo los totales, el volumen por
+    grupo muscular y las marcas personales conseguidas.
+    """
+
+    workout_id: int
+    name: Optional[str] = None
+    started_at: datetime
+    completed_at: Optional[datetime] = None
+    duration_seconds: int
+    total_duration_minutes: int
+    total_exercises: int
+    total_sets: int
+    completed_sets: int
+    total_volume: float
+    volume_by_muscle_group: List[MuscleGroupVolume] = []
+    personal_records: List[SessionRecord] = []
@@ -0,0 +1,51 @@
+"""
+Compara dos ficheros de resultados de `pytest benchmarks`.
+
+Muestra, por endpoint, la latencia p50/p95 y el máximo de sentencias SQL de
+cada ejecución y la variación entre ambas.
+
+Uso:
+    python -m benchmarks.compare benchmarks/results/antes.json benchmarks/results/despues.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def _delta(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    """Imprime la tabla comparativa."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("before", type=Path)
+    parser.add_argument("after", type=Path)
+    args = parser.parse_args()
+
+    before = json.loads(args.before.read_text())["endpoints"]
+    after = json.loads(args.after.read_text())["endpoints"]
+
+    print(
+        f"{'endpoint':<16} {'p50 ms':>17} {'Δ p50':>8} "
+        f"{'p95 ms':>17} {'Δ p95':>8} {'statements':>11}"
+    )
+    for name in sorted(set(before) | set(after)):
+        if name not in before or name not in after:
+            print(f"{name:<16} only in {'after' if name in after else 'before'}")
+            continue
+        old, new = before[name], after[name]
+        p50 = (old["latency_ms"]["p50"], new["latency_ms"]["p50"])
+        p95 = (old["latency_ms"]["p95"], new["latency_ms"]["p95"])
+        statements = f"{old['statements']['max']} → {new['statements']['max']}"
+        print(
+            f"{name:<16} {p50[0]:>8.2f} → {p50[1]:>6.2f} {_delta(*p50):>8} "
+            f"{p95[0]:>8.2f} → {p95[1]:>6.2f} {_delta(*p95):>8} {statements:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
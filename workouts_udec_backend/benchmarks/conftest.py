@@ -0,0 +1,157 @@
+"""
+Fixtures de la suite de benchmarks de endpoints (`pytest benchmarks`).
+
+La API se levanta con `TestClient` sobre una base desechable:
+
+- Por defecto, un fichero SQLite temporal con el esquema creado desde los
+  modelos.
+- Con `BENCHMARK_DATABASE_URL`, una base PostgreSQL local. Debe ser una base
+  vacía de usar y tirar: la suite crea las tablas al empezar y las elimina al
+  terminar.
+
+El volumen de datos y las iteraciones se ajustan con `BENCHMARK_USERS`,
+`BENCHMARK_WORKOUTS_PER_USER` (uno cada dos días; 365 ≈ dos años),
+`BENCHMARK_ITERATIONS` y `BENCHMARK_LOGIN_ITERATIONS`. Los resultados se
+guardan en JSON en `BENCHMARK_RESULTS` o, si no se define, en
+`benchmarks/results/<fecha>.json`.
+"""
+
+import json
+import os
+import platform
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+
+# La configuración de la app se lee al importarla: la URL debe fijarse antes.
+_SCRATCH_DIR = tempfile.mkdtemp(prefix="workouts-bench-")
+os.environ["DATABASE_URL"] = os.environ.get(
+    "BENCHMARK_DATABASE_URL", f"sqlite:///{_SCRATCH_DIR}/bench.db"
+)
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+os.environ["QUERY_STATS_ENABLED"] = "true"
+
+# pylint: disable=wrong-import-position
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models.workout import WorkoutExercise
+from benchmarks.seed import BENCHMARK_PASSWORD, Dataset, seed_dataset
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, default))
+
+
+@pytest.fixture(scope="session")
+def dataset() -> Iterator[Dataset]:
+    """Esquema nuevo poblado con datos sintéticos para toda la sesión."""
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        data = seed_dataset(
+            db,
+            users=_env_int("BENCHMARK_USERS", 5),
+            workouts_per_user=_env_int("BENCHMARK_WORKOUTS_PER_USER", 365),
+        )
+    finally:
+        db.close()
+    yield data
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    shutil.rmtree(_SCRATCH_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def client(dataset: Dataset) -> Iterator[TestClient]:
+    """Cliente HTTP contra la app completa, con sus middlewares."""
+    # pylint: disable=import-outside-toplevel
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client: TestClient, dataset: Dataset) -> Dict[str, str]:
+    """Cabecera de un usuario sin privilegios con historial completo."""
+    response = client.post(
+        "/api/auth/login",
+        data={"username": dataset.user_emails[1], "password": BENCHMARK_PASSWORD},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture(scope="session")
+def active_workout(dataset: Dataset) -> Dict[str, int]:
+    """Workout activo del usuario de `auth_headers` y uno de sus ejercicios."""
+    workout_id = dataset.active_workout_ids[1]
+    db = SessionLocal()
+    try:
+        workout_exercise = db.scalars(
+            select(WorkoutExercise)
+            .where(WorkoutExercise.workout_id == workout_id)
+            .order_by(WorkoutExercise.order_index)
+            .limit(1)
+        ).one()
+        return {
+            "workout_id": workout_id,
+            "workout_exercise_id": workout_exercise.id,
+            "exercise_id": workout_exercise.exercise_id,
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="session")
+def iterations() -> Dict[str, int]:
+    """Repeticiones por endpoint; el login es más caro por bcrypt."""
+    return {
+        "default": _env_int("BENCHMARK_ITERATIONS", 50),
+        "login": _env_int("BENCHMARK_LOGIN_ITERATIONS", 10),
+    }
+
+
+@pytest.fixture(scope="session")
+def results(dataset: Dataset) -> Iterator[Dict[str, Any]]:
+    """Resultados por endpoint; se escriben en JSON al terminar la sesión."""
+    endpoints: Dict[str, Any] = {}
+    yield endpoints
+
+    path = Path(
+        os.environ.get("BENCHMARK_RESULTS")
+        or RESULTS_DIR / f"{datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "created_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "environment": {
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "bcrypt_rounds": settings.PASSWORD_BCRYPT_ROUNDS,
+        },
+        "dataset": {
+            "users": len(dataset.user_ids),
+            "workouts": len(dataset.completed_workout_ids)
+            + len(dataset.active_workout_ids),
+            "exercises": len(dataset.exercise_ids),
+            "templates": len(dataset.template_ids),
+        },
+        "endpoints": endpoints,
+    }
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+    print(f"\nBenchmark results written to {path}")
@@ -0,0 +1,220 @@
+"""
+Generador de datos sintéticos para los benchmarks del backend.
+
+Crea usuarios con historiales largos de workouts, un catálogo de ejercicios y
+plantillas públicas, usando inserciones masivas para que poblar decenas de
+miles de series tome pocos segundos.
+"""
+
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.db.base import Base
+from app.models.exercise import Exercise, ExerciseType
+from app.models.user import User
+from app.models.workout import (
+    ExerciseSet,
+    Workout,
+    WorkoutExercise,
+    WorkoutTemplate,
+    WorkoutTemplateExercise,
+)
+
+MUSCLE_GROUPS = ["Pecho", "Espalda", "Piernas", "Hombros", "Bíceps", "Tríceps"]
+EQUIPMENT = ["Barra", "Mancuernas", "Máquina", "Polea", "Peso corporal"]
+BENCHMARK_PASSWORD = "benchmark"
+
+
+@dataclass
+class Dataset:
+    """Identificadores de los datos generados."""
+
+    user_ids: List[int] = field(default_factory=list)
+    user_emails: List[str] = field(default_factory=list)
+    exercise_ids: List[int] = field(default_factory=list)
+    template_ids: List[int] = field(default_factory=list)
+    completed_workout_ids: List[int] = field(default_factory=list)
+    active_workout_ids: List[int] = field(default_factory=list)
+
+
+@contextmanager
+def scratch_session(database_url: Optional[str] = None) -> Iterator[Session]:
+    """
+    Entrega una sesión sobre una base desechable.
+
+    Sin `database_url` (o con una URL SQLite) se crea una base en memoria a
+    partir de los modelos, sin servicios externos. Con una URL PostgreSQL se
+    usa esa base (con las migraciones aplicadas) dentro de una transacción
+    que se revierte al salir; los `commit` de las operaciones CRUD se
+    convierten en savepoints.
+    """
+    url = database_url or "sqlite://"
+    if url.startswith("sqlite"):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+    else:
+        engine = create_engine(url)
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield db
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def _insert_returning_ids(db: Session, model, rows: List[dict]) -> List[int]:
+    """Inserta las filas en una sola sentencia y devuelve sus IDs en orden."""
+    if not rows:
+        return []
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(db.scalars(statement, rows))
+
+
+# pylint: disable=too-many-arguments,too-many-locals
+def seed_dataset(
+    db: Session,
+    *,
+    users: int = 1,
+    workouts_per_user: int = 300,
+    exercises_per_workout: int = 8,
+    sets_per_exercise: int = 5,
+    catalog_size: int = 40,
+    templates: int = 10,
+    seed: int = 7,
+) -> Dataset:
+    """
+    Puebla la base con un conjunto de datos sintético y reproducible.
+
+    Cada usuario recibe `workouts_per_user` workouts, uno cada dos días hacia
+    atrás; el más reciente queda activo y el resto completados.
+    """
+    rng = random.Random(seed)
+    dataset = Dataset()
+    hashed_password = get_password_hash(BENCHMARK_PASSWORD)
+
+    dataset.exercise_ids = _insert_returning_ids(
+        db,
+        Exercise,
+        [
+            {
+                "name": f"Ejercicio {index}",
+                "exercise_type": ExerciseType.WEIGHT_BASED,
+                "muscle_group": MUSCLE_GROUPS[index % len(MUSCLE_GROUPS)],
+                "equipment": EQUIPMENT[index % len(EQUIPMENT)],
+                "is_active": True,
+            }
+            for index in range(catalog_size)
+        ],
+    )
+
+    dataset.user_emails = [f"bench{index}@example.com" for index in range(users)]
+    dataset.user_ids = _insert_returning_ids(
+        db,
+        User,
+        [
+            {
+                "email": email,
+                "username": email.split("@", maxsplit=1)[0],
+                "hashed_password": hashed_password,
+                "is_active": True,
+                "is_admin": index == 0,
+            }
+            for index, email in enumerate(dataset.user_emails)
+        ],
+    )
+
+    dataset.template_ids = _insert_returning_ids(
+        db,
+        WorkoutTemplate,
+        [
+            {
+                "name": f"Plantilla {index}",
+                "created_by": dataset.user_ids[0],
+                "is_public": True,
+            }
+            for index in range(templates)
+        ],
+    )
+    db.execute(
+        insert(WorkoutTemplateExercise),
+        [
+            {
+                "template_id": template_id,
+                "exercise_id": exercise_id,
+                "order_index": order_index,
+                "suggested_sets": sets_per_exercise,
+                "suggested_reps": 10,
+                "suggested_weight": 40.0,
+            }
+            for template_id in dataset.template_ids
+            for order_index, exercise_id in enumerate(
+                rng.sample(dataset.exercise_ids, exercises_per_workout)
+            )
+        ],
+    )
+
+    now = datetime.utcnow()
+    workout_rows = []
+    for user_id in dataset.user_ids:
+        for days_ago in range(0, workouts_per_user * 2, 2):
+            started_at = now - timedelta(days=days_ago, hours=1)
+            workout_rows.append(
+                {
+                    "user_id": user_id,
+                    "name": f"Sesión {days_ago}",
+                    "started_at": started_at,
+                    "completed_at": (
+                        None if days_ago == 0 else started_at + timedelta(hours=1)
+                    ),
+                }
+            )
+    workout_ids = _insert_returning_ids(db, Workout, workout_rows)
+    for workout_id, row in zip(workout_ids, workout_rows):
+        if row["completed_at"] is None:
+            dataset.active_workout_ids.append(workout_id)
+        else:
+            dataset.completed_workout_ids.append(workout_id)
+
+    workout_exercise_ids = _insert_returning_ids(
+        db,
+        WorkoutExercise,
+        [
+            {
+                "workout_id": workout_id,
+                "exercise_id": exercise_id,
+                "order_index": order_index,
+            }
+            for workout_id in workout_ids
+            for order_index, exercise_id in enumerate(
+                rng.sample(dataset.exercise_ids, exercises_per_workout)
+            )
+        ],
+    )
+    db.execute(
+        insert(ExerciseSet),
+        [
+            {
+                "workout_exercise_id": workout_exercise_id,
+                "set_number": set_number,
+                "reps": rng.randint(5, 12),
+                "weight": float(rng.randrange(20, 120, 5)),
+                "completed": True,
+            }
+            for workout_exercise_id in workout_exercise_ids
+            for set_number in range(1, sets_per_exercise + 1)
+        ],
+    )
+    db.commit()
+    return dataset
@@ -0,0 +1,149 @@
+"""
+Benchmark y regresión de sentencias SQL de los endpoints con más tráfico.
+
+Cada caso repite la petición, comprueba que ninguna ejecución supera su
+máximo de sentencias SQL (leído de la cabecera `Server-Timing`) y registra
+los percentiles de latencia en el JSON de resultados. Un límite superado
+suele indicar una carga perezosa nueva (N+1) en el endpoint.
+
+Uso:
+    python -m pytest benchmarks -q -s
+"""
+
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from benchmarks.seed import BENCHMARK_PASSWORD, Dataset
+
+_STATEMENTS = re.compile(r'desc="(\d+) statements"')
+
+
+@dataclass
+class Case:
+    """Endpoint a medir y su máximo de sentencias SQL por petición."""
+
+    name: str
+    method: str
+    path: str
+    max_statements: int
+    authenticated: bool = True
+    json: Optional[Callable[[int], Dict[str, Any]]] = None
+    form: Optional[Dict[str, str]] = None
+
+
+CASES = [
+    Case(
+        "login",
+        "POST",
+        "/api/auth/login",
+        max_statements=1,
+        authenticated=False,
+        form={"username": "{email}", "password": BENCHMARK_PASSWORD},
+    ),
+    Case("active workout", "GET", "/api/workouts/active", max_statements=3),
+    Case(
+        "add set",
+        "POST",
+        "/api/workouts/{workout_id}/exercises/{workout_exercise_id}/sets",
+        max_statements=4,
+        json=lambda iteration: {
+            "set_number": 100 + iteration,
+            "reps": 10,
+            "weight": 60.0,
+            "completed": True,
+        },
+    ),
+    Case("history", "GET", "/api/workouts/history?limit=20", max_statements=3),
+    Case("templates", "GET", "/api/workouts/templates", max_statements=2),
+    Case(
+        "progression",
+        "GET",
+        "/api/workouts/progression/{exercise_id}?limit=10",
+        max_statements=2,
+    ),
+]
+
+
+def _percentile(samples: List[float], percent: float) -> float:
+    """Percentil por interpolación lineal entre las muestras ordenadas."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _summary(latencies: List[float], statements: List[int]) -> Dict[str, Any]:
+    milliseconds = [latency * 1000 for latency in latencies]
+    return {
+        "iterations": len(latencies),
+        "latency_ms": {
+            "min": round(min(milliseconds), 3),
+            "mean": round(statistics.fmean(milliseconds), 3),
+            "p50": round(_percentile(milliseconds, 50), 3),
+            "p90": round(_percentile(milliseconds, 90), 3),
+            "p95": round(_percentile(milliseconds, 95), 3),
+            "p99": round(_percentile(milliseconds, 99), 3),
+            "max": round(max(milliseconds), 3),
+        },
+        "statements": {"min": min(statements), "max": max(statements)},
+    }
+
+
+# pylint: disable=too-many-arguments,redefined-outer-name
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_endpoint(
+    case: Case,
+    client: TestClient,
+    dataset: Dataset,
+    auth_headers: Dict[str, str],
+    active_workout: Dict[str, int],
+    iterations: Dict[str, int],
+    results: Dict[str, Any],
+) -> None:
+    params = {**active_workout, "email": dataset.user_emails[1]}
+    path = case.path.format(**params)
+    form = (
+        {key: value.format(**params) for key, value in case.form.items()}
+        if case.form
+        else None
+    )
+    headers = auth_headers if case.authenticated else {}
+    count = iterations.get(case.name, iterations["default"])
+
+    latencies: List[float] = []
+    statements: List[int] = []
+    # La primera petición calienta caches y pools y no se cuenta.
+    for iteration in range(count + 1):
+        started = time.perf_counter()
+        response = client.request(
+            case.method,
+            path,
+            headers=headers,
+            data=form,
+            json=case.json(iteration) if case.json else None,
+        )
+        elapsed = time.perf_counter() - started
+        assert response.status_code == 200, response.text
+        match = _STATEMENTS.search(response.headers.get("Server-Timing", ""))
+        assert match, "Server-Timing header missing; is QUERY_STATS_ENABLED on?"
+        if iteration:
+            latencies.append(elapsed)
+            statements.append(int(match.group(1)))
+
+    results[case.name] = {
+        "method": case.method,
+        "path": case.path,
+        "max_statements": case.max_statements,
+        **_summary(latencies, statements),
+    }
+    assert max(statements) <= case.max_statements, (
+        f"{case.name} ran {max(statements)} SQL statements "
+        f"(limit {case.max_statements})"
+    )
@@ -10,6 +10,13 @@ echo "Creando usuario admin"
 # Ejecuta un script Python que verifica si el admin ya existe; si no, lo crea
 python3 create_admin.py
 
+# Con varios workers las métricas se agregan en PROMETHEUS_MULTIPROC_DIR;
+# se vacía al arrancar para no sumar valores de procesos anteriores
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 # "exec" reemplaza el proceso del script por uvicorn,
 # de manera que el contenedor use este proceso principal
 exec uvicorn main:app --host 0.0.0.0 --port 8000
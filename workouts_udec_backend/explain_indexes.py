@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Script que verifica que las consultas CRUD de workouts usen índices.
+
+Ejecuta las consultas de acceso frecuente (historial, workout activo,
+progresión, plantillas y borrado en cascada de un usuario) sobre datos de
+prueba, captura cada sentencia SQL emitida y obtiene su plan con EXPLAIN.
+Termina con código 1 si alguna sentencia recorre secuencialmente una de las
+tablas de workouts.
+
+Con PostgreSQL se usa la base configurada (con las migraciones aplicadas);
+todo ocurre dentro de una transacción que se revierte al final y con
+`enable_seqscan` desactivado, para que el planificador elija un índice
+siempre que exista uno aplicable aunque las tablas sean pequeñas. Con SQLite
+se usa una base en memoria creada a partir de los modelos.
+
+Uso:
+    alembic upgrade head
+    python3 explain_indexes.py
+"""
+
+import re
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.crud_user import user
+from app.crud.crud_workout import workout, workout_template
+from app.db.base import Base
+from app.models.exercise import Exercise, ExerciseType
+from app.models.user import User
+from app.models.workout import (
+    ExerciseSet,
+    Workout,
+    WorkoutExercise,
+    WorkoutTemplate,
+    WorkoutTemplateExercise,
+)
+
+WATCHED_TABLES = {
+    "workouts",
+    "workout_exercises",
+    "exercise_sets",
+    "workout_templates",
+    "workout_template_exercises",
+}
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+
+def seed(db: Session) -> Tuple[int, int, int]:
+    """Crea un usuario con plantillas y workouts completados y activo."""
+    owner = User(email="explain@example.com", username="explain", hashed_password="")
+    bench = Exercise(name="Press banca", exercise_type=ExerciseType.WEIGHT_BASED)
+    db.add_all([owner, bench])
+    db.flush()
+
+    template = WorkoutTemplate(name="Pecho", created_by=owner.id, is_public=True)
+    db.add(template)
+    db.flush()
+    db.add(
+        WorkoutTemplateExercise(
+            template_id=template.id, exercise_id=bench.id, order_index=0
+        )
+    )
+
+    now = datetime.utcnow()
+    for days_ago in range(4):
+        session = Workout(
+            user_id=owner.id,
+            started_at=now - timedelta(days=days_ago),
+            completed_at=None if days_ago == 0 else now - timedelta(days=days_ago),
+        )
+        db.add(session)
+        db.flush()
+        workout_exercise = WorkoutExercise(
+            workout_id=session.id, exercise_id=bench.id, order_index=0
+        )
+        db.add(workout_exercise)
+        db.flush()
+        for set_number in range(1, 4):
+            db.add(
+                ExerciseSet(
+                    workout_exercise_id=workout_exercise.id,
+                    set_number=set_number,
+                    reps=10,
+                    weight=60.0,
+                    completed=True,
+                )
+            )
+    db.commit()
+    return owner.id, bench.id, template.id
+
+
+def capture(connection: Connection, call: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    """Ejecuta `call` y devuelve las sentencias SQL que emitió."""
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument,too-many-arguments
+        if statement.lstrip().upper().startswith(EXPLAINABLE):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def sequential_scans(
+    connection: Connection, statement: str, parameters: Any
+) -> List[str]:
+    """Devuelve las tablas vigiladas que el plan recorre sin usar un índice."""
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        ).fetchall()
+        pattern = re.compile(r"^SCAN (\w+)(?!.*USING)")
+        lines = [row[-1] for row in rows]
+    else:
+        rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters).fetchall()
+        pattern = re.compile(r"Seq Scan on (\w+)")
+        lines = [row[0] for row in rows]
+
+    tables = []
+    for line in lines:
+        match = pattern.search(line)
+        if match and match.group(1) in WATCHED_TABLES:
+            tables.append(match.group(1))
+    return tables
+
+
+def hot_queries(
+    db: Session, *, user_id: int, exercise_id: int, template_id: int, completed_id: int
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """Consultas de acceso frecuente sobre los datos de `seed`, por nombre."""
+    return [
+        ("get_by_user", lambda: workout.get_by_user(db, user_id=user_id)),
+        (
+            "get_completed_by_user",
+            lambda: workout.get_completed_by_user(db, user_id=user_id),
+        ),
+        ("get_active_by_user", lambda: workout.get_active_by_user(db, user_id=user_id)),
+        ("has_active_by_user", lambda: workout.has_active_by_user(db, user_id=user_id)),
+        ("get", lambda: workout.get(db, id=completed_id)),
+        ("get_owner_state", lambda: workout.get_owner_state(db, id=completed_id)),
+        (
+            "get_exercise_progression",
+            lambda: workout.get_exercise_progression(
+                db, user_id=user_id, exercise_id=exercise_id
+            ),
+        ),
+        (
+            "template.get_by_user",
+            lambda: workout_template.get_by_user(db, user_id=user_id),
+        ),
+        (
+            "template.get_public_with_exercises",
+            lambda: workout_template.get_public_with_exercises(db),
+        ),
+        (
+            "template.get_with_exercises",
+            lambda: workout_template.get_with_exercises(db, id=template_id),
+        ),
+        ("delete_with_cascade", lambda: user.delete_with_cascade(db, user_id=user_id)),
+    ]
+
+
+def main() -> int:
+    """Ejecuta las consultas, imprime su resultado y devuelve el código de salida."""
+    if settings.database_url.startswith("sqlite"):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+    else:
+        engine = create_engine(settings.database_url)
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    user_id, exercise_id, template_id = seed(db)
+    completed_id = (
+        workout.get_completed_by_user(db, user_id=user_id, limit=1).items[0].id
+    )
+    db.expunge_all()
+
+    queries = hot_queries(
+        db,
+        user_id=user_id,
+        exercise_id=exercise_id,
+        template_id=template_id,
+        completed_id=completed_id,
+    )
+
+    failures = 0
+    for name, call in queries:
+        db.expunge_all()
+        for statement, parameters in capture(connection, call):
+            tables = sequential_scans(connection, statement, parameters)
+            status = "SEQ SCAN " + ", ".join(tables) if tables else "ok"
+            print(f"{name:38} {status}")
+            if tables:
+                failures += 1
+                print("    " + " ".join(statement.split()))
+
+    db.close()
+    transaction.rollback()
+    connection.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
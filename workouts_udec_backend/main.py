@@ -4,11 +4,31 @@ Módulo principal de la API de seguimiento de entrenamientos.
 Este módulo inicializa la aplicación FastAPI, configura el middleware CORS,
 registra los routers de la API y define un endpoint básico de salud (`/health`)
 para verificar el estado del servidor.
+
+Con `QUERY_STATS_ENABLED` cada respuesta incluye una cabecera `Server-Timing`
+con el número de sentencias SQL, el tiempo total en la base de datos y la
+sentencia más lenta, y se escribe una línea de log JSON por petición.
+
+Con `METRICS_ENABLED` se expone `/metrics` en formato Prometheus
+(ver `app.api.metrics`).
 """
 
-from fastapi import FastAPI
+import json
+import logging
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from app.api import metrics
 from app.api.main_router import api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.config import settings
+from app.core.hashing import PasswordHashingBusy
+from app.db import query_stats
+from app.db.session import async_engine, async_replica_engines
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Workout Tracker API",
@@ -22,13 +42,111 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Server-Timing"],
 )
 
+
+def server_timing(stats: query_stats.QueryStats, total_seconds: float) -> str:
+    """Valor de la cabecera `Server-Timing` para una petición."""
+    return ", ".join(
+        [
+            f'db;dur={stats.db_seconds * 1000:.3f};desc="{stats.statements} statements"',
+            f"db-slowest;dur={stats.slowest_seconds * 1000:.3f}",
+            f"total;dur={total_seconds * 1000:.3f}",
+        ]
+    )
+
+
+if settings.QUERY_STATS_ENABLED:
+
+    @app.middleware("http")
+    async def record_query_stats(request: Request, call_next):
+        """
+        Cuenta las sentencias SQL de la petición y publica el resultado en
+        `Server-Timing` y en el log.
+        """
+        started = time.perf_counter()
+        with query_stats.track() as stats:
+            response = await call_next(request)
+        total = time.perf_counter() - started
+        response.headers["Server-Timing"] = server_timing(stats, total)
+
+        route = request.scope.get("route")
+        record = {
+            "method": request.method,
+            "route": getattr(route, "path", request.url.path),
+            "status": response.status_code,
+            "duration_ms": round(total * 1000, 3),
+            **stats.as_dict(),
+        }
+        level = (
+            logging.WARNING
+            if stats.statements > settings.QUERY_STATS_WARN_STATEMENTS
+            else logging.INFO
+        )
+        logger.log(level, json.dumps(record))
+        return response
+
+
 app.include_router(api_router, prefix="/api")
 
 
+if settings.METRICS_ENABLED:
+
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        """Mide la latencia y las peticiones en curso por plantilla de ruta."""
+        route = metrics.route_template(app, request.scope)
+        in_progress = metrics.REQUESTS_IN_PROGRESS.labels(route, request.method)
+        in_progress.inc()
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            in_progress.dec()
+            metrics.REQUEST_LATENCY.labels(route, request.method, str(status)).observe(
+                time.perf_counter() - started
+            )
+            metrics.refresh()
+
+    @app.get("/metrics", include_in_schema=False)
+    def read_metrics() -> Response:
+        """
+        Métricas en formato de texto de Prometheus.
+        """
+        body, content_type = metrics.render()
+        return Response(content=body, media_type=content_type)
+
+
+@app.on_event("shutdown")
+async def dispose_async_engines() -> None:
+    """Cierra las conexiones de los motores asíncronos al detener la aplicación."""
+    if async_engine is not None:
+        await async_engine.dispose()
+    for replica_engine in async_replica_engines:
+        await replica_engine.dispose()
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(
+    request: Request, exc: PasswordHashingBusy
+) -> JSONResponse:
+    """
+    Responde 503 cuando la cola de hashing de contraseñas está llena, para
+    que el cliente reintente en lugar de esperar indefinidamente.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many login attempts in progress, retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.get("/health")
-def health_check() -> dict[str,str]:
+def health_check() -> dict[str, str]:
     """
     Endpoint de verificación del estado del servidor.
     """
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Script que regenera la tabla de estadísticas por usuario y ejercicio.
+
+La tabla se mantiene sola al completar workouts y al editar series de
+workouts completados; este script la reconstruye desde las series, por
+ejemplo tras importar datos directamente en la base.
+
+Uso:
+    python3 rebuild_exercise_stats.py
+"""
+
+from app.crud.crud_exercise_stats import exercise_stats
+from app.db import base  # noqa: F401  # pylint: disable=unused-import
+from app.db.session import SessionLocal
+
+
+def main() -> None:
+    """Regenera la tabla dentro de una única transacción."""
+    db = SessionLocal()
+    try:
+        rows = exercise_stats.rebuild(db)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Estadísticas regeneradas: {rows} filas.")
+
+
+if __name__ == "__main__":
+    main()
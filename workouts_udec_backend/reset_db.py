@@ -11,6 +11,8 @@ from app.models.workout import (
     WorkoutTemplate,
     WorkoutTemplateExercise,
 )
+from app.models.sync import SyncOperation
+from app.models.exercise_stats import UserExerciseStats
 
 def reset_database():
     db = SessionLocal()
@@ -0,0 +1,159 @@
+"""
+Fixtures de los tests de la API.
+
+Los tests levantan la app completa con `TestClient` sobre un fichero SQLite
+temporal con el esquema creado desde los modelos. Cada test usa un usuario
+nuevo, así que no comparten workouts activos.
+"""
+
+import itertools
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+
+# La configuración de la app se lee al importarla: la URL debe fijarse antes.
+_SCRATCH_DIR = tempfile.mkdtemp(prefix="workouts-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_SCRATCH_DIR}/tests.db"
+os.environ["DATABASE_REPLICA_URLS"] = "[]"
+os.environ["ASYNC_ENDPOINTS"] = "false"
+
+# pylint: disable=wrong-import-position
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models.exercise import Exercise, ExerciseType
+from app.models.user import User
+
+_user_numbers = itertools.count()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database() -> Iterator[None]:
+    """Esquema nuevo para toda la sesión de tests."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    engine.dispose()
+    shutil.rmtree(_SCRATCH_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Cliente HTTP contra la app completa."""
+    # pylint: disable=import-outside-toplevel
+    import main
+
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    """Sesión para preparar datos y comprobar el estado de la base."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user(db: Session) -> User:
+    """Usuario activo sin privilegios, distinto en cada test."""
+    number = next(_user_numbers)
+    user_obj = User(
+        email=f"user{number}@example.com",
+        username=f"user{number}",
+        hashed_password="not-used",
+        is_active=True,
+        is_admin=False,
+    )
+    db.add(user_obj)
+    db.commit()
+    return user_obj
+
+
+@pytest.fixture
+def auth_headers(user: User) -> Dict[str, str]:
+    """Cabecera de autenticación de `user`."""
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+@pytest.fixture
+def admin_headers(db: Session) -> Dict[str, str]:
+    """Cabecera de autenticación de un administrador nuevo."""
+    number = next(_user_numbers)
+    admin = User(
+        email=f"admin{number}@example.com",
+        username=f"admin{number}",
+        hashed_password="not-used",
+        is_active=True,
+        is_admin=True,
+    )
+    db.add(admin)
+    db.commit()
+    return {"Authorization": f"Bearer {create_access_token(admin.id)}"}
+
+
+@pytest.fixture
+def exercise(db: Session) -> Exercise:
+    """Ejercicio de peso del catálogo."""
+    exercise_obj = Exercise(
+        name=f"Press {next(_user_numbers)}",
+        exercise_type=ExerciseType.WEIGHT_BASED,
+        muscle_group="Pecho",
+        equipment="Barra",
+        is_active=True,
+    )
+    db.add(exercise_obj)
+    db.commit()
+    return exercise_obj
+
+
+@pytest.fixture
+def start_workout(
+    client: TestClient, auth_headers: Dict[str, str], exercise: Exercise
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Crea por la API un workout activo con un ejercicio y `sets` series.
+
+    Devuelve los ids del workout, del ejercicio del workout y de las series.
+    """
+
+    def start(sets: int = 2) -> Dict[str, Any]:
+        response = client.post("/api/workouts/", headers=auth_headers, json={})
+        assert response.status_code == 200, response.text
+        workout_id = response.json()["id"]
+        response = client.post(
+            f"/api/workouts/{workout_id}/exercises",
+            headers=auth_headers,
+            json={"exercise_id": exercise.id, "order_index": 0},
+        )
+        assert response.status_code == 200, response.text
+        workout_exercise_id = response.json()["id"]
+        set_ids = []
+        for set_number in range(1, sets + 1):
+            response = client.post(
+                f"/api/workouts/{workout_id}/exercises/{workout_exercise_id}/sets",
+                headers=auth_headers,
+                json={
+                    "set_number": set_number,
+                    "reps": 10,
+                    "weight": 50.0,
+                    "completed": True,
+                },
+            )
+            assert response.status_code == 200, response.text
+            set_ids.append(response.json()["id"])
+        return {
+            "workout_id": workout_id,
+            "workout_exercise_id": workout_exercise_id,
+            "set_ids": set_ids,
+        }
+
+    return start
@@ -0,0 +1,43 @@
+"""Tests de la decodificación de cursores de paginación."""
+
+import pytest
+
+from app.crud.base import decode_cursor, encode_cursor
+from app.models.workout import Workout
+
+
+@pytest.mark.parametrize(
+    "values",
+    [["abc"], [True], [1.5], [None], [[1]]],
+    ids=["text", "bool", "float", "null", "list"],
+)
+def test_decode_cursor_rejects_wrong_value_type(values):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(encode_cursor(values), [Workout.id])
+
+
+def test_decode_cursor_rejects_non_string_datetime():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(encode_cursor([12, 3]), [Workout.started_at, Workout.id])
+
+
+def test_decode_cursor_round_trip():
+    cursor = encode_cursor(["2026-01-01T10:00:00", 3])
+    started_at, workout_id = decode_cursor(cursor, [Workout.started_at, Workout.id])
+    assert started_at.isoformat() == "2026-01-01T10:00:00"
+    assert workout_id == 3
+
+
+@pytest.mark.parametrize(
+    "path, values",
+    [
+        ("/api/workouts/", ["2026-01-01T10:00:00", "abc"]),
+        ("/api/exercises/", ["abc"]),
+    ],
+)
+def test_list_with_wrong_cursor_type_is_bad_request(client, auth_headers, path, values):
+    response = client.get(
+        path, params={"cursor": encode_cursor(values)}, headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
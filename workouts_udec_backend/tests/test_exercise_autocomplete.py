@@ -0,0 +1,60 @@
+"""Tests de `GET /exercises/autocomplete` y del índice de prefijos."""
+
+import pytest
+
+from app.crud.crud_exercise import exercise, normalize_name
+from app.db.session import SessionLocal
+from app.models.exercise import ExerciseType
+from app.schemas.exercise import ExerciseCreate
+
+AUTOCOMPLETE = "/api/exercises/autocomplete"
+
+
+@pytest.fixture(scope="module")
+def catalog_names():
+    """Ejercicios creados con el CRUD, que invalida el catálogo en memoria."""
+    names = ["Prensa Ñandú", "Elevación Ñandú", "Ñandú Inclinado", "Curl Femoral"]
+    db = SessionLocal()
+    try:
+        for name in names:
+            exercise.create(
+                db,
+                obj_in=ExerciseCreate(name=name, exercise_type=ExerciseType.WEIGHT_BASED),
+            )
+    finally:
+        db.close()
+    return names
+
+
+def _suggest(client, headers, q, limit=10):
+    response = client.get(AUTOCOMPLETE, headers=headers, params={"q": q, "limit": limit})
+    assert response.status_code == 200, response.text
+    return [item["name"] for item in response.json()]
+
+
+def test_normalize_name_folds_accents_case_and_punctuation():
+    assert normalize_name("PRÉSS de  Banca-Inclinado") == "press de banca inclinado"
+    assert normalize_name("Ñandú") == "nandu"
+
+
+# pylint: disable=redefined-outer-name,unused-argument
+def test_accents_and_case_are_ignored(client, auth_headers, catalog_names):
+    for q in ("nandu", "ÑANDÚ", "Nandu"):
+        assert _suggest(client, auth_headers, q) == [
+            "Ñandú Inclinado",
+            "Elevación Ñandú",
+            "Prensa Ñandú",
+        ]
+    assert _suggest(client, auth_headers, "elevacion") == ["Elevación Ñandú"]
+
+
+def test_any_word_prefix_matches(client, auth_headers, catalog_names):
+    assert _suggest(client, auth_headers, "femo") == ["Curl Femoral"]
+    assert _suggest(client, auth_headers, "nandu incl") == ["Ñandú Inclinado"]
+    # Prefijo de una palabra, no subcadena.
+    assert _suggest(client, auth_headers, "andu") == []
+
+
+def test_limit_keeps_best_ranked(client, auth_headers, catalog_names):
+    assert _suggest(client, auth_headers, "nandu", limit=1) == ["Ñandú Inclinado"]
+    assert _suggest(client, auth_headers, "") == []
@@ -0,0 +1,74 @@
+"""Tests de `GET /exercises/catalog`: ETag, 304 e invalidación."""
+
+from app.crud.crud_exercise import catalog
+
+CATALOG = "/api/exercises/catalog"
+
+
+def _catalog(client, headers, etag=None):
+    if etag is not None:
+        headers = {**headers, "If-None-Match": etag}
+    return client.get(CATALOG, headers=headers)
+
+
+def _names(response):
+    return {item["name"] for item in response.json()}
+
+
+def test_matching_etag_returns_304(client, auth_headers):
+    response = _catalog(client, auth_headers)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    revalidated = _catalog(client, auth_headers, etag)
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+    assert _catalog(client, auth_headers, f'"stale", {etag}').status_code == 304
+    assert _catalog(client, auth_headers, '"stale"').status_code == 200
+
+
+def test_create_update_and_delete_change_the_etag(
+    client, auth_headers, admin_headers
+):
+    etag = _catalog(client, auth_headers).headers["ETag"]
+
+    response = client.post(
+        "/api/exercises/",
+        headers=admin_headers,
+        json={"name": "Catalog Curl", "exercise_type": "WEIGHT_BASED"},
+    )
+    assert response.status_code == 200, response.text
+    exercise_id = response.json()["id"]
+    created = _catalog(client, auth_headers, etag)
+    assert created.status_code == 200
+    assert "Catalog Curl" in _names(created)
+    assert created.headers["ETag"] != etag
+
+    etag = created.headers["ETag"]
+    response = client.put(
+        f"/api/exercises/{exercise_id}",
+        headers=admin_headers,
+        json={"name": "Catalog Hammer Curl"},
+    )
+    assert response.status_code == 200, response.text
+    updated = _catalog(client, auth_headers, etag)
+    assert updated.status_code == 200
+    assert "Catalog Hammer Curl" in _names(updated)
+    assert "Catalog Curl" not in _names(updated)
+
+    etag = updated.headers["ETag"]
+    response = client.delete(f"/api/exercises/{exercise_id}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    deleted = _catalog(client, auth_headers, etag)
+    assert deleted.status_code == 200
+    assert "Catalog Hammer Curl" not in _names(deleted)
+
+
+def test_rebuild_without_changes_keeps_the_etag(client, auth_headers):
+    etag = _catalog(client, auth_headers).headers["ETag"]
+    catalog.invalidate()
+
+    assert _catalog(client, auth_headers, etag).status_code == 304
@@ -0,0 +1,97 @@
+"""Tests de `GET /exercises/search`: filtros, conteos por faceta y texto."""
+
+import itertools
+
+import pytest
+
+from app.models.exercise import Exercise, ExerciseType
+
+SEARCH = "/api/exercises/search"
+
+_prefixes = (f"Facet{number}q" for number in itertools.count())
+
+
+@pytest.fixture
+def facet_exercises(db):
+    """
+    Ejercicios con un prefijo propio, para aislarlos del resto del catálogo.
+    Devuelve el prefijo.
+    """
+    prefix = next(_prefixes)
+    rows = [
+        (f"{prefix} Press", ExerciseType.WEIGHT_BASED, "Pecho", "Barra"),
+        (f"{prefix} Fly", ExerciseType.WEIGHT_BASED, "Pecho", "Mancuernas"),
+        (f"{prefix} Row", ExerciseType.WEIGHT_BASED, "Espalda", "Barra"),
+        (f"{prefix} Plank", ExerciseType.TIME_BASED, "Core", None),
+    ]
+    db.add_all(
+        Exercise(
+            name=name,
+            exercise_type=exercise_type,
+            muscle_group=muscle_group,
+            equipment=equipment,
+            is_active=True,
+        )
+        for name, exercise_type, muscle_group, equipment in rows
+    )
+    db.commit()
+    return prefix
+
+
+def _counts(facets, field):
+    return {facet["value"]: facet["count"] for facet in facets[field]}
+
+
+# pylint: disable=redefined-outer-name
+def test_facet_counts_ignore_their_own_filter(client, auth_headers, facet_exercises):
+    response = client.get(
+        SEARCH,
+        headers=auth_headers,
+        params={"q": facet_exercises, "muscle_group": "Pecho", "equipment": "Barra"},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    assert [item["name"] for item in body["items"]] == [f"{facet_exercises} Press"]
+    assert body["total"] == 1
+    # Grupo muscular: solo se aplica el filtro de equipamiento (Barra).
+    assert _counts(body["facets"], "muscle_group") == {"Pecho": 1, "Espalda": 1}
+    # Equipamiento: solo se aplica el filtro de grupo muscular (Pecho).
+    assert _counts(body["facets"], "equipment") == {"Barra": 1, "Mancuernas": 1}
+    # Tipo: se aplican ambos filtros.
+    assert _counts(body["facets"], "exercise_type") == {"WEIGHT_BASED": 1}
+
+
+def test_facet_counts_without_filters(client, auth_headers, facet_exercises):
+    body = client.get(
+        SEARCH, headers=auth_headers, params={"q": facet_exercises}
+    ).json()
+
+    assert body["total"] == 4
+    assert _counts(body["facets"], "muscle_group") == {
+        "Pecho": 2,
+        "Espalda": 1,
+        "Core": 1,
+    }
+    assert _counts(body["facets"], "equipment") == {"Barra": 2, "Mancuernas": 1}
+    assert _counts(body["facets"], "exercise_type") == {
+        "WEIGHT_BASED": 3,
+        "TIME_BASED": 1,
+    }
+
+
+def test_search_matches_description_and_instructions(client, auth_headers, db):
+    db.add(
+        Exercise(
+            name="Textq Swing",
+            exercise_type=ExerciseType.WEIGHT_BASED,
+            description="Explosive hip hinge with a kettlebellq",
+            instructions="Keep the spineq neutral",
+            is_active=True,
+        )
+    )
+    db.commit()
+
+    for q in ("kettlebellq", "SPINEQ NEUTRAL"):
+        body = client.get(SEARCH, headers=auth_headers, params={"q": q}).json()
+        assert [item["name"] for item in body["items"]] == ["Textq Swing"]
@@ -0,0 +1,78 @@
+"""
+Tests de uso de índices en las consultas CRUD de workouts.
+
+Reutilizan las consultas de `explain_indexes.py` sobre una base SQLite en
+memoria creada desde los modelos y comprueban con EXPLAIN QUERY PLAN que
+ninguna sentencia recorre secuencialmente una tabla de workouts.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.crud.crud_workout import workout
+from app.db.base import Base
+from explain_indexes import capture, hot_queries, seed, sequential_scans
+
+QUERY_NAMES = [
+    "get_by_user",
+    "get_completed_by_user",
+    "get_active_by_user",
+    "has_active_by_user",
+    "get",
+    "get_owner_state",
+    "get_exercise_progression",
+    "template.get_by_user",
+    "template.get_public_with_exercises",
+    "template.get_with_exercises",
+    "delete_with_cascade",
+]
+
+
+@pytest.fixture(scope="module")
+def explained() -> Iterator[Tuple[Connection, Session, Dict[str, Callable[[], Any]]]]:
+    """Conexión, sesión y consultas por nombre sobre los datos de `seed`."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    user_id, exercise_id, template_id = seed(db)
+    completed_id = (
+        workout.get_completed_by_user(db, user_id=user_id, limit=1).items[0].id
+    )
+    queries = hot_queries(
+        db,
+        user_id=user_id,
+        exercise_id=exercise_id,
+        template_id=template_id,
+        completed_id=completed_id,
+    )
+    yield connection, db, dict(queries)
+
+    db.close()
+    transaction.rollback()
+    connection.close()
+    engine.dispose()
+
+
+def test_query_names_cover_hot_queries(explained):
+    _, _, queries = explained
+    assert list(queries) == QUERY_NAMES
+
+
+# pylint: disable=redefined-outer-name
+@pytest.mark.parametrize("name", QUERY_NAMES)
+def test_query_uses_indexes(name, explained):
+    connection, db, queries = explained
+    db.expunge_all()
+    statements = capture(connection, queries[name])
+    assert statements
+
+    for statement, parameters in statements:
+        tables = sequential_scans(connection, statement, parameters)
+        assert not tables, f"{name} scans {', '.join(tables)}: {statement}"
@@ -0,0 +1,40 @@
+"""Tests del reparto de conexiones entre los procesos de la API."""
+
+import pytest
+
+from app.core.config import Settings
+from app.db.pool import pool_sizes
+
+
+def _settings(**values) -> Settings:
+    return Settings(DB_POOL_SIZE=5, DB_MAX_OVERFLOW=10, **values)
+
+
+def test_without_budget_uses_configured_sizes():
+    assert pool_sizes(_settings(WEB_CONCURRENCY=4)) == {
+        "pool_size": 5,
+        "max_overflow": 10,
+    }
+
+
+@pytest.mark.parametrize(
+    ("max_connections", "workers", "expected"),
+    [
+        (20, 4, {"pool_size": 5, "max_overflow": 0}),
+        (40, 4, {"pool_size": 5, "max_overflow": 5}),
+        (10, 4, {"pool_size": 2, "max_overflow": 0}),
+        (4, 4, {"pool_size": 1, "max_overflow": 0}),
+    ],
+)
+def test_budget_is_split_across_workers(max_connections, workers, expected):
+    sizes = pool_sizes(
+        _settings(DB_MAX_CONNECTIONS=max_connections, WEB_CONCURRENCY=workers)
+    )
+
+    assert sizes == expected
+    assert (sizes["pool_size"] + sizes["max_overflow"]) * workers <= max_connections
+
+
+def test_budget_below_worker_count_is_rejected():
+    with pytest.raises(ValueError, match="WEB_CONCURRENCY"):
+        pool_sizes(_settings(DB_MAX_CONNECTIONS=3, WEB_CONCURRENCY=4))
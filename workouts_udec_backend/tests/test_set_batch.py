@@ -0,0 +1,47 @@
+"""Tests de `POST /workouts/{id}/sets/batch`."""
+
+from app.models.workout import ExerciseSet
+
+
+def test_batch_rejects_set_updated_and_deleted(client, auth_headers, start_workout, db):
+    started = start_workout(sets=2)
+    set_id = started["set_ids"][0]
+
+    response = client.post(
+        f"/api/workouts/{started['workout_id']}/sets/batch",
+        headers=auth_headers,
+        json={"delete": [set_id], "update": [{"id": set_id, "reps": 3}]},
+    )
+
+    assert response.status_code == 400
+    assert db.get(ExerciseSet, set_id).reps == 10
+
+
+def test_batch_rejects_duplicate_update_ids(client, auth_headers, start_workout, db):
+    started = start_workout(sets=2)
+    set_id = started["set_ids"][0]
+
+    response = client.post(
+        f"/api/workouts/{started['workout_id']}/sets/batch",
+        headers=auth_headers,
+        json={"update": [{"id": set_id, "reps": 3}, {"id": set_id, "reps": 4}]},
+    )
+
+    assert response.status_code == 400
+    assert db.get(ExerciseSet, set_id).reps == 10
+
+
+def test_batch_applies_disjoint_changes(client, auth_headers, start_workout):
+    started = start_workout(sets=2)
+    first, second = started["set_ids"]
+
+    response = client.post(
+        f"/api/workouts/{started['workout_id']}/sets/batch",
+        headers=auth_headers,
+        json={"delete": [first], "update": [{"id": second, "reps": 3}]},
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["deleted"] == [first]
+    assert [(s["id"], s["reps"]) for s in body["updated"]] == [(second, 3)]
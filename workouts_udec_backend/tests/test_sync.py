@@ -0,0 +1,168 @@
+"""Tests de `POST /workouts/sync`, la sincronización offline."""
+
+from datetime import datetime, timedelta, timezone
+
+from app.core.security import create_access_token
+from app.crud.crud_sync import _SyncBatch
+from app.db.session import SessionLocal
+from app.models.sync import SyncOperation
+from app.models.user import User
+from app.models.workout import ExerciseSet, Workout
+
+
+def _operations(exercise_id):
+    return [
+        {"key": "w1", "type": "create_workout", "data": {"name": "Offline"}},
+        {
+            "key": "e1",
+            "type": "add_exercise",
+            "workout_key": "w1",
+            "data": {"exercise_id": exercise_id, "order_index": 0},
+        },
+        {
+            "key": "s1",
+            "type": "add_set",
+            "workout_exercise_key": "e1",
+            "data": {"set_number": 1, "reps": 8, "weight": 40.0, "completed": True},
+        },
+    ]
+
+
+def _sync(client, headers, operations):
+    return client.post(
+        "/api/workouts/sync", headers=headers, json={"operations": operations}
+    )
+
+
+def test_replayed_log_is_not_applied_twice(client, auth_headers, exercise, db):
+    operations = _operations(exercise.id)
+
+    first = _sync(client, auth_headers, operations)
+    assert first.status_code == 200, first.text
+    assert first.json()["applied"] == ["w1", "e1", "s1"]
+
+    replay = _sync(client, auth_headers, operations)
+    assert replay.status_code == 200, replay.text
+    body = replay.json()
+    assert body["applied"] == []
+    assert body["duplicates"] == ["w1", "e1", "s1"]
+    assert body["ids"] == first.json()["ids"]
+    assert [w["id"] for w in body["workouts"]] == [first.json()["ids"]["w1"]]
+
+    sets = (
+        db.query(ExerciseSet)
+        .filter(ExerciseSet.workout_exercise_id == first.json()["ids"]["e1"])
+        .count()
+    )
+    assert sets == 1
+
+
+def test_operations_on_another_users_workout_are_rejected(
+    client, auth_headers, start_workout, db
+):
+    started = start_workout(sets=1)
+    intruder = User(
+        email="intruder@example.com",
+        username="intruder",
+        hashed_password="not-used",
+        is_active=True,
+    )
+    db.add(intruder)
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(intruder.id)}"}
+
+    response = _sync(
+        client,
+        headers,
+        [
+            {
+                "key": "n1",
+                "type": "update_workout_notes",
+                "workout_id": started["workout_id"],
+                "data": {"notes": "not mine"},
+            }
+        ],
+    )
+    assert response.status_code == 400
+    assert "Not enough permissions" in response.json()["detail"]
+
+    response = _sync(
+        client,
+        headers,
+        [
+            {
+                "key": "u1",
+                "type": "update_set",
+                "set_id": started["set_ids"][0],
+                "data": {"reps": 1},
+            }
+        ],
+    )
+    assert response.status_code == 400
+
+    db.expire_all()
+    assert db.get(Workout, started["workout_id"]).notes is None
+    assert db.get(ExerciseSet, started["set_ids"][0]).reps == 10
+    assert db.query(SyncOperation).filter_by(user_id=intruder.id).count() == 0
+
+
+def test_concurrent_sync_of_same_key_returns_409(
+    client, auth_headers, exercise, user, db, monkeypatch
+):
+    apply = _SyncBatch.apply
+
+    def apply_after_concurrent_sync(batch, operation):
+        # Otra petición registra la misma clave entre la consulta de claves
+        # conocidas y el commit de esta.
+        other = SessionLocal()
+        try:
+            other.add(
+                SyncOperation(
+                    user_id=user.id,
+                    idempotency_key=operation.key,
+                    operation=operation.type.value,
+                )
+            )
+            other.commit()
+        finally:
+            other.close()
+        monkeypatch.setattr(_SyncBatch, "apply", apply)
+        return apply(batch, operation)
+
+    monkeypatch.setattr(_SyncBatch, "apply", apply_after_concurrent_sync)
+
+    response = _sync(client, auth_headers, _operations(exercise.id)[:1])
+
+    assert response.status_code == 409
+    assert db.query(Workout).filter(Workout.user_id == user.id).count() == 0
+
+
+def test_sync_deletes_keys_past_retention(client, auth_headers, exercise, user, db):
+    now = datetime.now(timezone.utc)
+    db.add_all(
+        [
+            SyncOperation(
+                user_id=user.id,
+                idempotency_key="old",
+                operation="create_workout",
+                created_at=now - timedelta(days=31),
+            ),
+            SyncOperation(
+                user_id=user.id,
+                idempotency_key="recent",
+                operation="create_workout",
+                created_at=now - timedelta(days=29),
+            ),
+        ]
+    )
+    db.commit()
+
+    response = _sync(client, auth_headers, _operations(exercise.id))
+    assert response.status_code == 200, response.text
+
+    db.expire_all()
+    keys = {
+        row.idempotency_key
+        for row in db.query(SyncOperation).filter(SyncOperation.user_id == user.id)
+    }
+    assert keys == {"recent", "w1", "e1", "s1"}
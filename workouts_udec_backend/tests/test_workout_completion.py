@@ -0,0 +1,84 @@
+"""Tests de la finalización de workouts y las estadísticas por ejercicio."""
+
+from datetime import datetime
+
+import pytest
+
+from app.crud.crud_workout import workout
+from app.db.session import SessionLocal
+from app.models.exercise_stats import UserExerciseStats
+
+
+def _stats(db, user, exercise):
+    db.expire_all()
+    return db.get(UserExerciseStats, (user.id, exercise.id))
+
+
+def test_complete_twice_applies_stats_once(
+    client, auth_headers, start_workout, db, user, exercise
+):
+    started = start_workout(sets=2)
+
+    assert workout.complete(db, id=started["workout_id"]) is True
+    assert workout.complete(db, id=started["workout_id"]) is False
+
+    stats = _stats(db, user, exercise)
+    assert stats.session_count == 1
+    assert stats.total_volume == 2 * 10 * 50.0
+
+    response = client.put(
+        f"/api/workouts/{started['workout_id']}/complete", headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert _stats(db, user, exercise).session_count == 1
+
+
+def test_put_completed_at_keeps_stats_in_sync(
+    client, auth_headers, start_workout, db, user, exercise
+):
+    started = start_workout(sets=2)
+    url = f"/api/workouts/{started['workout_id']}"
+
+    response = client.put(
+        url, headers=auth_headers, json={"completed_at": "2026-01-01T10:00:00"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["completed_at"] is not None
+    stats = _stats(db, user, exercise)
+    assert stats.session_count == 1
+    assert stats.total_volume == 2 * 10 * 50.0
+
+    response = client.put(url, headers=auth_headers, json={"completed_at": None})
+    assert response.status_code == 200, response.text
+    assert response.json()["completed_at"] is None
+    assert _stats(db, user, exercise) is None
+
+    response = client.put(
+        url, headers=auth_headers, json={"completed_at": "2026-01-02T10:00:00"}
+    )
+    assert response.status_code == 200, response.text
+    assert _stats(db, user, exercise).session_count == 1
+
+
+def test_put_that_loses_completion_race_saves_nothing(
+    start_workout, db, user, exercise
+):
+    started = start_workout(sets=2)
+    stale = workout.get(db, id=started["workout_id"])
+
+    other = SessionLocal()
+    try:
+        assert workout.complete(other, id=started["workout_id"]) is True
+    finally:
+        other.close()
+
+    with pytest.raises(ValueError):
+        workout.update(
+            db,
+            db_obj=stale,
+            obj_in={"name": "Renamed", "completed_at": datetime(2026, 1, 1, 10)},
+        )
+
+    db.expire_all()
+    assert workout.get(db, id=started["workout_id"]).name != "Renamed"
+    assert _stats(db, user, exercise).session_count == 1
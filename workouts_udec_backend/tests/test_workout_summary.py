@@ -0,0 +1,73 @@
+"""Tests de la caché de resúmenes de workouts y sus marcas personales."""
+
+
+def _weight_records(client, auth_headers, workout_id):
+    response = client.get(f"/api/workouts/{workout_id}/summary", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    return [
+        record
+        for record in response.json()["personal_records"]
+        if record["record"] == "weight"
+    ]
+
+
+def _complete_two_workouts(client, auth_headers, start_workout):
+    """Un workout de 50 kg y otro posterior de 60 kg, ambos completados."""
+    earlier = start_workout(sets=1)
+    response = client.put(
+        f"/api/workouts/{earlier['workout_id']}/complete", headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+
+    later = start_workout(sets=1)
+    response = client.put(
+        f"/api/workouts/{later['workout_id']}/exercises/"
+        f"{later['workout_exercise_id']}/sets/{later['set_ids'][0]}",
+        headers=auth_headers,
+        json={"weight": 60.0},
+    )
+    assert response.status_code == 200, response.text
+    response = client.put(
+        f"/api/workouts/{later['workout_id']}/complete", headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+    return earlier, later
+
+
+def test_editing_earlier_workout_refreshes_later_summary(
+    client, auth_headers, start_workout
+):
+    earlier, later = _complete_two_workouts(client, auth_headers, start_workout)
+    records = _weight_records(client, auth_headers, later["workout_id"])
+    assert [(r["value"], r["previous"]) for r in records] == [(60.0, 50.0)]
+
+    response = client.put(
+        f"/api/workouts/{earlier['workout_id']}/exercises/"
+        f"{earlier['workout_exercise_id']}/sets/{earlier['set_ids'][0]}",
+        headers=auth_headers,
+        json={"weight": 80.0},
+    )
+    assert response.status_code == 200, response.text
+
+    assert _weight_records(client, auth_headers, later["workout_id"]) == []
+
+
+def test_reopening_earlier_workout_refreshes_later_summary(
+    client, auth_headers, start_workout
+):
+    earlier, later = _complete_two_workouts(client, auth_headers, start_workout)
+    assert _weight_records(client, auth_headers, later["workout_id"])
+
+    response = client.put(
+        f"/api/workouts/{earlier['workout_id']}",
+        headers=auth_headers,
+        json={"completed_at": None},
+    )
+    assert response.status_code == 200, response.text
+    assert _weight_records(client, auth_headers, later["workout_id"]) == []
+
+    response = client.put(
+        f"/api/workouts/{earlier['workout_id']}/complete", headers=auth_headers
+    )
+    assert response.status_code == 200, response.text
+    assert _weight_records(client, auth_headers, later["workout_id"])
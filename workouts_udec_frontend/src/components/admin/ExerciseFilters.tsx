@@ -10,8 +10,6 @@ interface ExerciseFiltersProps {
   onMuscleGroupChange: (value: string) => void;
   equipment: string;
   onEquipmentChange: (value: string) => void;
-  status: string;
-  onStatusChange: (value: string) => void;
   onClearFilters: () => void;
   muscleGroups: string[];
   equipmentOptions: string[];
@@ -26,13 +24,11 @@ const ExerciseFilters: React.FC<ExerciseFiltersProps> = ({
   onMuscleGroupChange,
   equipment,
   onEquipmentChange,
-  status,
-  onStatusChange,
   onClearFilters,
   muscleGroups,
   equipmentOptions,
 }) => {
-  const hasFilters = searchTerm || exerciseType || muscleGroup || equipment || status;
+  const hasFilters = searchTerm || exerciseType || muscleGroup || equipment;
 
   return (
     <div className="bg-white shadow rounded-lg p-4 mb-6">
@@ -96,19 +92,6 @@ const ExerciseFilters: React.FC<ExerciseFiltersProps> = ({
           </select>
         </div>
 
-        {/* Status Filter */}
-        <div className="min-w-32">
-          <select
-            className="block w-full border-gray-300 rounded-md shadow-sm focus:ring-indigo-500 focus:border-indigo-500 sm:text-sm"
-            value={status}
-            onChange={(e) => onStatusChange(e.target.value)}
-          >
-            <option value="">All Status</option>
-            <option value="active">Active</option>
-            <option value="inactive">Inactive</option>
-          </select>
-        </div>
-
         {/* Clear Filters */}
         {hasFilters && (
           <button
@@ -147,11 +130,6 @@ const ExerciseFilters: React.FC<ExerciseFiltersProps> = ({
               Equipment: {equipment}
             </span>
           )}
-          {status && (
-            <span className="inline-flex items-center px-2 py-1 rounded-full text-xs font-medium bg-gray-100 text-gray-800">
-              Status: {status === 'active' ? 'Active' : 'Inactive'}
-            </span>
-          )}
         </div>
       )}
     </div>
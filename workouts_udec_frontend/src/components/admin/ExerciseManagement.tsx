@@ -1,42 +1,92 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { useState, useEffect, useMemo, useCallback, useRef } from 'react';
 import { exerciseService } from '../../services/exerciseService';
 import ExerciseTable from './ExerciseTable';
 import ExerciseModal from './ExerciseModal';
 import ExerciseFilters from './ExerciseFilters';
-import type { Exercise, ExerciseCreate, ExerciseUpdate } from '../../types/exercise';
+import type {
+  Exercise,
+  ExerciseCreate,
+  ExerciseFacets,
+  ExerciseType,
+  ExerciseUpdate,
+} from '../../types/exercise';
+
+const SEARCH_DEBOUNCE_MS = 300;
+const SEARCH_PAGE_SIZE = 100;
+const EMPTY_FACETS: ExerciseFacets = { muscle_group: [], equipment: [], exercise_type: [] };
 
 const ExerciseManagement: React.FC = () => {
   const [exercises, setExercises] = useState<Exercise[]>([]);
+  const [total, setTotal] = useState(0);
+  const [facets, setFacets] = useState<ExerciseFacets>(EMPTY_FACETS);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   
   // Filter states
   const [searchTerm, setSearchTerm] = useState('');
   const [exerciseTypeFilter, setExerciseTypeFilter] = useState('');
   const [muscleGroupFilter, setMuscleGroupFilter] = useState('');
   const [equipmentFilter, setEquipmentFilter] = useState('');
-  const [statusFilter, setStatusFilter] = useState('');
   const [modalLoading, setModalLoading] = useState(false);
   const [showModal, setShowModal] = useState(false);
   const [editingExercise, setEditingExercise] = useState<Exercise | null>(null);
   const [error, setError] = useState('');
   const [success, setSuccess] = useState('');
 
-  useEffect(() => {
-    loadExercises();
-  }, []);
+  // Bumped on every new search so a late "load more" page is discarded
+  const searchVersion = useRef(0);
+
+  // Search (name, description, instructions), filtering, ordering and facet
+  // counts happen on the server
+  const fetchPage = useCallback(
+    (skip: number) =>
+      exerciseService.searchExercises({
+        q: searchTerm.trim(),
+        exercise_type: (exerciseTypeFilter || undefined) as ExerciseType | undefined,
+        muscle_group: muscleGroupFilter,
+        equipment: equipmentFilter,
+        skip,
+        limit: SEARCH_PAGE_SIZE,
+      }),
+    [searchTerm, exerciseTypeFilter, muscleGroupFilter, equipmentFilter]
+  );
 
-  const loadExercises = async () => {
+  const loadExercises = useCallback(async () => {
+    const version = ++searchVersion.current;
     try {
       setLoading(true);
-      const data = await exerciseService.getExercises(0, 1000); // Get all exercises
-      setExercises(data);
+      const result = await fetchPage(0);
+      if (version !== searchVersion.current) return;
+      setExercises(result.items);
+      setTotal(result.total);
+      setFacets(result.facets);
     } catch {
       setError('Failed to load exercises');
     } finally {
       setLoading(false);
     }
+  }, [fetchPage]);
+
+  const loadMoreExercises = async () => {
+    const version = searchVersion.current;
+    try {
+      setLoadingMore(true);
+      const result = await fetchPage(exercises.length);
+      if (version !== searchVersion.current) return;
+      setExercises(current => [...current, ...result.items]);
+      setTotal(result.total);
+    } catch {
+      setError('Failed to load exercises');
+    } finally {
+      setLoadingMore(false);
+    }
   };
 
+  useEffect(() => {
+    const timeout = setTimeout(loadExercises, SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timeout);
+  }, [loadExercises]);
+
   const handleCreateExercise = () => {
     setEditingExercise(null);
     setShowModal(true);
@@ -54,16 +104,15 @@ const ExerciseManagement: React.FC = () => {
     try {
       if (editingExercise) {
         // Update existing exercise
-        const updatedExercise = await exerciseService.updateExercise(editingExercise.id, exerciseData);
-        setExercises(exercises.map(e => e.id === editingExercise.id ? updatedExercise : e));
+        await exerciseService.updateExercise(editingExercise.id, exerciseData);
         setSuccess('Exercise updated successfully');
       } else {
         // Create new exercise
-        const newExercise = await exerciseService.createExercise(exerciseData as ExerciseCreate);
-        setExercises([...exercises, newExercise]);
+        await exerciseService.createExercise(exerciseData as ExerciseCreate);
         setSuccess('Exercise created successfully');
       }
       setShowModal(false);
+      loadExercises();
       setTimeout(() => setSuccess(''), 3000);
     } catch (error: unknown) {
       throw error; // Let ExerciseModal handle the error display
@@ -75,7 +124,7 @@ const ExerciseManagement: React.FC = () => {
   const handleDeleteExercise = async (exercise: Exercise) => {
     try {
       await exerciseService.deleteExercise(exercise.id);
-      setExercises(exercises.filter(e => e.id !== exercise.id));
+      loadExercises();
       setSuccess('Exercise deleted successfully');
       setTimeout(() => setSuccess(''), 3000);
     } catch {
@@ -94,76 +143,31 @@ const ExerciseManagement: React.FC = () => {
     setExerciseTypeFilter('');
     setMuscleGroupFilter('');
     setEquipmentFilter('');
-    setStatusFilter('');
   };
 
-  // Get unique values for filter dropdowns
-  const uniqueMuscleGroups = useMemo(() => {
-    const groups = exercises
-      .map(e => e.muscle_group)
-      .filter((value): value is string => Boolean(value))
-      .filter((value, index, self) => self.indexOf(value) === index)
-      .sort();
-    return groups;
-  }, [exercises]);
-
-  const uniqueEquipment = useMemo(() => {
-    const equipment = exercises
-      .map(e => e.equipment)
-      .filter((value): value is string => Boolean(value))
-      .filter((value, index, self) => self.indexOf(value) === index)
-      .sort();
-    return equipment;
-  }, [exercises]);
-
-  // Filter exercises based on current filters
-  const filteredExercises = useMemo(() => {
-    return exercises.filter(exercise => {
-      // Search term filter
-      if (searchTerm) {
-        const searchLower = searchTerm.toLowerCase();
-        const matchesSearch = 
-          exercise.name.toLowerCase().includes(searchLower) ||
-          exercise.description?.toLowerCase().includes(searchLower) ||
-          exercise.muscle_group?.toLowerCase().includes(searchLower) ||
-          exercise.equipment?.toLowerCase().includes(searchLower) ||
-          exercise.instructions?.toLowerCase().includes(searchLower);
-        if (!matchesSearch) return false;
-      }
-
-      // Exercise type filter
-      if (exerciseTypeFilter && exercise.exercise_type !== exerciseTypeFilter) {
-        return false;
-      }
-
-      // Muscle group filter
-      if (muscleGroupFilter && exercise.muscle_group !== muscleGroupFilter) {
-        return false;
-      }
-
-      // Equipment filter
-      if (equipmentFilter && exercise.equipment !== equipmentFilter) {
-        return false;
-      }
+  // Filter dropdowns list every value the other filters still allow
+  const uniqueMuscleGroups = useMemo(
+    () => facets.muscle_group.map(facet => facet.value).sort(),
+    [facets]
+  );
 
-      // Status filter
-      if (statusFilter) {
-        const isActive = statusFilter === 'active';
-        if (exercise.is_active !== isActive) {
-          return false;
-        }
-      }
+  const uniqueEquipment = useMemo(
+    () => facets.equipment.map(facet => facet.value).sort(),
+    [facets]
+  );
 
-      return true;
-    });
-  }, [exercises, searchTerm, exerciseTypeFilter, muscleGroupFilter, equipmentFilter, statusFilter]);
+  const typeCount = (type: string) =>
+    exerciseTypeFilter && exerciseTypeFilter !== type
+      ? 0
+      : facets.exercise_type.find(facet => facet.value === type)?.count ?? 0;
 
-  // Calculate statistics based on filtered results
+  // Statistics come from the server-side totals and facet counts; search only
+  // returns active exercises
   const stats = {
-    total: filteredExercises.length,
-    active: filteredExercises.filter(e => e.is_active).length,
-    weightBased: filteredExercises.filter(e => e.exercise_type === 'WEIGHT_BASED').length,
-    timeBased: filteredExercises.filter(e => e.exercise_type === 'TIME_BASED').length,
+    total,
+    active: total,
+    weightBased: typeCount('WEIGHT_BASED'),
+    timeBased: typeCount('TIME_BASED'),
   };
 
   return (
@@ -209,8 +213,6 @@ const ExerciseManagement: React.FC = () => {
         onMuscleGroupChange={setMuscleGroupFilter}
         equipment={equipmentFilter}
         onEquipmentChange={setEquipmentFilter}
-        status={statusFilter}
-        onStatusChange={setStatusFilter}
         onClearFilters={handleClearFilters}
         muscleGroups={uniqueMuscleGroups}
         equipmentOptions={uniqueEquipment}
@@ -243,11 +245,26 @@ const ExerciseManagement: React.FC = () => {
 
         <div className="lg:col-span-3">
           <ExerciseTable
-            exercises={filteredExercises}
+            exercises={exercises}
             onEditExercise={handleEditExercise}
             onDeleteExercise={handleDeleteExercise}
             loading={loading}
           />
+
+          {!loading && exercises.length < total && (
+            <div className="mt-4 flex items-center justify-between">
+              <p className="text-sm text-gray-500">
+                Showing {exercises.length} of {total} exercises
+              </p>
+              <button
+                onClick={loadMoreExercises}
+                disabled={loadingMore}
+                className="inline-flex items-center px-4 py-2 border border-gray-300 shadow-sm text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-indigo-500 disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       </div>
 
@@ -5,6 +5,79 @@ import type { Exercise } from '../../types/exercise';
 import { ExerciseType } from '../../types/exercise';
 import axios from 'axios';
 
+// Accent, case and punctuation folding, as the server's normalize_name does
+const normalize = (text: string): string =>
+  text
+    .normalize('NFKD')
+    .replace(/\p{M}/gu, '')
+    .toLowerCase()
+    .replace(/[^\p{L}\p{N}]+/gu, ' ')
+    .trim();
+
+const compareKeys = (a: string, b: string): number => (a < b ? -1 : a > b ? 1 : 0);
+
+interface ExerciseIndex {
+  // Normalized name from each of its words, sorted: "banca" finds "Press de Banca"
+  keys: string[];
+  entries: { word: number; position: number }[];
+  names: string[];
+  // Normalized muscle group, equipment and description, matched as substrings
+  details: string[];
+}
+
+// Built once per catalog load, like the server's autocomplete prefix index
+const buildIndex = (exercises: Exercise[]): ExerciseIndex => {
+  const entries: { key: string; word: number; position: number }[] = [];
+  exercises.forEach((exercise, position) => {
+    const words = normalize(exercise.name).split(' ');
+    words.forEach((_, word) => {
+      entries.push({ key: words.slice(word).join(' '), word, position });
+    });
+  });
+  entries.sort((a, b) => compareKeys(a.key, b.key) || a.word - b.word || a.position - b.position);
+  return {
+    keys: entries.map(entry => entry.key),
+    entries: entries.map(({ word, position }) => ({ word, position })),
+    names: exercises.map(exercise => normalize(exercise.name)),
+    details: exercises.map(exercise =>
+      normalize([exercise.muscle_group, exercise.equipment, exercise.description].filter(Boolean).join(' '))
+    ),
+  };
+};
+
+// Names starting with the term first, then names with a word starting with it,
+// then muscle group, equipment or description matches; alphabetical within each
+const searchIndex = (index: ExerciseIndex, exercises: Exercise[], term: string): Exercise[] => {
+  const prefix = normalize(term);
+  if (!prefix) return exercises;
+
+  const ranks = new Map<number, number>();
+  let low = 0;
+  let high = index.keys.length;
+  while (low < high) {
+    const middle = (low + high) >> 1;
+    if (index.keys[middle] < prefix) low = middle + 1;
+    else high = middle;
+  }
+  for (let i = low; i < index.keys.length && index.keys[i].startsWith(prefix); i++) {
+    const { word, position } = index.entries[i];
+    const rank = word === 0 ? 0 : 1;
+    ranks.set(position, Math.min(rank, ranks.get(position) ?? rank));
+  }
+  index.details.forEach((text, position) => {
+    if (!ranks.has(position) && text.includes(prefix)) ranks.set(position, 2);
+  });
+
+  return [...ranks.entries()]
+    .sort(
+      ([a, rankA], [b, rankB]) =>
+        rankA - rankB ||
+        compareKeys(index.names[a], index.names[b]) ||
+        exercises[a].id - exercises[b].id
+    )
+    .map(([position]) => exercises[position]);
+};
+
 interface ExerciseSelectorProps {
   isOpen: boolean;
   onClose: () => void;
@@ -29,7 +102,7 @@ const ExerciseSelector: React.FC<ExerciseSelectorProps> = ({ isOpen, onClose })
   const loadExercises = async () => {
     try {
       setLoading(true);
-      const exercisesData = await exerciseService.getExercises(0, 1000);
+      const exercisesData = await exerciseService.getCatalog();
       setExercises(exercisesData.filter(ex => ex.is_active));
     } catch {
       setError('Failed to load exercises');
@@ -38,6 +111,8 @@ const ExerciseSelector: React.FC<ExerciseSelectorProps> = ({ isOpen, onClose })
     }
   };
 
+  const catalogIndex = useMemo(() => buildIndex(exercises), [exercises]);
+
   const handleAddExercise = async (exercise: Exercise) => {
     if (!activeWorkout) {
       console.error('No active workout found');
@@ -88,20 +163,9 @@ const ExerciseSelector: React.FC<ExerciseSelectorProps> = ({ isOpen, onClose })
     return groups;
   }, [exercises]);
 
-  // Filter exercises based on search and filters
+  // Search the whole catalog, then apply the filters, so no cap hides matches
   const filteredExercises = useMemo(() => {
-    return exercises.filter(exercise => {
-      // Search term filter
-      if (searchTerm) {
-        const searchLower = searchTerm.toLowerCase();
-        const matchesSearch = 
-          exercise.name.toLowerCase().includes(searchLower) ||
-          exercise.description?.toLowerCase().includes(searchLower) ||
-          exercise.muscle_group?.toLowerCase().includes(searchLower) ||
-          exercise.equipment?.toLowerCase().includes(searchLower);
-        if (!matchesSearch) return false;
-      }
-
+    return searchIndex(catalogIndex, exercises, searchTerm).filter(exercise => {
       // Exercise type filter
       if (exerciseTypeFilter && exercise.exercise_type !== exerciseTypeFilter) {
         return false;
@@ -114,7 +178,7 @@ const ExerciseSelector: React.FC<ExerciseSelectorProps> = ({ isOpen, onClose })
 
       return true;
     });
-  }, [exercises, searchTerm, exerciseTypeFilter, muscleGroupFilter]);
+  }, [exercises, catalogIndex, searchTerm, exerciseTypeFilter, muscleGroupFilter]);
 
   const handleClose = () => {
     setSearchTerm('');
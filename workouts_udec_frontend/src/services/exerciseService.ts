@@ -1,5 +1,11 @@
 import { api } from './api';
-import type { Exercise, ExerciseCreate, ExerciseUpdate } from '../types/exercise';
+import type {
+  Exercise,
+  ExerciseCreate,
+  ExerciseSearchParams,
+  ExerciseSearchResult,
+  ExerciseUpdate,
+} from '../types/exercise';
 
 export const exerciseService = {
   async getExercises(skip: number = 0, limit: number = 100): Promise<Exercise[]> {
@@ -7,6 +13,21 @@ export const exerciseService = {
     return response.data;
   },
 
+  // Full active catalog; the browser revalidates it with If-None-Match (ETag)
+  async getCatalog(): Promise<Exercise[]> {
+    const response = await api.get('/exercises/catalog');
+    return response.data;
+  },
+
+  // Server-side name search with filters, relevance order and facet counts
+  async searchExercises(params: ExerciseSearchParams): Promise<ExerciseSearchResult> {
+    const query = Object.fromEntries(
+      Object.entries(params).filter(([, value]) => value !== undefined && value !== '')
+    );
+    const response = await api.get('/exercises/search', { params: query });
+    return response.data;
+  },
+
   async getExercise(exerciseId: number): Promise<Exercise> {
     const response = await api.get(`/exercises/${exerciseId}`);
     return response.data;
@@ -36,4 +36,30 @@ export interface ExerciseUpdate {
   equipment?: string;
   instructions?: string;
   is_active?: boolean;
+}
+
+export interface FacetCount {
+  value: string;
+  count: number;
+}
+
+export interface ExerciseFacets {
+  muscle_group: FacetCount[];
+  equipment: FacetCount[];
+  exercise_type: FacetCount[];
+}
+
+export interface ExerciseSearchParams {
+  q?: string;
+  muscle_group?: string;
+  equipment?: string;
+  exercise_type?: ExerciseType;
+  skip?: number;
+  limit?: number;
+}
+
+export interface ExerciseSearchResult {
+  items: Exercise[];
+  total: number;
+  facets: ExerciseFacets;
 }
\ No newline at end of file
@@ -143,25 +143,49 @@ export interface WorkoutTemplateExerciseCreate {
 }
 
 export interface WorkoutSummary {
-  workout: Workout;
+  workout_id: number;
+  name?: string;
+  started_at: string;
+  completed_at?: string;
+  duration_seconds: number;
+  total_duration_minutes: number;
   total_exercises: number;
   total_sets: number;
-  total_volume?: number;
-  total_duration_minutes?: number;
+  completed_sets: number;
+  total_volume: number;
+  volume_by_muscle_group: {
+    muscle_group?: string;
+    volume: number;
+    completed_sets: number;
+  }[];
+  personal_records: {
+    exercise_id: number;
+    exercise_name: string;
+    record: 'weight' | 'reps' | 'estimated_1rm';
+    value: number;
+    previous: number;
+  }[];
 }
 
 export interface ExerciseProgression {
+  exercise_id: number;
   exercise: Exercise;
   sessions: {
+    workout_id: number;
     date: string;
-    best_set: ExerciseSet;
+    best_set: Pick<ExerciseSet, 'id' | 'set_number' | 'reps' | 'weight' | 'duration'>;
+    set_count: number;
     total_volume?: number;
     total_reps?: number;
+    total_duration?: number;
+    max_reps?: number;
+    estimated_1rm?: number;
   }[];
   personal_records: {
     max_weight?: number;
     max_reps?: number;
     max_duration?: number;
     max_volume?: number;
+    max_estimated_1rm?: number;
   };
 }
\ No newline at end of file